@@ -0,0 +1,240 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import pygame
+from event_handler import handle_resize
+from fly import Fly
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from screen_manager import ScreenManager
+from special_fly import SpecialFly
+from ui_renderer import draw_game_objects
+
+DEFAULT_FLY_COUNTS = [10, 100, 1000, 10000]
+DEFAULT_SCREEN_SIZES = ["800x500", "1920x1080"]
+PERCENTILES = (50, 90, 99)
+
+def percentile(sorted_samples, pct):
+    """
+    Returns a percentile of pre-sorted samples using nearest-rank interpolation.
+
+    Args:
+        sorted_samples (list): The samples in ascending order.
+        pct (float): The percentile, from 0 to 100.
+
+    Returns:
+        float: The sample at the requested percentile.
+    """
+    index = min(len(sorted_samples) - 1, max(0, round(pct / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+def summarize(samples_ns, calls_per_frame):
+    """
+    Summarizes frame timings as per-frame and per-call latency statistics.
+
+    Args:
+        samples_ns (list): The duration of each measured frame in nanoseconds.
+        calls_per_frame (int): How many calls of the measured function each frame made.
+
+    Returns:
+        dict: `per_frame_ms` and `per_call_us` statistics (mean, p50, p90, p99, max).
+    """
+    samples = sorted(samples_ns)
+    per_frame = {"mean": sum(samples) / len(samples) / 1e6, "max": samples[-1] / 1e6}
+    per_call = {"mean": per_frame["mean"] * 1e3 / calls_per_frame, "max": samples[-1] / 1e3 / calls_per_frame}
+    for pct in PERCENTILES:
+        value = percentile(samples, pct)
+        per_frame[f"p{pct}"] = value / 1e6
+        per_call[f"p{pct}"] = value / 1e3 / calls_per_frame
+    return {"per_frame_ms": per_frame, "per_call_us": per_call}
+
+def measure(frame, frames, warmup):
+    """
+    Times a frame function.
+
+    Args:
+        frame (callable): Runs one frame of the benchmark.
+        frames (int): Number of measured frames.
+        warmup (int): Number of unmeasured frames run first.
+
+    Returns:
+        list: The duration of each measured frame in nanoseconds.
+    """
+    for _ in range(warmup):
+        frame()
+
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(frames):
+        start = clock()
+        frame()
+        samples.append(clock() - start)
+    return samples
+
+def new_game_state(screen_manager, fly_count, use_swarm=False):
+    """
+    Builds a seeded game state with the requested number of flies.
+
+    Args:
+        screen_manager (ScreenManager): The headless screen manager.
+        fly_count (int): Number of flies to spawn.
+        use_swarm (bool, optional): Whether to use the FlySwarm backend. Defaults to False.
+
+    Returns:
+        GameState: The prepared game state.
+    """
+    game_state = GameState(use_swarm=use_swarm)
+    game_state.reset(screen_manager.width, screen_manager.height, seed=fly_count)
+    for _ in range(fly_count - len(game_state.flies) - (len(game_state.swarm) if use_swarm else 0)):
+        game_state.spawn_fly(screen_manager.width, screen_manager.height)
+    return game_state
+
+def bench_fly_move(screen_manager, fly_count):
+    """
+    Prepares a frame that moves every fly once.
+    """
+    width, height = screen_manager.width, screen_manager.height
+    flies = [Fly(width, height, width / 25, width / 25) for _ in range(fly_count)]
+
+    def frame():
+        for fly in flies:
+            fly.move(width, height)
+    return frame, fly_count
+
+def bench_special_fly_move(screen_manager, fly_count):
+    """
+    Prepares a frame that moves every special fly once, recentering flies that left the screen.
+    """
+    width, height = screen_manager.width, screen_manager.height
+    flies = [SpecialFly(width, height, width / 25, width / 25) for _ in range(fly_count)]
+
+    def frame():
+        for fly in flies:
+            if not fly.move(width, height):
+                fly.x, fly.y = width / 2, height / 2
+    return frame, fly_count
+
+def bench_update(screen_manager, fly_count, use_swarm=False):
+    """
+    Prepares a frame that runs one simulation step of update_frog_and_flies.
+    """
+    game_state = new_game_state(screen_manager, fly_count, use_swarm)
+
+    def frame():
+        update_frog_and_flies(game_state, screen_manager.width, screen_manager.height)
+    return frame, 1
+
+def bench_resize(screen_manager, fly_count):
+    """
+    Prepares a frame that resizes the window back and forth.
+    """
+    game_state = new_game_state(screen_manager, fly_count)
+    sizes = [(screen_manager.width, screen_manager.height),
+             (screen_manager.width * 3 // 4, screen_manager.height * 3 // 4)]
+    state = {"index": 0}
+
+    def frame():
+        state["index"] ^= 1
+        width, height = sizes[state["index"]]
+        handle_resize(pygame.event.Event(pygame.VIDEORESIZE, w=width, h=height), game_state, screen_manager)
+    return frame, 1
+
+def bench_draw(screen_manager, fly_count):
+    """
+    Prepares a frame that renders the game with draw_game_objects.
+    """
+    game_state = new_game_state(screen_manager, fly_count)
+    start_time = pygame.time.get_ticks()
+
+    def frame():
+        draw_game_objects(game_state, screen_manager, start_time)
+    return frame, 1
+
+BENCHMARKS = {
+    "Fly.move": bench_fly_move,
+    "SpecialFly.move": bench_special_fly_move,
+    "update_frog_and_flies": bench_update,
+    "update_frog_and_flies[swarm]": lambda sm, n: bench_update(sm, n, use_swarm=True),
+    "handle_resize": bench_resize,
+    "draw_game_objects": bench_draw,
+}
+
+def swarm_available():
+    """
+    Checks whether NumPy is installed for the FlySwarm benchmark.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def run(fly_counts, screen_sizes, frames, warmup, selected):
+    """
+    Runs every selected benchmark for every fly count and screen size.
+
+    Returns:
+        list: One result dictionary per benchmark, fly count and screen size.
+    """
+    results = []
+    screen_manager = ScreenManager(headless=True)
+
+    for size in screen_sizes:
+        width, height = (int(value) for value in size.lower().split("x"))
+        for name, prepare in BENCHMARKS.items():
+            if selected and name not in selected:
+                continue
+            if name.endswith("[swarm]") and not swarm_available():
+                continue
+
+            for fly_count in fly_counts:
+                screen_manager.resize(width, height)
+                frame, calls_per_frame = prepare(screen_manager, fly_count)
+                samples = measure(frame, frames, warmup)
+                result = {"benchmark": name, "flies": fly_count, "screen": [width, height],
+                          "frames": frames, "calls_per_frame": calls_per_frame}
+                result.update(summarize(samples, calls_per_frame))
+                results.append(result)
+                print(f"{name:30} {fly_count:>6} flies {width}x{height:<5} "
+                      f"p50 {result['per_frame_ms']['p50']:8.3f} ms  "
+                      f"p99 {result['per_frame_ms']['p99']:8.3f} ms  "
+                      f"per call {result['per_call_us']['p50']:9.3f} us")
+    return results
+
+def main():
+    """
+    Runs the benchmarks selected on the command line and optionally writes the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Fly Catcher's simulation and rendering hot paths.")
+    parser.add_argument("--fly-counts", type=int, nargs="+", default=DEFAULT_FLY_COUNTS)
+    parser.add_argument("--screen-sizes", nargs="+", default=DEFAULT_SCREEN_SIZES, help="e.g. 800x500")
+    parser.add_argument("--frames", type=int, default=100, help="measured frames per benchmark")
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured frames per benchmark")
+    parser.add_argument("--benchmark", action="append", choices=sorted(BENCHMARKS), help="run only these")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.fly_counts, args.screen_sizes, args.frames, args.warmup, args.benchmark)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+                "results": results
+            }, file, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+import pygame
+from constants import GAME_DURATION, INITIAL_SCREEN_HEIGHT, INITIAL_SCREEN_WIDTH, SIMULATION_RATE
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from vector_env import ACTIONS, VectorEnv
+
+def press(frog, action):
+    """
+    Sets a frog's arrow keys to one of the VectorEnv actions.
+
+    Args:
+        frog (Frog): The frog to steer.
+        action (int): An index into ACTIONS.
+    """
+    dx, dy = ACTIONS[action]
+    frog.movement.update(left=dx < 0, right=dx > 0, up=dy < 0, down=dy > 0)
+
+def run(num_envs, game_states, steps, chunk, seed):
+    """
+    Plays the same random actions in a VectorEnv and in separate GameStates, alternating
+    between them every `chunk` steps so both see the same machine load.
+
+    Returns:
+        dict: Total seconds spent stepping the VectorEnv with and without observations and the GameStates.
+    """
+    width, height = INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT
+    rng = np.random.default_rng(seed)
+    observed = VectorEnv(num_envs, width, height, seed=seed)
+    unobserved = VectorEnv(num_envs, width, height, seed=seed)
+    observed.reset()
+    unobserved.reset()
+    states = []
+    for index in range(game_states):
+        game_state = GameState()
+        game_state.reset(width, height, seed=seed + index)
+        states.append(game_state)
+
+    totals = {"observed": 0.0, "unobserved": 0.0, "game_states": 0.0}
+    clock = time.perf_counter
+    for first in range(0, steps, chunk):
+        actions = rng.integers(0, len(ACTIONS), (min(chunk, steps - first), num_envs))
+
+        start = clock()
+        for step_actions in actions:
+            observed.step(step_actions)
+        totals["observed"] += clock() - start
+
+        start = clock()
+        for step_actions in actions:
+            unobserved.step(step_actions, observe=False)
+        totals["unobserved"] += clock() - start
+
+        start = clock()
+        for step_actions in actions:
+            for game_state, action in zip(states, step_actions.tolist()):
+                press(game_state.frog, action)
+                update_frog_and_flies(game_state, width, height)
+        totals["game_states"] += clock() - start
+    return totals
+
+def main():
+    """
+    Compares stepping many games with VectorEnv to stepping a few GameStates, over whole games.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark VectorEnv against separate GameStates.")
+    parser.add_argument("--envs", type=int, default=1000, help="games in the VectorEnv")
+    parser.add_argument("--game-states", type=int, default=10, help="separate GameStates")
+    parser.add_argument("--steps", type=int, default=GAME_DURATION * SIMULATION_RATE, help="defaults to one game")
+    parser.add_argument("--chunk", type=int, default=100, help="steps run before switching to the other side")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    totals = run(args.envs, args.game_states, args.steps, args.chunk, args.seed)
+    for name, label in (("observed", f"VectorEnv, {args.envs} games"),
+                        ("unobserved", f"VectorEnv, {args.envs} games, observe=False"),
+                        ("game_states", f"{args.game_states} GameStates")):
+        print(f"{label:40} {totals[name] / args.steps * 1e3:8.3f} ms per step")
+
+if __name__ == "__main__":
+    main()
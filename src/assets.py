@@ -0,0 +1,92 @@
+import os
+import pygame
+from sprite_cache import get_scaled_sprite
+
+# Resolved relative to this file so the game can be started from any working directory
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets")
+
+ASSET_FILES = {
+    "frog": "frog.png",
+    "fly_left": "fly_left_facing.png",
+    "fly_right": "fly_right_facing.png",
+    "special_fly_left": "special_fly_left_facing.png",
+    "special_fly_right": "special_fly_right_facing.png"
+}
+
+def display_ready():
+    """
+    Checks whether a display surface exists, which surface conversion requires.
+
+    Returns:
+        bool: True if surfaces can be converted to the display format.
+    """
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+class AssetManager:
+    def __init__(self, asset_dir=ASSET_DIR):
+        """
+        Initializes an asset manager that loads images on first use.
+
+        Args:
+            asset_dir (str, optional): The directory containing the image files. Defaults to ASSET_DIR.
+        """
+        self.asset_dir = asset_dir
+        self.images = {}
+
+    def path(self, name):
+        """
+        Resolves the file path of an asset.
+
+        Args:
+            name (str): The asset name, a key of ASSET_FILES.
+
+        Returns:
+            str: The absolute path of the image file.
+        """
+        return os.path.join(self.asset_dir, ASSET_FILES[name])
+
+    def get(self, name):
+        """
+        Returns an image, loading it the first time it is requested.
+
+        Images loaded after the display was created are converted to the display's
+        pixel format, so blitting them does not need a per-pixel conversion.
+
+        Args:
+            name (str): The asset name, a key of ASSET_FILES.
+
+        Returns:
+            pygame.Surface: The loaded image. The same surface is returned on every call.
+        """
+        image = self.images.get(name)
+
+        if image is None:
+            image = pygame.image.load(self.path(name))
+            if display_ready():
+                image = image.convert_alpha()
+            self.images[name] = image
+
+        return image
+
+    def preload(self):
+        """
+        Loads every image up front, e.g. right after the display was created.
+        """
+        for name in ASSET_FILES:
+            self.get(name)
+
+# Process-wide asset manager
+ASSETS = AssetManager()
+
+def prepare_fly_sprites(width, height):
+    """
+    Scales both facings of both fly types for the given size ahead of time, so the
+    first direction change of every fly is a sprite cache hit.
+
+    Args:
+        width (float): The width of the flies.
+        height (float): The height of the flies.
+    """
+    for kind in ("fly", "special_fly"):
+        get_scaled_sprite(ASSETS.get(f"{kind}_left"), "left", width, height)
+        get_scaled_sprite(ASSETS.get(f"{kind}_right"), "right", width, height)
@@ -1,31 +1,87 @@
 import pygame
 
-# Define custom events for fly generation
-FLY_SPAWN = pygame.USEREVENT + 1
-SPECIAL_FLY_SPAWN = pygame.USEREVENT + 2
-
-# Timer constants
+# Timer constants, in milliseconds of game time
 FLY_SPAWN_INTERVAL = 2000
 SPECIAL_FLY_SPAWN_INTERVAL = 8000
 
-# Load frog and fly images
-FROG = pygame.image.load('../assets/frog.png')
-FLY_LEFT = pygame.image.load('../assets/fly_left_facing.png')
-FLY_RIGHT = pygame.image.load('../assets/fly_right_facing.png')
-SPECIAL_FLY_LEFT = pygame.image.load('../assets/special_fly_left_facing.png')
-SPECIAL_FLY_RIGHT = pygame.image.load('../assets/special_fly_right_facing.png')
+# Frog and fly images, loaded on first access through the asset manager
+IMAGE_ASSETS = {
+    "FROG": "frog",
+    "FLY_LEFT": "fly_left",
+    "FLY_RIGHT": "fly_right",
+    "SPECIAL_FLY_LEFT": "special_fly_left",
+    "SPECIAL_FLY_RIGHT": "special_fly_right"
+}
+
+def __getattr__(name):
+    if name in IMAGE_ASSETS:
+        from assets import ASSETS  # Imported lazily, assets depends on this module
+        return ASSETS.get(IMAGE_ASSETS[name])
+    raise AttributeError(f"module 'constants' has no attribute '{name}'")
 
 # Game configuration constants
 GAME_DURATION = 120  # Game duration in seconds
 INITIAL_FLY_COUNT = 5
-FROG_SPEED = 5.0
-FLY_SPEED = 2.0
+FROG_SPEED = 5.0  # Pixels per base tick
+FLY_SPEED = 2.0  # Pixels per base tick
+BASE_TICK_RATE = 60  # Ticks per second that FROG_SPEED and FLY_SPEED are defined for
+SIMULATION_RATE = 60  # Fixed simulation steps per second
+FRAME_RATE = 60  # Maximum rendered frames per second
+MAX_STEPS_PER_FRAME = 5  # Simulation steps allowed per frame before the game slows down
 INITIAL_SCREEN_WIDTH = 800
 INITIAL_SCREEN_HEIGHT = 500
+SPRITE_CACHE_SIZE = 256  # Maximum number of scaled sprites kept in memory
+SPATIAL_HASH_CELL_SIZE = 64  # Size of the collision grid cells in pixels
+# Obstacles blocking the frog and flies, as (x, y, width, height) fractions of the screen size
+OBSTACLE_LAYOUT = ((0.14, 0.18, 0.12, 0.1), (0.72, 0.16, 0.08, 0.2), (0.18, 0.68, 0.1, 0.14), (0.76, 0.72, 0.14, 0.08))
+TEXT_CACHE_SIZE = 128  # Maximum number of rendered text surfaces kept in memory
+FLY_POOL_SIZE = 512  # Maximum number of released flies kept for reuse, per fly type
+POPUP_CAPACITY = 64  # Maximum number of score popups shown at once
+POPUP_DURATION = 1000  # How long a score popup is shown in milliseconds
+POPUP_FADE_STEPS = 4  # Opacity levels a score popup fades out through, 1 disables fading
+SNAPSHOT_HISTORY = 120  # Game state snapshots kept for rollback and crash dumps, about two seconds
+DIRTY_RECT_RENDERING = False  # Repaint only changed screen areas instead of the full screen
+SESSION_RECORDING_DIR = None  # Directory to save session recordings to, or None to disable recording
+SPECTATOR_LOG_DIR = None  # Directory to save spectator logs to, or None to disable them
+SPECTATOR_KEYFRAME_INTERVAL = 60  # Simulation steps between spectator log index entries (one second)
+SPECTATOR_LOG_BUFFER = 1 << 20  # Bytes of spectator log buffered in memory between writes
+HIGH_SCORE_DB = "high_scores.db"  # SQLite file the high scores are stored in, or None to disable them
+LEADERBOARD_SIZE = 5  # Top scores shown on the game over screen
+
+# Frame profiler constants
+PROFILER_CAPACITY = 600  # Frames kept in the profiler's ring buffer (10 seconds at 60 fps)
+PROFILER_OVERLAY_KEY = pygame.K_F3  # Shows or hides the profiler overlay
+PROFILER_DUMP_KEY = pygame.K_F4  # Writes the profiler's buffer to a CSV file
+
+# Quality governor constants
+ADAPTIVE_QUALITY = True  # Lower rendering quality while frames miss the FRAME_RATE budget
+QUALITY_SMOOTHING = 0.1  # Weight of the newest frame in the smoothed frame time
+QUALITY_DOWNGRADE_RATIO = 1.15  # Smoothed frame time, relative to the budget, that counts as missing it
+QUALITY_UPGRADE_RATIO = 0.6  # Smoothed work time, relative to the budget, that leaves room for the next tier up
+QUALITY_DOWNGRADE_FRAMES = 30  # Consecutive slow frames before quality is lowered (half a second)
+QUALITY_UPGRADE_FRAMES = 180  # Consecutive fast frames before quality is raised again (three seconds)
+QUALITY_HUD_INTERVAL = 4  # Frames the score and time stay on screen between redraws, with dirty-rect rendering
+QUALITY_FLY_SHARE = 0.5  # Share of the regular flies drawn at the lowest tiers, special flies are always drawn
+QUALITY_MIN_FRAME_RATE = 30  # Frame rate target of the lowest tier
+
+# Scene constants
+GAMEPLAY_SCENE = "gameplay"
+PAUSED_SCENE = "paused"
+GAME_OVER_SCENE = "game_over"
+PAUSE_KEYS = (pygame.K_p, pygame.K_ESCAPE)  # Pause and resume the game
+KEY_PAUSE = "key"  # Paused with a pause key, only a pause key resumes
+FOCUS_PAUSE = "focus"  # Paused because the window lost focus or was minimized, regaining focus also resumes
+IDLE_POLL_INTERVAL = 100  # Milliseconds idle screens wait for input before checking for background updates
+
+# Multiplayer constants
+MULTIPLAYER_PORT = 50607  # TCP port the multiplayer server listens on
+MAX_PLAYERS = 4  # Frogs in one multiplayer game
+DELTA_TOLERANCE = 0.01  # Pixels a fly may drift from its predicted path before an update is sent
 
 # Color constants
 BACKGROUND_COLOR = (243, 207, 198)  # Background color of the screen
 BLACK_COLOR = (0, 0, 0)  # Color for score and time text
 GOLD_COLOR = (204, 183, 50) # Color for special popups
 GRAY_COLOR = (169, 169, 169)  # Color for regular popups
+OBSTACLE_COLOR = (112, 128, 90)  # Fill color of obstacles
 
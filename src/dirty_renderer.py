@@ -0,0 +1,64 @@
+from ui_renderer import draw_game_elements, game_hud_draw_list
+
+class DirtyRectRenderer:
+    def __init__(self):
+        """
+        Initializes a renderer that only repaints and pushes the screen areas that changed.
+        """
+        self.previous_rects = []
+        self.hud_rects = []  # Areas of the score and time, left on the screen on frames that skip redrawing them
+        self.screen = None
+        self.screen_size = None
+
+    def invalidate(self):
+        """
+        Forces the next frame to repaint and push the whole screen.
+        """
+        self.screen = None
+        self.screen_size = None
+
+    def draw(self, game_state, screen_manager, start_time, alpha=1.0, quality=None):
+        """
+        Erases last frame's sprites and text, draws the current frame and
+        reports which areas of the screen need to be pushed to the display.
+
+        The whole screen is repainted on the first frame and whenever the screen surface
+        or its size changed (e.g. after a resize). The HUD is only erased and redrawn when the
+        quality governor asks for it or a sprite erased part of it.
+
+        Args:
+            game_state (GameState): The current state of the game, including frog, flies, score, etc.
+            screen_manager (ScreenManager): Manages the game screen.
+            start_time (int): The timestamp when the game started, used for countdown calculations.
+            alpha (float, optional): Interpolation between the previous and current simulation step. Defaults to 1.0.
+            quality (QualityGovernor, optional): Decides what to leave out on slow machines. Defaults to None, full quality.
+
+        Returns:
+            list: The pygame.Rect areas to pass to `pygame.display.update`.
+        """
+        screen = screen_manager.screen
+
+        if screen is not self.screen or screen.get_size() != self.screen_size:
+            self.screen = screen
+            self.screen_size = screen.get_size()
+            screen_manager.clear()
+            self.previous_rects = draw_game_elements(game_state, screen_manager, start_time, alpha, quality=quality,
+                                                     hud=False)
+            self.hud_rects = screen.blits(game_hud_draw_list(game_state, screen_manager.height, start_time))
+            return [screen.get_rect()]
+
+        hud_due = quality is None or quality.hud_due() or \
+            any(rect.collidelist(self.previous_rects) != -1 for rect in self.hud_rects)
+
+        # Paint the background over everything drawn last frame
+        erased_rects = self.previous_rects + self.hud_rects if hud_due else self.previous_rects
+        for rect in erased_rects:
+            screen.fill(screen_manager.background_color, rect)
+
+        current_rects = draw_game_elements(game_state, screen_manager, start_time, alpha, quality=quality, hud=False)
+        dirty_rects = erased_rects + current_rects
+        self.previous_rects = current_rects
+        if hud_due:
+            self.hud_rects = screen.blits(game_hud_draw_list(game_state, screen_manager.height, start_time))
+            dirty_rects += self.hud_rects
+        return dirty_rects
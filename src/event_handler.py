@@ -1,7 +1,6 @@
 import pygame
-from constants import FLY_SPAWN, SPECIAL_FLY_SPAWN, SPECIAL_FLY_LEFT, SPECIAL_FLY_RIGHT
-from fly import Fly
-from special_fly import SpecialFly
+from assets import prepare_fly_sprites
+from constants import FOCUS_PAUSE, KEY_PAUSE, PAUSE_KEYS
 
 def handle_resize(event, game_state, screen_manager):
     """
@@ -13,6 +12,8 @@ def handle_resize(event, game_state, screen_manager):
         screen_manager (ScreenManager): Manages screen size and scaling factors.
     """
     screen_manager.resize(event.w, event.h)
+    game_state.screen_width, game_state.screen_height = screen_manager.width, screen_manager.height
+    game_state.obstacles.build(screen_manager.width, screen_manager.height)
     width_scale, height_scale = screen_manager.get_scaling_factors()
 
     # Update the frog's position and size relative to the new screen size
@@ -22,11 +23,17 @@ def handle_resize(event, game_state, screen_manager):
     # Scale the fly size dynamically based on the new screen size
     game_state.fly_width *= width_scale
     game_state.fly_height *= height_scale
+    prepare_fly_sprites(game_state.fly_width, game_state.fly_height)
 
     # Update each fly's position and size relative to the new screen size
     for fly in game_state.flies:
         fly.resize(game_state.fly_width, game_state.fly_height)
         fly.reposition(width_scale, height_scale)
+    game_state.rebuild_spatial_hash()
+
+    if game_state.swarm is not None:
+        game_state.swarm.resize(game_state.fly_width, game_state.fly_height)
+        game_state.swarm.reposition(width_scale, height_scale)
 
 def handle_key_event(event, frog, is_pressed):
     """
@@ -49,33 +56,45 @@ def handle_key_event(event, frog, is_pressed):
     if event.key == pygame.K_UP:
         frog.movement['up'] = is_pressed
 
-def handle_events(game_state, screen_manager):
+def handle_events(game_state, screen_manager, recorder=None, profiler=None):
     """
-    Processes all game events, including quitting, resizing, spawning flies, and handling key presses.
+    Processes all window and input events: quitting, resizing, focus changes and key presses.
+    Timed game events such as fly spawns are run by the game state's scheduler instead.
 
     Args:
         game_state (GameState): The current game state containing game entities and variables.
         screen_manager (ScreenManager): Manages screen size and scaling factors.
+        recorder (SessionRecorder, optional): Records every event that affects the simulation. Defaults to None.
+        profiler (FrameProfiler, optional): Receives key presses for its overlay and dump hotkeys. Defaults to None.
+
+    Returns:
+        str: Why the game should pause, KEY_PAUSE if a pause key was pressed or FOCUS_PAUSE if the
+             window lost focus or was minimized, or None to keep playing. A pause key wins over focus loss.
     """
+    pause = None
+
     for event in pygame.event.get():
+        if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED) and pause is None:
+            pause = FOCUS_PAUSE
+
+        if event.type == pygame.KEYDOWN and event.key in PAUSE_KEYS:
+            pause = KEY_PAUSE
+
         if event.type == pygame.QUIT:
             pygame.quit()
             exit()
 
-        # Spawn a fly when the timer event occurs
-        if event.type == FLY_SPAWN:
-            game_state.flies.append(Fly(screen_manager.width, screen_manager.height,
-                             game_state.fly_width, game_state.fly_height))
-
-        # Spawn a special fly when the timer event occurs
-        if event.type == SPECIAL_FLY_SPAWN:
-            game_state.flies.append(SpecialFly(screen_manager.width, screen_manager.height,
-                                    game_state.fly_width, game_state.fly_height))
-            
         if event.type == pygame.VIDEORESIZE:
             handle_resize(event, game_state, screen_manager)
+            if recorder is not None:
+                recorder.record_resize(game_state.tick, event.w, event.h)
+
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            is_pressed = event.type == pygame.KEYDOWN
+            handle_key_event(event, game_state.frog, is_pressed)
+            if recorder is not None:
+                recorder.record_key(game_state.tick, event.key, is_pressed)
+            if profiler is not None and is_pressed:
+                profiler.handle_key(event.key)
 
-        if event.type == pygame.KEYDOWN:
-            handle_key_event(event, game_state.frog, True)
-        elif event.type == pygame.KEYUP:
-            handle_key_event(event, game_state.frog, False)
+    return pause
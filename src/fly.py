@@ -1,9 +1,10 @@
 import random
-import pygame
-from constants import FLY_LEFT, FLY_RIGHT, FLY_SPEED
+from assets import ASSETS
+from constants import FLY_SPEED
+from sprite_cache import get_scaled_sprite
 
 class Fly:
-    def __init__(self, screen_width, screen_height, width, height, img_left=FLY_LEFT, img_right=FLY_RIGHT):
+    def __init__(self, screen_width, screen_height, width, height, img_left=None, img_right=None, rng=None):
         """
         Initialize the fly with default size, movement, and position.
 
@@ -12,20 +13,43 @@ class Fly:
             screen_height (int): Height of the screen the fly can move within.
             width (float): Width of the fly. 
             height (float): Height of the fly.
-            img_left (pygame.Surface, optional): Image of the fly facing left. Defaults to FLY_LEFT.
-            img_right (pygame.Surface, optional): Image of the fly facing right. Defaults to FLY_RIGHT.
+            img_left (pygame.Surface, optional): Image of the fly facing left. Defaults to the "fly_left" asset.
+            img_right (pygame.Surface, optional): Image of the fly facing right. Defaults to the "fly_right" asset.
+            rng (random.Random, optional): Random number generator for position and movement.
+                                           Defaults to None, which uses the global `random` module.
         """
+        self.rng = rng if rng is not None else random
+        self.speed = FLY_SPEED
+
+        self.img_left = img_left if img_left is not None else ASSETS.get("fly_left")
+        self.img_right = img_right if img_right is not None else ASSETS.get("fly_right")
+
+        self.reinitialize(screen_width, screen_height, width, height)
+
+    def reinitialize(self, screen_width, screen_height, width, height, rng=None):
+        """
+        Gives the fly a new size, position and movement, as if it had just been created.
+        Used by FlyPool to recycle flies instead of allocating new ones.
+
+        Args:
+            screen_width (int): Width of the screen the fly can move within.
+            screen_height (int): Height of the screen the fly can move within.
+            width (float): Width of the fly.
+            height (float): Height of the fly.
+            rng (random.Random, optional): Random number generator for position and movement.
+                                           Defaults to None, which keeps the current one.
+        """
+        if rng is not None:
+            self.rng = rng
         self.width = width
         self.height = height
-        self.speed = FLY_SPEED
 
-        self.img_left = img_left
-        self.img_right = img_right
         self.facing_left = True
-        self.img = pygame.transform.scale(self.img_left, (int(self.width), int(self.height)))
+        self.img = get_scaled_sprite(self.img_left, "left", self.width, self.height)
 
-        self.x = random.randint(0, int(screen_width) - int(width))
-        self.y = random.randint(0, int(screen_height) - int(height))
+        self.x = self.rng.randint(0, int(screen_width) - int(width))
+        self.y = self.rng.randint(0, int(screen_height) - int(height))
+        self.previous_x, self.previous_y = self.x, self.y  # Position before the last move, for interpolation
 
         self.movement = self.generate_valid_movement()
         self.update_image()
@@ -38,10 +62,10 @@ class Fly:
             dict: A dictionary containing movement directions (`left`, `right`, `up`, `down`) set to True or False.
         """
         movement = {
-            "left": random.choice([True, False]),
-            "right": random.choice([True, False]),
-            "up": random.choice([True, False]),
-            "down": random.choice([True, False])
+            "left": self.rng.choice([True, False]),
+            "right": self.rng.choice([True, False]),
+            "up": self.rng.choice([True, False]),
+            "down": self.rng.choice([True, False])
         }
         self.resolve_movement_conflicts(movement)
         self.ensure_at_least_one_direction(movement, ["left", "right", "up", "down"])
@@ -58,7 +82,7 @@ class Fly:
 
         for dir1, dir2 in opposite_pairs:
             if movement[dir1] and movement[dir2]:
-                movement[random.choice([dir1, dir2])] = False
+                movement[self.rng.choice([dir1, dir2])] = False
 
     def ensure_at_least_one_direction(self, movement, directions):
         """
@@ -71,7 +95,7 @@ class Fly:
                                to check and activate if necessary.
         """
         if not any(movement[dir] for dir in directions):
-            movement[random.choice(directions)] = True
+            movement[self.rng.choice(directions)] = True
 
     def update_image(self):
         """
@@ -81,7 +105,7 @@ class Fly:
             return  # Already facing right, no need to update
 
         if self.movement["right"]:
-            self.img = pygame.transform.scale(self.img_right, (int(self.width), int(self.height)))
+            self.img = get_scaled_sprite(self.img_right, "right", self.width, self.height)
             self.facing_left = False
             return  # Prevents further updates in the same call
 
@@ -89,7 +113,7 @@ class Fly:
             return  # Already facing left, no need to update
 
         if self.movement["left"]:
-            self.img = pygame.transform.scale(self.img_left, (int(self.width), int(self.height)))
+            self.img = get_scaled_sprite(self.img_left, "left", self.width, self.height)
             self.facing_left = True
 
     def check_edges(self, screen_width, screen_height):
@@ -120,28 +144,66 @@ class Fly:
         """
         self.movement[edge] = False
         for direction in possible_directions:
-            self.movement[direction] = random.choice([True, False])
+            self.movement[direction] = self.rng.choice([True, False])
         self.resolve_movement_conflicts(self.movement)
         self.ensure_at_least_one_direction(self.movement, ["left", "right", "up", "down"])
 
-    def move(self, screen_width, screen_height):
+    def check_obstacles(self, obstacles):
+        """
+        Undoes the part of the last move that entered an obstacle and bounces the fly off it
+        like off a screen edge. A fly that was already inside an obstacle, e.g. because it
+        spawned there, is left to fly out.
+
+        Args:
+            obstacles (ObstacleGrid): The obstacles on the screen.
+        """
+        if obstacles.blocking(self.x, self.y, self.width, self.height) is None or \
+                obstacles.blocking(self.previous_x, self.previous_y, self.width, self.height) is not None:
+            return
+
+        # Only one axis may have led into the obstacle; if both did, the fly hit a corner
+        blocked_x = obstacles.blocking(self.x, self.previous_y, self.width, self.height) is not None
+        blocked_y = obstacles.blocking(self.previous_x, self.y, self.width, self.height) is not None
+        if not blocked_x and not blocked_y:
+            blocked_x = blocked_y = True
+
+        if blocked_x:
+            edge = "left" if self.x < self.previous_x else "right"
+            self.x = self.previous_x
+            self.handle_edge_collision(edge, [direction for direction in ("left", "right", "up", "down")
+                                              if direction != edge])
+        if blocked_y:
+            edge = "up" if self.y < self.previous_y else "down"
+            self.y = self.previous_y
+            self.handle_edge_collision(edge, [direction for direction in ("left", "right", "up", "down")
+                                              if direction != edge])
+        self.update_image()
+
+    def move(self, screen_width, screen_height, dt=1.0, obstacles=None):
         """
         Moves the fly based on its current movement direction and prevents out-of-bounds movement.
 
         Args:
             screen_width (int): The width of the screen to ensure the fly doesn't move off the right or left edges.
             screen_height (int): The height of the screen to ensure the fly doesn't move off the top or bottom edges.
+            dt (float, optional): The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
+            obstacles (ObstacleGrid, optional): Obstacles the fly bounces off. Defaults to None.
         """
+        self.previous_x, self.previous_y = self.x, self.y
+        step = self.speed * dt
+
         if self.movement["left"]:
-            self.x = max(0, self.x - self.speed)   
+            self.x = max(0, self.x - step)   
         elif self.movement["right"]:
-            self.x = min(screen_width - self.width, self.x + self.speed)
+            self.x = min(screen_width - self.width, self.x + step)
             
         if self.movement["up"]:
-            self.y = max(0, self.y - self.speed)  
+            self.y = max(0, self.y - step)  
         elif self.movement["down"]:
-            self.y = min(screen_height - self.height, self.y + self.speed)
+            self.y = min(screen_height - self.height, self.y + step)
 
+        if obstacles is not None:
+            self.check_obstacles(obstacles)
         self.check_edges(screen_width, screen_height)
         self.update_image()
 
@@ -155,7 +217,12 @@ class Fly:
         """
         self.width = new_width
         self.height = new_height
-        self.update_image()
+
+        # Rescale the current facing directly, since update_image skips unchanged facings
+        if self.facing_left:
+            self.img = get_scaled_sprite(self.img_left, "left", self.width, self.height)
+        else:
+            self.img = get_scaled_sprite(self.img_right, "right", self.width, self.height)
         
     def reposition(self, width_scale, height_scale):
         """
@@ -167,12 +234,35 @@ class Fly:
         """
         self.x = self.x * width_scale
         self.y = self.y * height_scale
+        self.previous_x = self.previous_x * width_scale
+        self.previous_y = self.previous_y * height_scale
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Renders the fly onto the given screen.
 
         Args:
             screen (pygame.Surface): The screen where the fly will be drawn.
+            alpha (float, optional): How far to interpolate between the previous and current
+                                     position, from 0.0 to 1.0. Defaults to 1.0.
+
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+        """
+        return screen.blit(*self.blit_args(alpha))
+
+    def blit_args(self, alpha=1.0):
+        """
+        Returns the surface and position to draw the fly with, for batching into `Surface.blits`.
+
+        Args:
+            alpha (float, optional): How far to interpolate between the previous and current
+                                     position, from 0.0 to 1.0. Defaults to 1.0.
+
+        Returns:
+            tuple: The (surface, (x, y)) pair to blit.
         """
-        screen.blit(self.img, (self.x, self.y))
+        if alpha < 1.0:
+            return self.img, (self.previous_x + (self.x - self.previous_x) * alpha,
+                              self.previous_y + (self.y - self.previous_y) * alpha)
+        return self.img, (self.x, self.y)
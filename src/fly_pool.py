@@ -0,0 +1,133 @@
+from itertools import count
+from constants import FLY_POOL_SIZE
+
+class FlyPool:
+    def __init__(self, max_free=FLY_POOL_SIZE):
+        """
+        Initializes a pool that recycles caught, escaped and reset flies instead of allocating new ones.
+
+        Released flies keep their objects and movement dictionaries; their scaled images come from
+        the shared sprite cache, so reinitializing a fly of the same size does not scale anything.
+        Every fly handed out gets a new `id`, so a recycled object is never mistaken for the fly it was before.
+
+        Args:
+            max_free (int, optional): Maximum number of released flies kept per fly type. Defaults to FLY_POOL_SIZE.
+        """
+        self.max_free = max_free
+        self.free = {}  # Fly class -> released flies of exactly that class
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+        self.ids = count(1)
+
+    def acquire(self, fly_class, screen_width, screen_height, width, height, rng=None):
+        """
+        Returns a fly of the given class, reinitializing a released one if available.
+
+        A reused fly draws from the random number generator exactly like a new one would,
+        so pooling does not change seeded sessions.
+
+        Args:
+            fly_class (type): Fly or SpecialFly.
+            screen_width (int): Width of the screen the fly can move within.
+            screen_height (int): Height of the screen the fly can move within.
+            width (float): Width of the fly.
+            height (float): Height of the fly.
+            rng (random.Random, optional): Random number generator for position and movement. Defaults to None.
+
+        Returns:
+            Fly: The new or recycled fly.
+        """
+        free = self.free.get(fly_class)
+
+        if free:
+            fly = free.pop()
+            fly.reinitialize(screen_width, screen_height, width, height, rng)
+            self.reused += 1
+        else:
+            fly = fly_class(screen_width, screen_height, width, height, rng=rng)
+            self.created += 1
+        fly.id = next(self.ids)
+        return fly
+
+    def reuse(self, fly_class, screen_width, screen_height, width, height, rng=None):
+        """
+        Returns a released fly as it is, without reinitializing it, e.g. to overwrite it from a snapshot.
+        Creates a fly if none of the class is pooled.
+
+        Args:
+            fly_class (type): Fly or SpecialFly.
+            screen_width (int): Width of the screen, only used to create a fly.
+            screen_height (int): Height of the screen, only used to create a fly.
+            width (float): Width of the fly, only used to create a fly.
+            height (float): Height of the fly, only used to create a fly.
+            rng (random.Random, optional): Random number generator a new fly draws its initial state from.
+                                           Defaults to None.
+
+        Returns:
+            Fly: A recycled or new fly whose state the caller must overwrite.
+        """
+        free = self.free.get(fly_class)
+
+        if free:
+            fly = free.pop()
+            self.reused += 1
+        else:
+            fly = fly_class(screen_width, screen_height, width, height, rng=rng)
+            self.created += 1
+        fly.id = next(self.ids)
+        return fly
+
+    def release(self, fly):
+        """
+        Returns a fly that left the game to the pool. The caller must not use it afterwards.
+
+        Args:
+            fly (Fly): The fly to recycle.
+        """
+        free = self.free.setdefault(type(fly), [])
+
+        if len(free) < self.max_free:
+            free.append(fly)
+            self.released += 1
+        else:
+            self.discarded += 1  # Pool is full, let the garbage collector have it
+
+    def release_all(self, flies):
+        """
+        Returns several flies to the pool.
+
+        Args:
+            flies (iterable): The flies to recycle.
+        """
+        for fly in flies:
+            self.release(fly)
+
+    def clear(self):
+        """
+        Drops all released flies and resets the statistics.
+        """
+        self.free.clear()
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+
+    def stats(self):
+        """
+        Reports how effective the pool has been.
+
+        Returns:
+            dict: The number of pooled flies (`free`), flies `created`, `reused`, `released` and `discarded`,
+                  and the `reuse_rate` of acquisitions as a float.
+        """
+        acquired = self.created + self.reused
+        return {
+            "free": sum(len(free) for free in self.free.values()),
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "reuse_rate": self.reused / acquired if acquired else 0.0
+        }
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+import pygame
+from constants import TEXT_CACHE_SIZE
+
+class FontManager:
+    def __init__(self, max_text_surfaces=TEXT_CACHE_SIZE):
+        """
+        Initializes caches for font objects and rendered text surfaces.
+
+        Args:
+            max_text_surfaces (int, optional): Maximum number of rendered text surfaces to keep.
+                                               Defaults to TEXT_CACHE_SIZE.
+        """
+        self.max_text_surfaces = max_text_surfaces
+        self.fonts = {}
+        self.text_surfaces = OrderedDict()
+
+    def get_font(self, face, size):
+        """
+        Returns a font object, creating it only the first time a face and size are requested.
+
+        Args:
+            face (str): The system font name, or None for the default Pygame font.
+            size (int): The font size.
+
+        Returns:
+            pygame.font.Font: The cached font.
+        """
+        key = (face, size)
+        font = self.fonts.get(key)
+
+        if font is None:
+            if face is None:
+                font = pygame.font.Font(None, size)
+            else:
+                font = pygame.font.SysFont(face, size)
+            self.fonts[key] = font
+
+        return font
+
+    def render(self, text, size, color, face=None):
+        """
+        Renders antialiased text, reusing the surface if the same text was rendered before.
+
+        Args:
+            text (str): The text to render.
+            size (int): The font size.
+            color (tuple): RGB color of the text.
+            face (str, optional): The system font name, or None for the default Pygame font. Defaults to None.
+
+        Returns:
+            pygame.Surface: The shared rendered text surface. Callers must not draw onto it.
+        """
+        key = (text, size, tuple(color), face)
+        surface = self.text_surfaces.get(key)
+
+        if surface is not None:
+            self.text_surfaces.move_to_end(key)  # Mark as most recently used
+            return surface
+
+        surface = self.get_font(face, size).render(text, True, color)
+        self.text_surfaces[key] = surface
+
+        # Evict the least recently used text once the cache is full
+        while len(self.text_surfaces) > self.max_text_surfaces:
+            self.text_surfaces.popitem(last=False)
+
+        return surface
+
+    def invalidate(self):
+        """
+        Drops all cached fonts and text, e.g. after the screen-derived font size changed.
+        """
+        self.fonts.clear()
+        self.text_surfaces.clear()
+
+# Process-wide font manager used by the HUD, popups and game over screen
+FONT_MANAGER = FontManager()
@@ -0,0 +1,143 @@
+import os
+import queue
+import struct
+import threading
+import numpy as np
+import pygame
+
+RAW_HEADER = struct.Struct("<4sIII")  # Magic, width, height, channels
+RAW_MAGIC = b"FCRF"
+
+def frame_view(surface, downsample=1):
+    """
+    Returns a zero-copy NumPy view of a surface's pixels.
+
+    The view is indexed as [x, y, channel] and keeps the surface locked while it exists,
+    so it must be released (deleted) before anything is drawn onto the surface again.
+
+    Args:
+        surface (pygame.Surface): A 24 or 32-bit surface to view.
+        downsample (int, optional): Keep every n-th pixel along both axes. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: A (width, height, 3) uint8 view into the surface memory.
+    """
+    pixels = pygame.surfarray.pixels3d(surface)
+    if downsample > 1:
+        return pixels[::downsample, ::downsample]
+    return pixels
+
+class FrameCapture:
+    def __init__(self, path, file_format="png", downsample=1, max_pending=8):
+        """
+        Initializes a frame recorder that writes captured frames from a background thread.
+
+        Args:
+            path (str): A directory for the PNG sequence, or a file path for the raw frame file.
+            file_format (str, optional): "png" for one PNG per frame or "raw" for a single file of
+                                         uint8 frames after a RAW_HEADER. Defaults to "png".
+            downsample (int, optional): Keep every n-th pixel along both axes. Defaults to 1.
+            max_pending (int, optional): Frames that may wait for the writer before new frames
+                                         are dropped. Defaults to 8.
+        """
+        if file_format not in ("png", "raw"):
+            raise ValueError(f"Unsupported frame format: {file_format}")
+
+        self.path = path
+        self.file_format = file_format
+        self.downsample = downsample
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.raw_file = None
+        self.error = None
+
+        if file_format == "png":
+            os.makedirs(path, exist_ok=True)
+
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.writer = threading.Thread(target=self.write_frames, name="frame-writer", daemon=True)
+        self.writer.start()
+
+    def capture(self, surface):
+        """
+        Queues the current contents of a surface for writing.
+
+        The pixels are copied exactly once, out of the zero-copy view, so the writer thread
+        never touches the live framebuffer. Frames are dropped rather than stalling the
+        game loop if the writer falls behind.
+
+        Args:
+            surface (pygame.Surface): The rendered frame.
+
+        Returns:
+            bool: True if the frame was queued, False if it was dropped.
+        """
+        if self.pending.full():
+            self.frames_dropped += 1
+            return False
+
+        view = frame_view(surface, self.downsample)
+        frame = view.copy()
+        del view  # Unlock the surface before the next frame is drawn
+
+        self.pending.put_nowait((self.frames_captured, frame))
+        self.frames_captured += 1
+        return True
+
+    def write_frames(self):
+        """
+        Writes queued frames until a None sentinel is received. Runs on the writer thread.
+        """
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+
+            index, frame = item
+            try:
+                if self.file_format == "png":
+                    filename = os.path.join(self.path, f"frame_{index:06d}.png")
+                    pygame.image.save(pygame.surfarray.make_surface(frame), filename)
+                else:
+                    if self.raw_file is None:
+                        self.raw_file = open(self.path, "wb")
+                        width, height, channels = frame.shape
+                        self.raw_file.write(RAW_HEADER.pack(RAW_MAGIC, width, height, channels))
+                    frame.tofile(self.raw_file)
+            except (OSError, pygame.error) as error:
+                self.error = error  # Reported by close(); keep draining so capture never blocks
+
+    def close(self):
+        """
+        Flushes all queued frames and stops the writer thread.
+
+        Raises:
+            OSError: If a frame could not be written.
+        """
+        self.pending.put(None)
+        self.writer.join()
+
+        if self.raw_file is not None:
+            self.raw_file.close()
+            self.raw_file = None
+
+        if self.error is not None:
+            raise OSError(f"Failed to write captured frames: {self.error}")
+
+def read_raw_frames(path):
+    """
+    Reads every frame from a raw frame file written by FrameCapture.
+
+    Args:
+        path (str): The raw frame file.
+
+    Returns:
+        numpy.ndarray: An (n_frames, width, height, channels) uint8 array.
+    """
+    with open(path, "rb") as file:
+        magic, width, height, channels = RAW_HEADER.unpack(file.read(RAW_HEADER.size))
+        if magic != RAW_MAGIC:
+            raise ValueError(f"{path} is not a raw frame file")
+        data = np.fromfile(file, dtype=np.uint8)
+
+    return data.reshape(-1, width, height, channels)
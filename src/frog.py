@@ -1,5 +1,6 @@
-import pygame
-from constants import FROG, FROG_SPEED
+from assets import ASSETS
+from constants import FROG_SPEED
+from sprite_cache import get_scaled_sprite
 
 class Frog:
     def __init__(self, x, y, width, height):
@@ -14,6 +15,7 @@ class Frog:
         """
         self.x = x
         self.y = y
+        self.previous_x, self.previous_y = x, y  # Position before the last move, for interpolation
         self.width = width
         self.height = height
         self.speed = FROG_SPEED
@@ -24,28 +26,44 @@ class Frog:
             'up': False
         }
 
-        self.original_img = FROG
-        self.img = pygame.transform.scale(self.original_img, (int(self.width), int(self.height)))
+        self.original_img = ASSETS.get("frog")
+        self.img = get_scaled_sprite(self.original_img, None, self.width, self.height)
 
-    def move(self, screen_width, screen_height):
+    def move(self, screen_width, screen_height, dt=1.0, obstacles=None):
         """
         Updates the frog's position based on movement states while keeping it within screen bounds.
 
         Args:
             screen_width (int): The width of the game screen.
             screen_height (int): The height of the game screen.
+            dt (float, optional): The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
+            obstacles (ObstacleGrid, optional): Obstacles the frog cannot move into. Defaults to None.
         """
+        self.previous_x, self.previous_y = self.x, self.y
+        step = self.speed * dt
+
         if self.movement['left'] and self.x > 0:
-            self.x -= self.speed
+            self.x -= step
             
         if self.movement['right'] and self.x + self.width < screen_width: 
-            self.x += self.speed
+            self.x += step
+
+        # Each axis is blocked on its own, so the frog can slide along an obstacle
+        if obstacles is not None and self.x != self.previous_x and \
+                obstacles.blocking(self.x, self.y, self.width, self.height) is not None and \
+                obstacles.blocking(self.previous_x, self.y, self.width, self.height) is None:
+            self.x = self.previous_x
 
         if self.movement['up'] and self.y > 0:
-            self.y -= self.speed
+            self.y -= step
             
         if self.movement['down'] and self.y + self.height < screen_height:
-            self.y += self.speed
+            self.y += step
+
+        if obstacles is not None and self.y != self.previous_y and \
+                obstacles.blocking(self.x, self.y, self.width, self.height) is not None and \
+                obstacles.blocking(self.x, self.previous_y, self.width, self.height) is None:
+            self.y = self.previous_y
 
     def resize(self, width_scale, height_scale):
         """
@@ -57,7 +75,7 @@ class Frog:
         """
         self.width *= width_scale
         self.height *= height_scale
-        self.img = pygame.transform.scale(self.original_img, (int(self.width), int(self.height)))
+        self.img = get_scaled_sprite(self.original_img, None, self.width, self.height)
 
     def reposition(self, width_scale, height_scale):
         """
@@ -69,12 +87,35 @@ class Frog:
         """
         self.x *= width_scale
         self.y *= height_scale
+        self.previous_x *= width_scale
+        self.previous_y *= height_scale
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Draws the frog onto the given screen.
 
         Args:
             screen (pygame.Surface): The surface to draw the frog on.
+            alpha (float, optional): How far to interpolate between the previous and current
+                                     position, from 0.0 to 1.0. Defaults to 1.0.
+
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+        """
+        return screen.blit(*self.blit_args(alpha))
+
+    def blit_args(self, alpha=1.0):
+        """
+        Returns the surface and position to draw the frog with, for batching into `Surface.blits`.
+
+        Args:
+            alpha (float, optional): How far to interpolate between the previous and current
+                                     position, from 0.0 to 1.0. Defaults to 1.0.
+
+        Returns:
+            tuple: The (surface, (x, y)) pair to blit.
         """
-        screen.blit(self.img, (self.x, self.y))
+        if alpha < 1.0:
+            return self.img, (self.previous_x + (self.x - self.previous_x) * alpha,
+                              self.previous_y + (self.y - self.previous_y) * alpha)
+        return self.img, (self.x, self.y)
@@ -16,7 +16,7 @@ def check_collision(frog, fly):
     fly_rect = pygame.Rect(fly.x, fly.y, int(fly.width), int(fly.height))
     return frog_rect.colliderect(fly_rect)
 
-def update_frog_and_flies(game_state, screen_width, screen_height):
+def update_frog_and_flies(game_state, screen_width, screen_height, dt=1.0, frogs=None):
     """
     Updates the frog's position and processes interactions with flies.
 
@@ -25,30 +25,99 @@ def update_frog_and_flies(game_state, screen_width, screen_height):
                     score, countdown time, and score popups.
         screen_width: The width of the game screen.
         screen_height: The height of the game screen.
+        dt: The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
+        frogs: The frogs catching flies, e.g. one per player. Defaults to None, which uses the game state's frog.
+
+    Returns:
+        list: (index into frogs, fly) for every fly caught this step. The flies are back in the fly pool.
     """
-    # Move the frog based on user input and screen boundaries
-    game_state.frog.move(screen_width, screen_height)
-
-    # Iterate over a copy of the fly list to safely remove flies if needed
-    for fly in game_state.flies[:]:
-        if check_collision(game_state.frog, fly):
-            game_state.flies.remove(fly)
-            
-            if isinstance(fly, SpecialFly):   
+    game_state.tick += 1
+    if frogs is None:
+        frogs = (game_state.frog,)
+
+    # Move the frogs based on user input, screen boundaries and obstacles
+    obstacles = game_state.obstacles
+    for frog in frogs:
+        frog.move(screen_width, screen_height, dt, obstacles)
+
+    if game_state.swarm is not None:
+        update_swarm(game_state, screen_width, screen_height, dt)
+
+    # Only flies sharing a grid cell with a frog can be caught this frame; the first frog listed wins ties
+    catchers = {}
+    for index, frog in enumerate(frogs):
+        for fly in game_state.entities_in_rect((frog.x, frog.y, frog.width, frog.height)):
+            if fly not in catchers and check_collision(frog, fly):
+                catchers[fly] = index
+    spatial_hash = game_state.spatial_hash
+    caught = []
+
+    # Compact the fly list in place: surviving flies are moved down to `kept` and the
+    # tail is cut off once at the end, so removals don't search or shift the list
+    flies = game_state.flies
+    kept = 0
+    for fly in flies:  # Writes only go to indices already visited, so iterating is safe
+        special = isinstance(fly, SpecialFly)
+
+        if fly in catchers:
+            game_state.release_fly(fly)
+            caught.append((catchers[fly], fly))
+
+            if special:
                 game_state.countdown_time += 5
             else:
                 game_state.score += 1
 
             # Store the position and timestamp of the score popup
-            game_state.score_popups.append({
-                "pos": (fly.x, fly.y),
-                "time": pygame.time.get_ticks(),
-                "special": isinstance(fly, SpecialFly)
-            })
-        elif isinstance(fly, SpecialFly) and not fly.move(screen_width, screen_height):
-            # Remove special flies that move out of screen boundaries
-            game_state.flies.remove(fly) 
-
-        elif not isinstance(fly, SpecialFly):
-            # Move regular flies within screen boundaries
-            fly.move(screen_width, screen_height)
+            game_state.score_popups.add(fly.x, fly.y, pygame.time.get_ticks(), special)
+            continue
+
+        if special:
+            if not fly.move(screen_width, screen_height, dt, obstacles):
+                # Remove special flies that move out of screen boundaries
+                game_state.release_fly(fly)
+                continue
+        else:
+            # Move regular flies within screen boundaries, bouncing off obstacles
+            fly.move(screen_width, screen_height, dt, obstacles)
+
+        spatial_hash.update(fly, fly.x, fly.y, fly.width, fly.height)
+        flies[kept] = fly
+        kept += 1
+
+    del flies[kept:]
+
+    # Run timed events such as fly spawns between steps, like input events
+    game_state.scheduler.advance()
+    return caught
+
+
+def update_swarm(game_state, screen_width, screen_height, dt=1.0):
+    """
+    Processes catches and movement for flies simulated by the FlySwarm backend.
+
+    Flies overlapping the frog are caught before moving, matching the per-fly loop above.
+
+    Args:
+        game_state: The current game state containing the frog and the fly swarm.
+        screen_width: The width of the game screen.
+        screen_height: The height of the game screen.
+        dt: The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
+    """
+    swarm = game_state.swarm
+    frog = game_state.frog
+    caught = swarm.collide(frog.x, frog.y, frog.width, frog.height)
+
+    if caught.any():
+        n = swarm.count
+        current_time = pygame.time.get_ticks()
+        for x, y, special in zip(swarm.x[:n][caught].tolist(), swarm.y[:n][caught].tolist(),
+                                 swarm.special[:n][caught].tolist()):
+            if special:
+                game_state.countdown_time += 5
+            else:
+                game_state.score += 1
+            game_state.score_popups.add(x, y, current_time, special)
+        swarm.remove(caught)
+
+    swarm.step(screen_width, screen_height, dt, game_state.obstacles)
@@ -1,7 +1,10 @@
 import pygame
+from constants import (BASE_TICK_RATE, FRAME_RATE, GAME_OVER_SCENE, MAX_STEPS_PER_FRAME, PAUSED_SCENE,
+                       SIMULATION_RATE)
+from dirty_renderer import DirtyRectRenderer
 from event_handler import handle_events
 from game_logic import update_frog_and_flies
-from game_over import game_over
+from profiler import EVENTS, PRESENT, RENDERING, SIMULATION, TICK
 from ui_renderer import draw_game_objects
 
 def is_time_up(start_time, countdown_time):
@@ -18,25 +21,129 @@ def is_time_up(start_time, countdown_time):
     elapsed_time = (pygame.time.get_ticks() - start_time) // 1000
     return elapsed_time >= countdown_time
 
-def create_game_loop(screen_manager, game_state):
-    """
-    Runs the main game loop.
+class GameplayScene:
+    def __init__(self, screen_manager, game_state, dirty_rects=False, frame_capture=None, recorder=None,
+                 profiler=None, snapshots=None, spectator_log=None, governor=None):
+        """
+        Initializes the gameplay scene of one game session.
 
-    Args:
-        screen_manager (ScreenManager): Manages screen updates and resizing.
-        game_state (GameState): Tracks the state of the game (score, time, entities).
-    """
-    start_time = pygame.time.get_ticks()
-    clock = pygame.time.Clock()
-    
-    while True:
-        handle_events(game_state, screen_manager)
-        update_frog_and_flies(game_state, screen_manager.width, screen_manager.height)
-        draw_game_objects(game_state, screen_manager, start_time)
-        pygame.display.flip() # Refresh display
-        clock.tick(60) # Limit frame rate
-
-        # End the game if time is up
-        if is_time_up(start_time, game_state.countdown_time):
-            game_over(screen_manager)
-            return
+        The simulation advances in fixed steps of 1/SIMULATION_RATE seconds, independent of the
+        frame rate. Leftover time is carried over to the next frame and used to interpolate
+        sprite positions between the last two simulation steps.
+
+        Args:
+            screen_manager (ScreenManager): Manages screen updates and resizing.
+            game_state (GameState): Tracks the state of the game (score, time, entities).
+            dirty_rects (bool, optional): Whether to repaint and push only the areas that changed
+                                          instead of the whole screen. Defaults to False.
+            frame_capture (FrameCapture, optional): Receives every rendered frame. Defaults to None.
+            recorder (SessionRecorder, optional): Records the session's inputs for replay. Defaults to None.
+            profiler (FrameProfiler, optional): Records how long each phase of every frame takes. Defaults to None.
+            snapshots (SnapshotRing, optional): Keeps a snapshot of the game state after every simulation step.
+                                                Defaults to None.
+            spectator_log (SpectatorLog, optional): Records every simulation step for spectators. Defaults to None.
+            governor (QualityGovernor, optional): Lowers rendering quality while frames miss the frame rate budget.
+                                                  Defaults to None, full quality.
+        """
+        self.screen_manager = screen_manager
+        self.game_state = game_state
+        self.frame_capture = frame_capture
+        self.recorder = recorder
+        self.profiler = profiler
+        self.snapshots = snapshots
+        self.spectator_log = spectator_log
+        self.governor = governor
+        self.renderer = DirtyRectRenderer() if dirty_rects else None
+        self.clock = pygame.time.Clock()
+
+        self.start_time = pygame.time.get_ticks()  # Moved forward by pauses, so the countdown stops
+        self.pause_reason = None  # Why `run` last returned PAUSED_SCENE, KEY_PAUSE or FOCUS_PAUSE
+        self.accumulator = 0.0
+        self.previous_ticks = self.start_time
+
+    def resume(self, paused_ms):
+        """
+        Continues after the game was paused, as if no time had passed.
+
+        Args:
+            paused_ms (int): How long the game was paused, in milliseconds.
+        """
+        self.start_time += paused_ms
+        self.previous_ticks = pygame.time.get_ticks()
+        self.clock.tick()  # The pause is not a slow frame
+        if self.renderer:
+            self.renderer.invalidate()  # The pause screen drew over the whole screen
+
+    def run(self):
+        """
+        Runs the game until it is paused or the time is up.
+
+        Returns:
+            str: The next scene, PAUSED_SCENE or GAME_OVER_SCENE.
+        """
+        screen_manager, game_state, renderer, profiler = self.screen_manager, self.game_state, self.renderer, self.profiler
+        governor = self.governor
+        step_ms = 1000 / SIMULATION_RATE
+        dt = BASE_TICK_RATE / SIMULATION_RATE  # Step length in the base ticks speeds are defined for
+
+        while True:
+            if profiler:
+                profiler.begin_frame()
+
+            pause_reason = handle_events(game_state, screen_manager, self.recorder, profiler)
+            if pause_reason is not None:
+                self.pause_reason = pause_reason
+                return PAUSED_SCENE
+            if profiler:
+                profiler.mark(EVENTS)
+
+            # Run as many fixed steps as the elapsed time allows, capped to avoid a spiral of death
+            current_ticks = pygame.time.get_ticks()
+            self.accumulator = min(self.accumulator + current_ticks - self.previous_ticks,
+                                   step_ms * MAX_STEPS_PER_FRAME)
+            self.previous_ticks = current_ticks
+
+            while self.accumulator >= step_ms:
+                update_frog_and_flies(game_state, screen_manager.width, screen_manager.height, dt)
+                if self.snapshots is not None:
+                    self.snapshots.push(game_state)
+                if self.spectator_log is not None:
+                    self.spectator_log.record(game_state)
+                self.accumulator -= step_ms
+
+            alpha = self.accumulator / step_ms  # Progress towards the next step, for interpolation
+            if profiler:
+                profiler.mark(SIMULATION)
+
+            if renderer:
+                rects = renderer.draw(game_state, screen_manager, self.start_time, alpha, governor)
+            else:
+                draw_game_objects(game_state, screen_manager, self.start_time, alpha, doreturn=False, quality=governor)
+                rects = None
+
+            if profiler and profiler.show_overlay:
+                overlay_rect = profiler.draw_overlay(screen_manager.screen, screen_manager.height)
+                if renderer:
+                    rects.append(overlay_rect)
+                    renderer.previous_rects.append(overlay_rect)  # Erase the overlay next frame
+
+            if self.frame_capture:
+                self.frame_capture.capture(screen_manager.screen)
+
+            if profiler:
+                profiler.mark(RENDERING)
+
+            screen_manager.present(rects) # Refresh display (or only the changed areas)
+            if profiler:
+                profiler.mark(PRESENT)
+
+            frame_ms = self.clock.tick(governor.frame_rate if governor is not None else FRAME_RATE) # Limit frame rate
+            if governor is not None:
+                governor.record(frame_ms, self.clock.get_rawtime())
+            if profiler:
+                profiler.mark(TICK)
+                profiler.end_frame(len(game_state.flies) + (len(game_state.swarm) if game_state.swarm is not None else 0))
+
+            # End the game if time is up
+            if is_time_up(self.start_time, game_state.countdown_time):
+                return GAME_OVER_SCENE
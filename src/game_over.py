@@ -1,6 +1,9 @@
+import time
 import pygame
+from constants import IDLE_POLL_INTERVAL
+from font_manager import FONT_MANAGER
 
-def show_game_over_screen(screen, screen_width, screen_height):
+def show_game_over_screen(screen, screen_width, screen_height, top_scores=None):
     """
     Displays the game over screen with options to play again or exit.
 
@@ -8,6 +11,7 @@ def show_game_over_screen(screen, screen_width, screen_height):
         screen (pygame.Surface): The game screen where elements will be drawn.
         screen_width (int): The width of the game screen.
         screen_height (int): The height of the game screen.
+        top_scores (list, optional): (score, played_at) pairs to show as a leaderboard. Defaults to None.
 
     Returns:
         tuple: (play_again_button, exit_button), pygame.Rect objects representing 
@@ -23,6 +27,9 @@ def show_game_over_screen(screen, screen_width, screen_height):
     play_again_button = draw_button(screen, "Play Again", (screen_width // 2, screen_height // 2), (50, 150, 50))
     exit_button = draw_button(screen, "Exit", (screen_width // 2, screen_height // 2 + 80), (200, 50, 50))
 
+    if top_scores:
+        draw_leaderboard(screen, top_scores, (screen_width // 2, screen_height // 2 + 130))
+
     pygame.display.update()
 
     return play_again_button, exit_button
@@ -39,8 +46,7 @@ def render_text(text, font_size, color):
     Returns:
         pygame.Surface: The rendered text surface.
     """
-    font = pygame.font.Font(None, font_size)
-    return font.render(text, True, color)
+    return FONT_MANAGER.render(text, font_size, color)
 
 def draw_button(screen, text, center_pos, color):
     """
@@ -55,8 +61,7 @@ def draw_button(screen, text, center_pos, color):
     Returns:
         pygame.Rect: The rectangle representing the button area.
     """
-    font = pygame.font.Font(None, 40)
-    text_surface = font.render(text, True, (255, 255, 255))
+    text_surface = FONT_MANAGER.render(text, 40, (255, 255, 255))
     text_rect = text_surface.get_rect(center=center_pos)
 
     button_rect = pygame.Rect(center_pos[0] - 100, center_pos[1] - 25, 200, 50)
@@ -65,38 +70,82 @@ def draw_button(screen, text, center_pos, color):
 
     return button_rect
 
-def game_over(screen_manager):
+def draw_leaderboard(screen, top_scores, top_center):
+    """
+    Draws the high scores as a centered list.
+
+    Args:
+        screen (pygame.Surface): The game screen to draw on.
+        top_scores (list): (score, played_at) pairs, best first.
+        top_center (tuple): (x, y) position of the top center of the list.
+    """
+    x, y = top_center
+    lines = ["High Scores"] + [f"{rank}. {score}   {time.strftime('%Y-%m-%d', time.localtime(played_at))}"
+                              for rank, (score, played_at) in enumerate(top_scores, 1)]
+    for line in lines:
+        text_surface = render_text(line, 24, (0, 0, 0))
+        screen.blit(text_surface, text_surface.get_rect(midtop=(x, y)))
+        y += 26
+
+def game_over(screen_manager, score=None, score_store=None):
     """
     Handles the game over screen, allowing the player to restart or exit.
 
     Args:
         screen_manager: An instance of ScreenManager that manages the game screen.
+        score (int, optional): The final score, recorded in the score store. Defaults to None.
+        score_store (ScoreStore, optional): Records the score and provides the leaderboard. Defaults to None.
     """
     screen = screen_manager.screen
     screen_width = screen_manager.width
     screen_height = screen_manager.height
+
+    top_scores = None
+    if score_store is not None:
+        if score is not None:
+            score_store.add(score)  # Written in the background, the leaderboard updates once it is stored
+        shown_version = score_store.version
+        top_scores = score_store.top_scores()
     
-    play_again_button, exit_button = show_game_over_screen(screen, screen_width, screen_height)
+    play_again_button, exit_button = show_game_over_screen(screen, screen_width, screen_height, top_scores)
 
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        if score_store is not None and score_store.version != shown_version:
+            shown_version = score_store.version
+            top_scores = score_store.top_scores()
+            play_again_button, exit_button = show_game_over_screen(screen, screen_manager.width,
+                                                                   screen_manager.height, top_scores)
+
+        # Sleep until there is input, only waking up regularly while the score is being written.
+        # The store refreshes its top scores before a write counts as done, so no update is missed
+        if score_store is not None and score_store.pending.unfinished_tasks:
+            event = pygame.event.wait(IDLE_POLL_INTERVAL)
+        elif score_store is not None and score_store.version != shown_version:
+            continue
+        else:
+            event = pygame.event.wait()
+
+        if event.type == pygame.QUIT:
+            if score_store is not None:
+                score_store.close()  # Finish writing the score before the process ends
+            pygame.quit()
+            exit()
+
+        if event.type == pygame.VIDEORESIZE:
+            # Update the screen dimensions
+            screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+            screen_manager.resize(event.w, event.h)
+
+            # Re-render the game over screen and update button positions
+            play_again_button, exit_button = show_game_over_screen(screen, event.w, event.h, top_scores)
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            mouse_pos = pygame.mouse.get_pos()
+            if play_again_button.collidepoint(mouse_pos):
+                return # Exit game over screen, restart game
+                
+            elif exit_button.collidepoint(mouse_pos):
+                if score_store is not None:
+                    score_store.close()  # Finish writing the score before the process ends
                 pygame.quit()
                 exit()
-
-            if event.type == pygame.VIDEORESIZE:
-                # Update the screen dimensions
-                screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                screen_manager.resize(event.w, event.h)
-
-                # Re-render the game over screen and update button positions
-                play_again_button, exit_button = show_game_over_screen(screen, event.w, event.h)
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                if play_again_button.collidepoint(mouse_pos):
-                    return # Exit game over screen, restart game
-                    
-                elif exit_button.collidepoint(mouse_pos):
-                    pygame.quit()
-                    exit()
@@ -1,36 +1,172 @@
-from constants import GAME_DURATION, INITIAL_FLY_COUNT
+import random
+from assets import prepare_fly_sprites
+from constants import FLY_SPAWN_INTERVAL, GAME_DURATION, INITIAL_FLY_COUNT, SPECIAL_FLY_SPAWN_INTERVAL
 from fly import Fly
+from fly_pool import FlyPool
 from frog import Frog
+from obstacles import ObstacleGrid
+from popups import PopupBuffer
+from scheduler import Scheduler, ms_to_ticks
+from spatial_hash import SpatialHash
+from special_fly import SpecialFly
 
 class GameState:
-    def __init__(self):
+    def __init__(self, use_swarm=False):
         """
         Initializes the game state with default values.
+
+        Args:
+            use_swarm (bool, optional): Whether to simulate flies with the NumPy FlySwarm backend
+                                        instead of individual Fly objects. Defaults to False.
         """
         self.countdown_time = 0
         self.frog = None
         self.flies = []
         self.score = 0
-        self.score_popups = []
+        self.score_popups = PopupBuffer()
         self.fly_width, self.fly_height = 0, 0
+        self.swarm = None
+        self.fly_pool = FlyPool()
+        self.spatial_hash = SpatialHash()
+        self.obstacles = ObstacleGrid()  # Static obstacles, indexed for the current screen size
+        self.seed = None
+        self.rng = random.Random()
+        self.tick = 0  # Simulation steps completed this session
+        self.scheduler = Scheduler()  # Timed game events such as fly spawns
+        self.screen_width, self.screen_height = 0, 0
+
+        if use_swarm:
+            from swarm import FlySwarm  # NumPy is only needed when the swarm backend is used
+            self.swarm = FlySwarm()
 
-    def reset(self, screen_width, screen_height):
+    def reset(self, screen_width, screen_height, seed=None, fly_spawn_interval=FLY_SPAWN_INTERVAL,
+              special_fly_spawn_interval=SPECIAL_FLY_SPAWN_INTERVAL):
         """
         Resets the game state for a new game session.
 
+        Every session draws from its own random number generator, so a session can be
+        reproduced from its seed and inputs.
+
         Args:
             screen_width (int): The width of the game screen.
             screen_height (int): The height of the game screen.
+            seed (int, optional): Seed for the session's random number generator.
+                                  Defaults to None, which picks a new random seed.
+            fly_spawn_interval (int, optional): Milliseconds of game time between fly spawns.
+                                                Defaults to FLY_SPAWN_INTERVAL.
+            special_fly_spawn_interval (int, optional): Milliseconds of game time between special fly spawns.
+                                                        Defaults to SPECIAL_FLY_SPAWN_INTERVAL.
         """
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.tick = 0
+        self.screen_width, self.screen_height = screen_width, screen_height
         self.countdown_time = GAME_DURATION
         self.score = 0
-        self.score_popups = []
+        self.score_popups.clear()
         self.fly_width = screen_width / 25
         self.fly_height = screen_width / 25
+        prepare_fly_sprites(self.fly_width, self.fly_height)
+        self.obstacles.build(screen_width, screen_height)
 
         # Reset game entities
         self.frog = Frog(screen_width / 2, screen_height / 2,
                          screen_width / 10, screen_width / 12)
-        self.flies = [Fly(screen_width, screen_height, self.fly_width,
-                          self.fly_height) for _ in range(INITIAL_FLY_COUNT)]
+
+        if self.swarm is not None:
+            self.flies = []
+            self.swarm.clear()
+            self.swarm.reseed(self.seed)
+            self.swarm.spawn(INITIAL_FLY_COUNT, screen_width, screen_height, self.fly_width, self.fly_height)
+        else:
+            self.fly_pool.release_all(self.flies)  # Recycle the previous session's flies
+            self.flies = [self.fly_pool.acquire(Fly, screen_width, screen_height, self.fly_width,
+                                                self.fly_height, rng=self.rng) for _ in range(INITIAL_FLY_COUNT)]
+
+        self.rebuild_spatial_hash()
+
+        # Spawn timers run on game time, so they stop with the session and replay deterministically
+        self.scheduler.clear()
+        self.scheduler.schedule(ms_to_ticks(fly_spawn_interval), self.spawn_timed_fly,
+                                interval=ms_to_ticks(fly_spawn_interval))
+        self.scheduler.schedule(ms_to_ticks(special_fly_spawn_interval), self.spawn_timed_special_fly,
+                                interval=ms_to_ticks(special_fly_spawn_interval))
+
+    def spawn_timed_fly(self):
+        """
+        Spawns a fly on the current screen when the fly spawn timer fires.
+        """
+        self.spawn_fly(self.screen_width, self.screen_height)
+
+    def spawn_timed_special_fly(self):
+        """
+        Spawns a special fly on the current screen when the special fly spawn timer fires.
+        """
+        self.spawn_fly(self.screen_width, self.screen_height, special=True)
+
+    def spawn_fly(self, screen_width, screen_height, special=False):
+        """
+        Spawns a new fly (or special fly) using the session's random number generator.
+
+        Args:
+            screen_width (int): The width of the game screen.
+            screen_height (int): The height of the game screen.
+            special (bool, optional): Whether to spawn a special fly. Defaults to False.
+        """
+        if self.swarm is not None:
+            self.swarm.spawn(1, screen_width, screen_height, self.fly_width, self.fly_height, special=special)
+        else:
+            self.add_fly(self.fly_pool.acquire(SpecialFly if special else Fly, screen_width, screen_height,
+                                               self.fly_width, self.fly_height, rng=self.rng))
+
+    def add_fly(self, fly):
+        """
+        Adds a fly to the game and registers it in the collision grid.
+
+        Args:
+            fly (Fly): The fly to add.
+        """
+        self.flies.append(fly)
+        self.spatial_hash.insert(fly, fly.x, fly.y, fly.width, fly.height)
+
+    def remove_fly(self, fly):
+        """
+        Removes a fly from the game and from the collision grid, and returns it to the fly pool.
+
+        Args:
+            fly (Fly): The fly to remove.
+        """
+        self.flies.remove(fly)
+        self.release_fly(fly)
+
+    def release_fly(self, fly):
+        """
+        Unregisters a fly that was already taken out of the fly list and returns it to the fly pool.
+
+        Args:
+            fly (Fly): The removed fly.
+        """
+        self.spatial_hash.remove(fly)
+        self.fly_pool.release(fly)
+
+    def rebuild_spatial_hash(self):
+        """
+        Re-registers every fly in the collision grid, e.g. after all positions were rescaled.
+        """
+        self.spatial_hash.clear()
+        for fly in self.flies:
+            self.spatial_hash.insert(fly, fly.x, fly.y, fly.width, fly.height)
+
+    def entities_in_rect(self, rect):
+        """
+        Finds the flies registered in the grid cells overlapped by a rectangle.
+
+        Args:
+            rect (pygame.Rect or tuple): The area to search, as (x, y, width, height).
+
+        Returns:
+            set: The flies that may overlap the rectangle.
+        """
+        x, y, width, height = rect
+        return self.spatial_hash.query(x, y, width, height)
 
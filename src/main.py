@@ -1,19 +1,22 @@
-import pygame
-from constants import FLY_SPAWN, FLY_SPAWN_INTERVAL, SPECIAL_FLY_SPAWN, SPECIAL_FLY_SPAWN_INTERVAL
-from game_loop import create_game_loop
+import logging
+from constants import ADAPTIVE_QUALITY, DIRTY_RECT_RENDERING, HIGH_SCORE_DB
 from game_state import GameState
+from profiler import FrameProfiler
+from quality import QualityGovernor
+from scenes import SceneManager
+from score_store import ScoreStore
 from screen_manager import ScreenManager
+from snapshot import SnapshotRing
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
     screen_manager = ScreenManager() # Initialize screen manager
-
-    # Set up fly spawn timers
-    pygame.time.set_timer(FLY_SPAWN, FLY_SPAWN_INTERVAL)
-    pygame.time.set_timer(SPECIAL_FLY_SPAWN, SPECIAL_FLY_SPAWN_INTERVAL)
-
     game_state = GameState() # Initialize game state
+    profiler = FrameProfiler() # Per-phase frame timings, F3 shows the overlay and F4 dumps them
+    snapshots = SnapshotRing() # Recent game states, the latest is written out if the game crashes
+    score_store = ScoreStore() if HIGH_SCORE_DB else None # High scores, written on a background thread
+    governor = QualityGovernor() if ADAPTIVE_QUALITY else None # Lowers rendering quality on slow machines
 
-    # Main loop for replay functionality
-    while True:
-        game_state.reset(screen_manager.width, screen_manager.height)
-        create_game_loop(screen_manager, game_state)
+    # Gameplay, pause and game over scenes, restarting the game whenever the player plays again
+    SceneManager(screen_manager, game_state, dirty_rects=DIRTY_RECT_RENDERING, profiler=profiler,
+                 snapshots=snapshots, score_store=score_store, governor=governor).run()
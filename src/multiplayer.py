@@ -0,0 +1,591 @@
+import argparse
+import asyncio
+import random
+import struct
+import pygame
+from assets import prepare_fly_sprites
+from constants import (BASE_TICK_RATE, DELTA_TOLERANCE, FLY_SPEED, FRAME_RATE, INITIAL_SCREEN_HEIGHT,
+                       INITIAL_SCREEN_WIDTH, MAX_PLAYERS, MULTIPLAYER_PORT, SIMULATION_RATE)
+from event_handler import handle_key_event
+from fly import Fly
+from frog import Frog
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from snapshot import SPECIAL, movement_bits, unpack_movement
+from special_fly import SpecialFly
+from sprite_cache import get_scaled_sprite
+from ui_renderer import draw_game_objects
+
+FRAME = struct.Struct("<I")  # Length of the message that follows
+# Magic, version, player index, screen width and height, frog width and height, fly width and height,
+# distance a fly moves per step
+WELCOME = struct.Struct("<4sHBHH5d")
+UPDATE = struct.Struct("<IiBHHH")  # Tick, countdown time, player count, fly, removal and catch counts
+PLAYER = struct.Struct("<ddi")  # Frog x, y, score
+FLY_UPDATE = struct.Struct("<IIddB")  # Fly id, tick the position is from, x, y, movement bits and special flag
+REMOVAL = struct.Struct("<I")  # Id of a fly that left the screen
+CATCH = struct.Struct("<IB")  # Id of a caught fly, index of the player who caught it
+MAGIC = b"FCMP"
+VERSION = 1
+
+# Throwaway generator for flies created on clients, whose state comes from the server
+SCRATCH_RNG = random.Random(0)
+
+def predict(x, y, bits, distance):
+    """
+    Predicts where a fly moving in a straight line will be, the way Fly.update_position moves it.
+
+    Args:
+        x (float): The fly's known x-coordinate.
+        y (float): The fly's known y-coordinate.
+        bits (int): The fly's movement bits, see snapshot.movement_bits.
+        distance (float): How far the fly has moved since its position was known.
+
+    Returns:
+        tuple: The predicted (x, y).
+    """
+    if bits & 1:
+        x -= distance
+    elif bits & 2:
+        x += distance
+
+    if bits & 4:
+        y -= distance
+    elif bits & 8:
+        y += distance
+
+    return x, y
+
+class DeltaEncoder:
+    def __init__(self, step, tolerance=DELTA_TOLERANCE):
+        """
+        Initializes an encoder of per-step game state updates that only contain what clients cannot predict.
+
+        Clients move every fly in a straight line from the last position they were sent. A fly is
+        only sent again when it spawns or leaves that path, which happens when it bounces off an edge.
+        Flies are told apart by the `id` the fly pool gave them, so a recycled fly object counts as a new fly.
+
+        Args:
+            step (float): Distance a fly moves per simulation step.
+            tolerance (float, optional): Pixels a fly may drift from its predicted position. Defaults to DELTA_TOLERANCE.
+        """
+        self.step = step
+        self.tolerance = tolerance
+        self.known = {}  # Fly id -> [id, tick, x, y, bits] as last sent to clients
+        self.tick = 0  # Step of the last encoded update
+
+    def encode(self, game_state, players, caught):
+        """
+        Encodes the changes made by the last simulation step.
+
+        Args:
+            game_state (GameState): The game state after the step.
+            players (list): The Player of every frog, in order.
+            caught (list): (player index, fly) for every fly caught this step, as returned by update_frog_and_flies.
+
+        Returns:
+            bytes: The update message.
+        """
+        tick = self.tick = game_state.tick
+        known = self.known
+        tolerance = self.tolerance
+
+        catches = []
+        for index, fly in caught:
+            record = known.pop(fly.id, None)
+            if record is not None:
+                catches.append(CATCH.pack(record[0], index))
+
+        updates = []
+        for fly in game_state.flies:
+            bits = movement_bits(fly.movement) | (SPECIAL if isinstance(fly, SpecialFly) else 0)
+            record = known.get(fly.id)
+
+            if record is None:
+                record = known[fly.id] = [fly.id, tick, fly.x, fly.y, bits]
+            else:
+                x, y = predict(record[2], record[3], record[4], self.step * (tick - record[1]))
+                if bits == record[4] and abs(x - fly.x) <= tolerance and abs(y - fly.y) <= tolerance:
+                    continue
+                record[1:] = tick, fly.x, fly.y, bits
+
+            updates.append(FLY_UPDATE.pack(*record))
+
+        # Special flies that flew off the screen
+        removals = []
+        if len(known) > len(game_state.flies):
+            remaining = {fly.id for fly in game_state.flies}
+            for fly_id in [fly_id for fly_id in known if fly_id not in remaining]:
+                removals.append(REMOVAL.pack(known.pop(fly_id)[0]))
+
+        return self.message(game_state, players, updates, removals, catches)
+
+    def full_update(self, game_state, players):
+        """
+        Encodes every fly as last sent, to bring a newly connected client up to date.
+
+        Args:
+            game_state (GameState): The game state as of the last encoded update.
+            players (list): The Player of every frog, in order.
+
+        Returns:
+            bytes: The update message.
+        """
+        return self.message(game_state, players, [FLY_UPDATE.pack(*record) for record in self.known.values()], [], [])
+
+    def message(self, game_state, players, updates, removals, catches):
+        """
+        Assembles an update message.
+
+        Args:
+            game_state (GameState): The game state.
+            players (list): The Player of every frog, in order.
+            updates (list): Packed FLY_UPDATE records.
+            removals (list): Packed REMOVAL records.
+            catches (list): Packed CATCH records.
+
+        Returns:
+            bytes: The update message.
+        """
+        parts = [UPDATE.pack(self.tick, game_state.countdown_time, len(players), len(updates), len(removals),
+                             len(catches))]
+        parts.extend(PLAYER.pack(player.frog.x, player.frog.y, player.score) for player in players)
+        parts.extend(updates)
+        parts.extend(removals)
+        parts.extend(catches)
+        return b"".join(parts)
+
+class Player:
+    def __init__(self, frog, writer=None):
+        """
+        Initializes a player connected to the server.
+
+        Args:
+            frog (Frog): The player's frog.
+            writer (asyncio.StreamWriter, optional): The connection to the player's client. Defaults to None.
+        """
+        self.frog = frog
+        self.score = 0
+        self.writer = writer
+
+def write_frame(writer, message):
+    """
+    Sends a length-prefixed message.
+
+    Args:
+        writer (asyncio.StreamWriter): The connection.
+        message (bytes): The message.
+    """
+    writer.write(FRAME.pack(len(message)) + message)
+
+async def read_frame(reader):
+    """
+    Receives a length-prefixed message.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+
+    Returns:
+        bytes: The message.
+
+    Raises:
+        asyncio.IncompleteReadError: If the connection closed.
+    """
+    size, = FRAME.unpack(await reader.readexactly(FRAME.size))
+    return await reader.readexactly(size)
+
+class GameServer:
+    def __init__(self, screen_width=INITIAL_SCREEN_WIDTH, screen_height=INITIAL_SCREEN_HEIGHT, seed=None,
+                 max_players=MAX_PLAYERS):
+        """
+        Initializes an authoritative multiplayer game: one simulation with a frog per player.
+
+        Catches count towards the catching player's score, special flies extend the shared countdown.
+
+        Args:
+            screen_width (int, optional): The width of the game screen. Defaults to INITIAL_SCREEN_WIDTH.
+            screen_height (int, optional): The height of the game screen. Defaults to INITIAL_SCREEN_HEIGHT.
+            seed (int, optional): Seed for the session's random number generator. Defaults to None.
+            max_players (int, optional): Players that can join. Defaults to MAX_PLAYERS.
+        """
+        self.game_state = GameState()
+        self.game_state.reset(screen_width, screen_height, seed)
+        self.max_players = max_players
+        self.players = []
+        self.dt = BASE_TICK_RATE / SIMULATION_RATE
+        self.encoder = DeltaEncoder(FLY_SPEED * self.dt)
+        self.encoder.encode(self.game_state, self.players, [])  # Register the initial flies
+        self.server = None
+        self.connections = set()  # Tasks handling connected clients
+        self.bytes_sent = 0
+
+    async def start(self, host="127.0.0.1", port=MULTIPLAYER_PORT):
+        """
+        Starts accepting players.
+
+        Args:
+            host (str, optional): The address to listen on. Defaults to loopback.
+            port (int, optional): The port to listen on, 0 picks a free one. Defaults to MULTIPLAYER_PORT.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle_client(self, reader, writer):
+        """
+        Adds a player for a new connection and applies its inputs until it disconnects.
+        Each input is one byte of movement bits.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's incoming side.
+            writer (asyncio.StreamWriter): The connection's outgoing side.
+        """
+        index = len(self.players)
+        if index >= self.max_players:
+            writer.close()
+            return
+
+        self.connections.add(asyncio.current_task())
+        game_state = self.game_state
+        width, height = game_state.screen_width, game_state.screen_height
+        frog = Frog(width * (index + 1) / (self.max_players + 1), height / 2, width / 10, width / 12)
+        player = Player(frog, writer)
+        self.players.append(player)
+
+        write_frame(writer, WELCOME.pack(MAGIC, VERSION, index, width, height, frog.width, frog.height,
+                                         game_state.fly_width, game_state.fly_height, self.encoder.step))
+        write_frame(writer, self.encoder.full_update(game_state, self.players))
+
+        try:
+            while True:
+                bits = (await reader.readexactly(1))[0]
+                frog.movement.update(unpack_movement(bits))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            player.writer = None  # The frog stays, standing still
+            frog.movement.update(unpack_movement(0))
+            writer.close()
+            self.connections.discard(asyncio.current_task())
+
+    def step(self):
+        """
+        Advances the game by one simulation step and sends the update to every connected player.
+
+        Returns:
+            bytes: The update message.
+        """
+        game_state = self.game_state
+        caught = update_frog_and_flies(game_state, game_state.screen_width, game_state.screen_height, self.dt,
+                                       frogs=[player.frog for player in self.players])
+
+        for index, fly in caught:
+            if not isinstance(fly, SpecialFly):
+                self.players[index].score += 1
+
+        message = self.encoder.encode(game_state, self.players, caught)
+        for player in self.players:
+            if player.writer is not None:
+                write_frame(player.writer, message)
+                self.bytes_sent += FRAME.size + len(message)
+        return message
+
+    def is_over(self):
+        """
+        Checks if the game time has run out.
+
+        Returns:
+            bool: True once the countdown has reached zero in game time.
+        """
+        return self.game_state.tick >= self.game_state.countdown_time * SIMULATION_RATE
+
+    async def run(self, steps=None):
+        """
+        Runs the simulation at SIMULATION_RATE steps per second until the game is over.
+
+        Args:
+            steps (int, optional): Stops after this many steps instead. Defaults to None.
+        """
+        loop = asyncio.get_running_loop()
+        period = 1 / SIMULATION_RATE
+        next_time = loop.time()
+
+        while not self.is_over() and (steps is None or steps > 0):
+            self.step()
+            if steps is not None:
+                steps -= 1
+
+            # Sleeping also lets the event loop flush the updates and read inputs
+            next_time += period
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
+
+    async def close(self):
+        """
+        Disconnects every player and stops accepting new ones.
+        """
+        for player in self.players:
+            if player.writer is not None:
+                player.writer.close()
+        await asyncio.gather(*self.connections)  # Closing ends their reads
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+class GameClient:
+    def __init__(self):
+        """
+        Initializes a client that mirrors the server's game in a local GameState for rendering.
+
+        Flies the server does not mention move along their predicted straight path every step.
+        """
+        self.game_state = GameState()
+        self.player = None  # Index of this client's frog
+        self.frogs = []
+        self.scores = []
+        self.flies = {}  # Fly id -> [fly, tick, x, y, bits] as last received
+        self.frog_width, self.frog_height = 0, 0
+        self.fly_step = 0.0
+        self.tick = 0
+        self.reader = None
+        self.writer = None
+        self.bytes_received = 0
+
+    async def connect(self, host="127.0.0.1", port=MULTIPLAYER_PORT):
+        """
+        Joins a server and applies its initial state.
+
+        Args:
+            host (str, optional): The server's address. Defaults to loopback.
+            port (int, optional): The server's port. Defaults to MULTIPLAYER_PORT.
+
+        Raises:
+            ValueError: If the server does not speak this protocol version.
+        """
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        (magic, version, self.player, width, height, self.frog_width, self.frog_height,
+         fly_width, fly_height, self.fly_step) = WELCOME.unpack(await read_frame(self.reader))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"server does not speak multiplayer protocol version {VERSION}")
+
+        game_state = self.game_state
+        game_state.screen_width, game_state.screen_height = width, height
+        game_state.obstacles.build(width, height)
+        game_state.fly_width, game_state.fly_height = fly_width, fly_height
+        prepare_fly_sprites(fly_width, fly_height)
+        await self.receive()
+
+    async def receive(self):
+        """
+        Waits for the next update from the server and applies it.
+
+        Returns:
+            bool: False if the server closed the connection, e.g. because the game is over.
+        """
+        try:
+            message = await read_frame(self.reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return False
+        self.bytes_received += FRAME.size + len(message)
+        self.apply(message)
+        return True
+
+    def apply(self, message):
+        """
+        Applies an update message to the local game state.
+
+        Args:
+            message (bytes): The update message.
+        """
+        game_state = self.game_state
+        tick, countdown_time, player_count, update_count, removal_count, catch_count = UPDATE.unpack_from(message)
+        offset = UPDATE.size
+        game_state.tick = self.tick = tick
+        game_state.countdown_time = countdown_time
+
+        # Frogs and scores
+        self.scores = []
+        for index, (x, y, score) in enumerate(PLAYER.iter_unpack(message[offset:offset + PLAYER.size * player_count])):
+            if index == len(self.frogs):
+                self.frogs.append(Frog(x, y, self.frog_width, self.frog_height))
+            frog = self.frogs[index]
+            frog.previous_x, frog.previous_y = frog.x, frog.y
+            frog.x, frog.y = x, y
+            self.scores.append(score)
+        offset += PLAYER.size * player_count
+        game_state.frog = self.frogs[self.player]
+        game_state.score = self.scores[self.player]
+
+        # Move every fly along its path before applying corrections, so they interpolate smoothly
+        flies = self.flies
+        for fly, base_tick, x, y, bits in flies.values():
+            fly.previous_x, fly.previous_y = fly.x, fly.y
+            fly.x, fly.y = predict(x, y, bits, self.fly_step * (tick - base_tick))
+
+        for fly_id, base_tick, x, y, bits in FLY_UPDATE.iter_unpack(
+                message[offset:offset + FLY_UPDATE.size * update_count]):
+            record = flies.get(fly_id)
+            if record is None:
+                fly = self.create_fly(bits)
+                record = flies[fly_id] = [fly, base_tick, x, y, bits]
+                fly.x, fly.y = predict(x, y, bits, self.fly_step * (tick - base_tick))
+                fly.previous_x, fly.previous_y = fly.x, fly.y
+            else:
+                fly = record[0]
+                record[1:] = base_tick, x, y, bits
+                fly.x, fly.y = predict(x, y, bits, self.fly_step * (tick - base_tick))
+            fly.movement.update(unpack_movement(bits))
+            fly.update_image()
+        offset += FLY_UPDATE.size * update_count
+
+        for fly_id, in REMOVAL.iter_unpack(message[offset:offset + REMOVAL.size * removal_count]):
+            game_state.fly_pool.release(flies.pop(fly_id)[0])
+        offset += REMOVAL.size * removal_count
+
+        current_time = pygame.time.get_ticks()
+        for fly_id, _ in CATCH.iter_unpack(message[offset:offset + CATCH.size * catch_count]):
+            fly = flies.pop(fly_id)[0]
+            game_state.score_popups.add(fly.x, fly.y, current_time, isinstance(fly, SpecialFly))
+            game_state.fly_pool.release(fly)
+
+        game_state.flies = [record[0] for record in flies.values()]
+
+    def create_fly(self, bits):
+        """
+        Takes a fly object from the pool, or creates one, to show a fly the server spawned.
+
+        Args:
+            bits (int): The fly's movement bits and special flag.
+
+        Returns:
+            Fly: The fly, facing left. The caller sets its position and movement.
+        """
+        game_state = self.game_state
+        fly_class = SpecialFly if bits & SPECIAL else Fly
+        fly = game_state.fly_pool.reuse(fly_class, game_state.screen_width, game_state.screen_height,
+                                        game_state.fly_width, game_state.fly_height, rng=SCRATCH_RNG)
+        fly.width, fly.height = game_state.fly_width, game_state.fly_height
+        fly.facing_left = True
+        fly.img = get_scaled_sprite(fly.img_left, "left", fly.width, fly.height)
+        return fly
+
+    def send_movement(self, movement):
+        """
+        Sends this player's pressed arrow keys to the server.
+
+        Args:
+            movement (dict): Movement directions (`left`, `right`, `up`, `down`) set to True or False.
+        """
+        self.writer.write(bytes((movement_bits(movement),)))
+
+    def draw(self, screen_manager, alpha=1.0):
+        """
+        Renders the game with the usual renderer, followed by the other players' frogs.
+
+        Args:
+            screen_manager (ScreenManager): Manages the game screen.
+            alpha (float, optional): Progress from the previous update towards the current one. Defaults to 1.0.
+        """
+        start_time = pygame.time.get_ticks() - self.tick * 1000 // SIMULATION_RATE  # Countdown runs on game time
+        draw_game_objects(self.game_state, screen_manager, start_time, alpha, doreturn=False)
+        screen_manager.screen.blits([frog.blit_args(alpha) for index, frog in enumerate(self.frogs)
+                                     if index != self.player], doreturn=False)
+
+    async def play(self, screen_manager):
+        """
+        Runs the client's window until the server ends the game or the window is closed.
+
+        Args:
+            screen_manager (ScreenManager): Manages the game screen. Resizing is not supported.
+        """
+        controls = Frog(0, 0, 0, 0)  # Tracks the pressed arrow keys
+        receiving = asyncio.create_task(self.receive_all())
+        received_at = pygame.time.get_ticks()
+        last_tick = self.tick
+        period = 1000 / SIMULATION_RATE
+
+        while not receiving.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    receiving.cancel()
+                    return
+                if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                    handle_key_event(event, controls, event.type == pygame.KEYDOWN)
+                    self.send_movement(controls.movement)
+
+            if self.tick != last_tick:
+                last_tick, received_at = self.tick, pygame.time.get_ticks()
+            alpha = min(1.0, (pygame.time.get_ticks() - received_at) / period)
+
+            self.draw(screen_manager, alpha)
+            screen_manager.present()
+            await asyncio.sleep(1 / FRAME_RATE)
+
+    async def receive_all(self):
+        """
+        Applies updates until the server closes the connection.
+        """
+        while await self.receive():
+            pass
+
+    async def close(self):
+        """
+        Leaves the game.
+        """
+        if self.writer is not None:
+            self.writer.close()
+
+async def serve(host, port, seed=None):
+    """
+    Runs one multiplayer game, waiting for the first player before starting the clock.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        seed (int, optional): Seed for the session. Defaults to None.
+    """
+    server = GameServer(seed=seed)
+    port = await server.start(host, port)
+    print(f"Waiting for players on {host}:{port}")
+    while not server.players:
+        await asyncio.sleep(0.1)
+    await server.run()
+    print("Scores: " + ", ".join(str(player.score) for player in server.players))
+    print(f"Sent {server.bytes_sent} bytes in {server.game_state.tick} steps")
+    await server.close()
+
+async def join(host, port):
+    """
+    Plays a multiplayer game in a window.
+
+    Args:
+        host (str): The server's address.
+        port (int): The server's port.
+    """
+    from screen_manager import ScreenManager  # Opens the window, only needed by players
+
+    screen_manager = ScreenManager()
+    client = GameClient()
+    await client.connect(host, port)
+    await client.play(screen_manager)
+    await client.close()
+
+def main():
+    """
+    Serves a local multiplayer game or joins one, as chosen on the command line.
+    """
+    parser = argparse.ArgumentParser(description="Play Fly Catcher with several frogs on one machine.")
+    parser.add_argument("mode", choices=("serve", "join"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=MULTIPLAYER_PORT)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        asyncio.run(serve(args.host, args.port, args.seed))
+    else:
+        asyncio.run(join(args.host, args.port))
+
+if __name__ == "__main__":
+    main()
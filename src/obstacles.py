@@ -0,0 +1,82 @@
+from constants import OBSTACLE_LAYOUT, SPATIAL_HASH_CELL_SIZE
+
+class ObstacleGrid:
+    def __init__(self, layout=OBSTACLE_LAYOUT, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """
+        Initializes a static grid of the obstacles that block the frog and flies.
+
+        Obstacles never move, so each grid cell keeps a tuple of the obstacles overlapping it. The
+        grid is built once per layout and screen size, after which checking a sprite against
+        the obstacles only looks at the few cells under it, however many obstacles there are.
+
+        Args:
+            layout (tuple, optional): The obstacles as (x, y, width, height) fractions of the screen size.
+                                      Defaults to OBSTACLE_LAYOUT.
+            cell_size (float, optional): The width and height of each grid cell in pixels.
+                                         Defaults to SPATIAL_HASH_CELL_SIZE.
+        """
+        self.layout = layout
+        self.cell_size = cell_size
+        self.rects = []  # (x, y, width, height) of every obstacle in pixels
+        self.cells = {}  # (column, row) -> obstacles overlapping the cell
+        self.columns, self.rows = 0, 0  # Extent of the grid's occupied cells
+        self.screen_size = None
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def build(self, screen_width, screen_height, layout=None):
+        """
+        Places the obstacles on a screen and indexes them. Does nothing if neither the layout
+        nor the screen size changed since the last build.
+
+        Args:
+            screen_width (int): The width of the screen.
+            screen_height (int): The height of the screen.
+            layout (tuple, optional): A new layout, e.g. for another level. Defaults to None, which keeps the current one.
+        """
+        if layout is not None and layout != self.layout:
+            self.layout = layout
+            self.screen_size = None
+        if self.screen_size == (screen_width, screen_height):
+            return
+        self.screen_size = (screen_width, screen_height)
+
+        self.rects = [(x * screen_width, y * screen_height, width * screen_width, height * screen_height)
+                      for x, y, width, height in self.layout]
+        cells = {}
+        size = self.cell_size
+        for rect in self.rects:
+            x, y, width, height = rect
+            for column in range(int(x // size), int((x + width) // size) + 1):
+                for row in range(int(y // size), int((y + height) // size) + 1):
+                    cells.setdefault((column, row), []).append(rect)
+        self.cells = {cell: tuple(rects) for cell, rects in cells.items()}
+        self.columns = max((column + 1 for column, _ in self.cells), default=0)
+        self.rows = max((row + 1 for _, row in self.cells), default=0)
+
+    def blocking(self, x, y, width, height):
+        """
+        Finds an obstacle overlapping a rectangle. Touching an obstacle's edge does not count.
+
+        Args:
+            x (float): The x-coordinate of the rectangle.
+            y (float): The y-coordinate of the rectangle.
+            width (float): The width of the rectangle.
+            height (float): The height of the rectangle.
+
+        Returns:
+            tuple: The (x, y, width, height) of an overlapping obstacle, or None if the rectangle is free.
+        """
+        size = self.cell_size
+        right, bottom = x + width, y + height
+        cells = self.cells
+        for column in range(int(x // size), int(right // size) + 1):
+            for row in range(int(y // size), int(bottom // size) + 1):
+                for rect in cells.get((column, row), ()):
+                    if x < rect[0] + rect[2] and rect[0] < right and y < rect[1] + rect[3] and rect[1] < bottom:
+                        return rect
+        return None
@@ -0,0 +1,135 @@
+from array import array
+from constants import GOLD_COLOR, GRAY_COLOR, POPUP_CAPACITY, POPUP_DURATION, POPUP_FADE_STEPS
+from font_manager import FONT_MANAGER
+
+class PopupBuffer:
+    def __init__(self, capacity=POPUP_CAPACITY):
+        """
+        Initializes a fixed-capacity ring buffer of score popups.
+
+        Popups are stored as parallel arrays instead of one dictionary each. They are added in
+        time order, so the oldest popup is always the next one to expire. Once the buffer is
+        full, a new popup replaces the oldest one.
+
+        Args:
+            capacity (int, optional): Maximum number of popups shown at once. Defaults to POPUP_CAPACITY.
+        """
+        self.capacity = capacity
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.time = array('q', bytes(8 * capacity))  # Pygame ticks when the popup was created
+        self.special = array('b', bytes(capacity))
+        self.start = 0  # Index of the oldest popup
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """
+        Iterates over the popups, oldest first.
+
+        Returns:
+            iterator: (x, y, time, special) tuples.
+        """
+        for i in range(self.count):
+            index = (self.start + i) % self.capacity
+            yield self.x[index], self.y[index], self.time[index], bool(self.special[index])
+
+    def add(self, x, y, time, special):
+        """
+        Adds a popup, replacing the oldest one if the buffer is full.
+
+        Args:
+            x (float): The x-coordinate of the caught fly.
+            y (float): The y-coordinate of the caught fly.
+            time (int): The Pygame ticks when the fly was caught.
+            special (bool): Whether it's a special popup (+5s) or a normal one (+1).
+        """
+        if self.count == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+            self.count -= 1
+
+        index = (self.start + self.count) % self.capacity
+        self.x[index] = x
+        self.y[index] = y
+        self.time[index] = time
+        self.special[index] = special
+        self.count += 1
+
+    def expire(self, current_time, duration=POPUP_DURATION):
+        """
+        Drops the popups that have been shown for their full duration.
+
+        Args:
+            current_time (int): The current Pygame ticks.
+            duration (int, optional): How long a popup is shown in milliseconds. Defaults to POPUP_DURATION.
+        """
+        while self.count and current_time - self.time[self.start] >= duration:
+            self.start = (self.start + 1) % self.capacity
+            self.count -= 1
+
+    def clear(self):
+        """
+        Removes all popups.
+        """
+        self.start = 0
+        self.count = 0
+
+class PopupLabels:
+    def __init__(self, fade_steps=POPUP_FADE_STEPS):
+        """
+        Initializes a cache of the pre-rendered "+1" and "+5s" popup labels for the current font size.
+
+        Fading popups reuse one translucent copy of a label per fade step, so the fade-out
+        never renders text or creates surfaces once every step was drawn.
+
+        Args:
+            fade_steps (int, optional): Number of opacity levels a popup fades through, 1 disables fading.
+                                        Defaults to POPUP_FADE_STEPS.
+        """
+        self.fade_steps = fade_steps
+        self.font_size = None
+        self.surfaces = {}  # (special, fade step) -> label surface
+
+    def prepare(self, font_size):
+        """
+        Renders both labels for a font size, dropping the labels of the previous size.
+
+        Args:
+            font_size (int): The popup font size, derived from the screen height.
+        """
+        self.font_size = font_size
+        self.surfaces = {
+            (False, 0): FONT_MANAGER.render("+1", font_size, GRAY_COLOR),
+            (True, 0): FONT_MANAGER.render("+5s", font_size, GOLD_COLOR)
+        }
+
+    def get(self, special, font_size, age=0, duration=POPUP_DURATION):
+        """
+        Returns the label of a popup, faded according to its age.
+
+        Args:
+            special (bool): Whether it's a special popup (+5s) or a normal one (+1).
+            font_size (int): The popup font size.
+            age (int, optional): How long the popup has been shown in milliseconds. Defaults to 0.
+            duration (int, optional): How long a popup is shown in milliseconds. Defaults to POPUP_DURATION.
+
+        Returns:
+            pygame.Surface: The shared label surface. Callers must not draw onto it.
+        """
+        if font_size != self.font_size:
+            self.prepare(font_size)
+
+        step = min(self.fade_steps - 1, age * self.fade_steps // duration) if self.fade_steps > 1 else 0
+        surface = self.surfaces.get((special, step))
+
+        if surface is None:
+            surface = self.surfaces[(special, 0)].copy()
+            surface.set_alpha(255 * (self.fade_steps - step) // self.fade_steps)
+            self.surfaces[(special, step)] = surface
+
+        return surface
+
+# Process-wide popup labels used by the renderer
+POPUP_LABELS = PopupLabels()
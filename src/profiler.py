@@ -0,0 +1,160 @@
+import time
+from array import array
+from constants import BLACK_COLOR, PROFILER_CAPACITY, PROFILER_DUMP_KEY, PROFILER_OVERLAY_KEY
+from font_manager import FONT_MANAGER
+
+# Phases of one frame of the game loop, in the order they run
+PHASES = ("events", "simulation", "rendering", "present", "tick")
+EVENTS, SIMULATION, RENDERING, PRESENT, TICK = range(len(PHASES))
+
+class FrameProfiler:
+    def __init__(self, capacity=PROFILER_CAPACITY):
+        """
+        Initializes a low-overhead profiler that keeps per-phase timings of the last frames in a ring buffer.
+
+        Args:
+            capacity (int, optional): Number of frames to keep. Defaults to PROFILER_CAPACITY.
+        """
+        self.capacity = capacity
+        self.durations = array('d', bytes(8 * capacity * len(PHASES)))  # Seconds, one row per frame
+        self.entity_counts = array('I', bytes(4 * capacity))
+        self.index = 0  # Next row to write
+        self.frames = 0  # Rows filled so far, up to capacity
+        self.last_mark = 0.0
+        self.show_overlay = False
+
+    def begin_frame(self):
+        """
+        Starts timing a new frame.
+        """
+        self.last_mark = time.perf_counter()
+        offset = self.index * len(PHASES)
+        for phase in range(len(PHASES)):
+            self.durations[offset + phase] = 0.0
+
+    def mark(self, phase):
+        """
+        Adds the time since the previous mark to a phase of the current frame.
+
+        Args:
+            phase (int): The phase that just finished (EVENTS, SIMULATION, RENDERING, PRESENT or TICK).
+        """
+        now = time.perf_counter()
+        self.durations[self.index * len(PHASES) + phase] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self, entity_count):
+        """
+        Finishes the current frame and advances the ring buffer.
+
+        Args:
+            entity_count (int): The number of flies alive during the frame.
+        """
+        self.entity_counts[self.index] = entity_count
+        self.index = (self.index + 1) % self.capacity
+        self.frames = min(self.frames + 1, self.capacity)
+
+    def rows(self):
+        """
+        Iterates over the recorded frames, oldest first.
+
+        Returns:
+            iterator: (durations, entity_count) pairs, with durations as a tuple of seconds per phase.
+        """
+        start = (self.index - self.frames) % self.capacity
+        for i in range(self.frames):
+            row = (start + i) % self.capacity
+            offset = row * len(PHASES)
+            yield tuple(self.durations[offset:offset + len(PHASES)]), self.entity_counts[row]
+
+    def frame_time_percentiles(self, percentiles=(50, 95, 99)):
+        """
+        Calculates percentiles of the total frame time over the recorded frames.
+
+        Args:
+            percentiles (tuple, optional): The percentiles to calculate. Defaults to (50, 95, 99).
+
+        Returns:
+            dict: Frame time in milliseconds for each percentile, or an empty dict before the first frame.
+        """
+        totals = sorted(sum(durations) for durations, _ in self.rows())
+        if not totals:
+            return {}
+        return {pct: totals[min(len(totals) - 1, len(totals) * pct // 100)] * 1000 for pct in percentiles}
+
+    def toggle_overlay(self):
+        """
+        Shows or hides the in-game overlay.
+        """
+        self.show_overlay = not self.show_overlay
+
+    def draw_overlay(self, screen, screen_height):
+        """
+        Draws rolling frame time percentiles, the last frame's phase timings and the entity count
+        in the top-right corner.
+
+        Args:
+            screen (pygame.Surface): The game screen to draw on.
+            screen_height (int): The height of the game screen, used for the font size.
+
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+        """
+        font = FONT_MANAGER.get_font(None, max(12, int(screen_height * 0.03)))
+        lines = [f"{PHASES[phase]} {seconds * 1000:5.2f} ms" for phase, seconds in enumerate(self.last_frame())]
+        lines.insert(0, " ".join(f"p{pct} {ms:5.1f}" for pct, ms in self.frame_time_percentiles().items()))
+        lines.append(f"flies {self.entity_counts[(self.index - 1) % self.capacity] if self.frames else 0}")
+
+        rect = None
+        y = 5
+        for line in lines:
+            text = font.render(line, True, BLACK_COLOR)  # Changes every frame, so not worth caching
+            line_rect = screen.blit(text, (screen.get_width() - text.get_width() - 10, y))
+            rect = line_rect if rect is None else rect.union(line_rect)
+            y += text.get_height()
+        return rect
+
+    def last_frame(self):
+        """
+        Returns the phase durations of the most recently finished frame.
+
+        Returns:
+            tuple: Seconds per phase, all zero before the first frame.
+        """
+        if not self.frames:
+            return (0.0,) * len(PHASES)
+        offset = ((self.index - 1) % self.capacity) * len(PHASES)
+        return tuple(self.durations[offset:offset + len(PHASES)])
+
+    def dump(self, path):
+        """
+        Exports the recorded frames as CSV, oldest first, with times in milliseconds.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, "w") as file:
+            file.write(",".join(f"{phase}_ms" for phase in PHASES) + ",total_ms,flies\n")
+            for durations, entity_count in self.rows():
+                values = [f"{seconds * 1000:.4f}" for seconds in durations]
+                values.append(f"{sum(durations) * 1000:.4f}")
+                values.append(str(entity_count))
+                file.write(",".join(values) + "\n")
+
+    def handle_key(self, key):
+        """
+        Handles the profiler hotkeys: toggling the overlay and dumping the buffer to a file.
+
+        Args:
+            key (int): The Pygame key code that was pressed.
+
+        Returns:
+            str: The path of the dump file if the buffer was dumped, otherwise None.
+        """
+        if key == PROFILER_OVERLAY_KEY:
+            self.toggle_overlay()
+        elif key == PROFILER_DUMP_KEY:
+            path = time.strftime("frame_profile_%Y%m%d_%H%M%S.csv")
+            self.dump(path)
+            return path
+        return None
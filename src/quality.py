@@ -0,0 +1,159 @@
+import logging
+from constants import (FRAME_RATE, QUALITY_DOWNGRADE_FRAMES, QUALITY_DOWNGRADE_RATIO, QUALITY_FLY_SHARE,
+                       QUALITY_HUD_INTERVAL, QUALITY_MIN_FRAME_RATE, QUALITY_SMOOTHING, QUALITY_UPGRADE_FRAMES,
+                       QUALITY_UPGRADE_RATIO)
+
+logger = logging.getLogger(__name__)
+
+# Rendering quality tiers, best first; each tier keeps the savings of the tiers above it
+TIERS = (
+    # Name, score popups drawn, sprites interpolated, HUD redrawn every n frames (with dirty-rect rendering),
+    # share of the regular flies drawn (None for all), frame rate target
+    ("full", True, True, 1, None, FRAME_RATE),
+    ("no popups", False, True, 1, None, FRAME_RATE),
+    ("no interpolation", False, False, QUALITY_HUD_INTERVAL, None, FRAME_RATE),
+    ("fewer flies", False, False, QUALITY_HUD_INTERVAL, QUALITY_FLY_SHARE, FRAME_RATE),
+    ("low frame rate", False, False, QUALITY_HUD_INTERVAL, QUALITY_FLY_SHARE, QUALITY_MIN_FRAME_RATE),
+)
+MAX_UPGRADE_FRAMES = 8 * QUALITY_UPGRADE_FRAMES  # Longest wait before retrying a tier that was too slow
+SPIKE_LIMIT = 4  # Frames longer than this many budgets are counted as this long
+
+class QualityGovernor:
+    def __init__(self, budget_ms=1000 / FRAME_RATE):
+        """
+        Initializes a governor that lowers rendering quality one tier at a time while frames
+        take longer than the budget, and raises it again once there is headroom.
+
+        Frame times are smoothed, and a tier only changes after the smoothed time stayed past its
+        threshold for a number of consecutive frames. Lowering quality takes half a second of slow
+        frames, raising it three seconds of fast ones, and the two thresholds are far apart, so the
+        quality does not flip back and forth. A tier that had to be lowered again right after being
+        raised is retried only after twice as long. Tiers with a lower frame rate target count frames
+        as slow against their own target, but are only left once the full budget has headroom.
+
+        Args:
+            budget_ms (float, optional): Time one frame may take, in milliseconds. Defaults to 1000 / FRAME_RATE.
+        """
+        self.budget_ms = budget_ms
+        self.tier = 0
+        self.frame_ms = budget_ms  # Smoothed time between frames, including the frame rate limit's sleep
+        self.work_ms = budget_ms  # Smoothed time spent on frames, excluding the sleep
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.upgrade_frames = QUALITY_UPGRADE_FRAMES
+        self.last_upgrade = None  # Tier raised from in the last change, if the last change was an upgrade
+        self.frames = 0
+        self.transitions = []  # (frame, old tier, new tier, smoothed frame time) of every change
+
+    @property
+    def name(self):
+        """
+        str: The current tier's name.
+        """
+        return TIERS[self.tier][0]
+
+    @property
+    def popups(self):
+        """
+        bool: Whether score popups are drawn.
+        """
+        return TIERS[self.tier][1]
+
+    @property
+    def interpolate(self):
+        """
+        bool: Whether sprites are drawn between simulation steps, rather than at the latest step.
+        """
+        return TIERS[self.tier][2]
+
+    @property
+    def hud_interval(self):
+        """
+        int: Number of frames the score and time text is redrawn after.
+        """
+        return TIERS[self.tier][3]
+
+    @property
+    def fly_share(self):
+        """
+        float: The share of the regular flies drawn, or None to draw every fly.
+        """
+        return TIERS[self.tier][4]
+
+    @property
+    def frame_rate(self):
+        """
+        int: The frame rate target, for `pygame.time.Clock.tick`.
+        """
+        return TIERS[self.tier][5]
+
+    def hud_due(self):
+        """
+        Checks if the HUD should be redrawn this frame. Renderers that repaint only what changed
+        leave the HUD on the screen in between.
+
+        Returns:
+            bool: True if the HUD is redrawn this frame.
+        """
+        return self.frames % self.hud_interval == 0
+
+    def record(self, frame_ms, work_ms=None):
+        """
+        Adds a frame's timing, changing the quality tier if the frame times call for it.
+
+        Args:
+            frame_ms (float): Time since the previous frame, e.g. the return value of `pygame.time.Clock.tick`.
+            work_ms (float, optional): Part of that time spent working rather than waiting for the frame rate limit,
+                                       e.g. `pygame.time.Clock.get_rawtime`. Defaults to `frame_ms`.
+
+        Returns:
+            bool: True if the quality tier changed.
+        """
+        if work_ms is None:
+            work_ms = frame_ms
+        self.frames += 1
+
+        # A single hitch (loading, a dragged window) must not lower the quality on its own
+        limit = SPIKE_LIMIT * self.budget_ms
+        self.frame_ms += QUALITY_SMOOTHING * (min(frame_ms, limit) - self.frame_ms)
+        self.work_ms += QUALITY_SMOOTHING * (min(work_ms, limit) - self.work_ms)
+
+        if self.frame_ms > max(self.budget_ms, 1000 / self.frame_rate) * QUALITY_DOWNGRADE_RATIO:
+            self.slow_frames += 1
+            self.fast_frames = 0
+        elif self.work_ms < self.budget_ms * QUALITY_UPGRADE_RATIO:
+            self.fast_frames += 1
+            self.slow_frames = 0
+        else:
+            self.slow_frames = self.fast_frames = 0
+
+        if self.slow_frames >= QUALITY_DOWNGRADE_FRAMES and self.tier < len(TIERS) - 1:
+            if self.last_upgrade == self.tier + 1:
+                # The tier just left was too slow again, wait longer before the next attempt
+                self.upgrade_frames = min(2 * self.upgrade_frames, MAX_UPGRADE_FRAMES)
+            self.change_tier(self.tier + 1)
+            self.last_upgrade = None
+            return True
+
+        if self.fast_frames >= self.upgrade_frames and self.tier > 0:
+            self.last_upgrade = self.tier
+            self.change_tier(self.tier - 1)
+            return True
+
+        return False
+
+    def change_tier(self, tier):
+        """
+        Switches to another quality tier and logs the transition.
+
+        Args:
+            tier (int): The position of the new tier in TIERS.
+        """
+        logger.info("%s quality from %r to %r at %.1f ms per frame (%.1f ms of work, budget %.1f ms)",
+                    "Lowering" if tier > self.tier else "Raising", self.name, TIERS[tier][0],
+                    self.frame_ms, self.work_ms, self.budget_ms)
+        self.transitions.append((self.frames, self.tier, tier, self.frame_ms))
+        self.tier = tier
+        self.slow_frames = self.fast_frames = 0
+        # Judge the new tier on its own frames
+        self.frame_ms = self.work_ms = self.budget_ms
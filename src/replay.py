@@ -0,0 +1,186 @@
+import struct
+import pygame
+from constants import BASE_TICK_RATE, OBSTACLE_LAYOUT, SIMULATION_RATE
+from event_handler import handle_key_event, handle_resize
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from screen_manager import ScreenManager
+
+HEADER = struct.Struct("<4sHIHHHIH")  # Magic, version, seed, width, height, simulation rate, ticks, obstacle count
+OBSTACLE = struct.Struct("<4d")  # X, y, width and height as fractions of the screen size
+RECORD = struct.Struct("<IBHH")  # Tick, kind, two event-specific values
+MAGIC = b"FCRS"
+# Version 1 recorded fly spawns, which the game state's scheduler now replays by itself. Version 2
+# had no obstacles, which the frog and flies now collide with, so it replays differently
+VERSION = 3
+
+# Record kinds
+KEY = 1  # Values: direction index into KEY_DIRECTIONS, 1 if pressed else 0
+RESIZE = 3  # Values: new width, new height
+
+# Only the arrow keys affect the simulation
+KEY_DIRECTIONS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_UP)
+
+class SessionRecorder:
+    def __init__(self, seed, screen_width, screen_height, simulation_rate=SIMULATION_RATE,
+                 obstacle_layout=OBSTACLE_LAYOUT):
+        """
+        Initializes a compact recording of everything needed to re-simulate a session.
+
+        Each event is stored as a fixed-size RECORD tagged with the simulation tick it was
+        applied before, so the session can be replayed without any wall-clock timing.
+
+        Args:
+            seed (int): The session's random seed (GameState.seed).
+            screen_width (int): The width of the screen when the session started.
+            screen_height (int): The height of the screen when the session started.
+            simulation_rate (int, optional): Simulation steps per second. Defaults to SIMULATION_RATE.
+            obstacle_layout (tuple, optional): The session's obstacles, see ObstacleGrid. Defaults to OBSTACLE_LAYOUT.
+        """
+        self.seed = seed
+        self.screen_width = int(screen_width)
+        self.screen_height = int(screen_height)
+        self.simulation_rate = simulation_rate
+        self.obstacle_layout = tuple(tuple(obstacle) for obstacle in obstacle_layout)
+        self.ticks = 0
+        self.records = bytearray()
+
+    def __len__(self):
+        return len(self.records) // RECORD.size
+
+    def record_key(self, tick, key, is_pressed):
+        """
+        Records an arrow key press or release. Other keys are ignored.
+
+        Args:
+            tick (int): The number of simulation steps completed when the key event was handled.
+            key (int): The Pygame key code.
+            is_pressed (bool): Whether the key was pressed or released.
+        """
+        if key in KEY_DIRECTIONS:
+            self.records += RECORD.pack(tick, KEY, KEY_DIRECTIONS.index(key), int(is_pressed))
+
+    def record_resize(self, tick, screen_width, screen_height):
+        """
+        Records a window resize.
+
+        Args:
+            tick (int): The number of simulation steps completed when the window was resized.
+            screen_width (int): The new width of the screen.
+            screen_height (int): The new height of the screen.
+        """
+        self.records += RECORD.pack(tick, RESIZE, screen_width, screen_height)
+
+    def finish(self, ticks):
+        """
+        Stores the length of the session.
+
+        Args:
+            ticks (int): The number of simulation steps the session ran for.
+        """
+        self.ticks = ticks
+
+    def events(self):
+        """
+        Iterates over the recorded events in order.
+
+        Returns:
+            iterator: (tick, kind, value1, value2) tuples.
+        """
+        return RECORD.iter_unpack(self.records)
+
+    def save(self, path):
+        """
+        Writes the recording to a file.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.screen_width, self.screen_height,
+                                   self.simulation_rate, self.ticks, len(self.obstacle_layout)))
+            file.writelines(OBSTACLE.pack(*obstacle) for obstacle in self.obstacle_layout)
+            file.write(self.records)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a recording written by `save`.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            SessionRecorder: The loaded recording.
+
+        Raises:
+            ValueError: If the file is not a session recording of a supported version.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a session recording")
+
+        magic, version, seed, width, height, simulation_rate, ticks, obstacle_count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} session recording")
+
+        records_start = HEADER.size + OBSTACLE.size * obstacle_count
+        obstacle_layout = tuple(OBSTACLE.iter_unpack(data[HEADER.size:records_start]))
+        recording = cls(seed, width, height, simulation_rate, obstacle_layout)
+        recording.ticks = ticks
+        recording.records = bytearray(data[records_start:])
+        return recording
+
+def apply_recorded_event(kind, value1, value2, game_state, screen_manager):
+    """
+    Applies one recorded event to a game state, the same way handle_events applied it live.
+
+    Args:
+        kind (int): The record kind (KEY or RESIZE).
+        value1 (int): The first event-specific value.
+        value2 (int): The second event-specific value.
+        game_state (GameState): The game state being re-simulated.
+        screen_manager (ScreenManager): The headless screen manager of the replay.
+    """
+    if kind == KEY:
+        event = pygame.event.Event(pygame.KEYDOWN if value2 else pygame.KEYUP, key=KEY_DIRECTIONS[value1])
+        handle_key_event(event, game_state.frog, bool(value2))
+    elif kind == RESIZE:
+        handle_resize(pygame.event.Event(pygame.VIDEORESIZE, w=value1, h=value2), game_state, screen_manager)
+
+def replay_session(recording, use_swarm=False, on_step=None):
+    """
+    Re-simulates a recorded session headlessly, as fast as possible.
+
+    Args:
+        recording (SessionRecorder): The recording to play back.
+        use_swarm (bool, optional): Whether the session used the FlySwarm backend. Defaults to False.
+        on_step (callable, optional): Called with the game state after every simulation step. Defaults to None.
+
+    Returns:
+        GameState: The game state at the end of the session.
+    """
+    screen_manager = ScreenManager(headless=True)
+    screen_manager.resize(recording.screen_width, recording.screen_height)
+
+    game_state = GameState(use_swarm=use_swarm)
+    game_state.obstacles.build(screen_manager.width, screen_manager.height, recording.obstacle_layout)
+    game_state.reset(screen_manager.width, screen_manager.height, seed=recording.seed)
+    dt = BASE_TICK_RATE / recording.simulation_rate
+
+    events = recording.events()
+    pending = next(events, None)
+
+    while game_state.tick < recording.ticks:
+        # Apply the events handled before this step
+        while pending is not None and pending[0] <= game_state.tick:
+            apply_recorded_event(*pending[1:], game_state, screen_manager)
+            pending = next(events, None)
+
+        update_frog_and_flies(game_state, screen_manager.width, screen_manager.height, dt)
+        if on_step:
+            on_step(game_state)
+
+    return game_state
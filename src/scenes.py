@@ -0,0 +1,211 @@
+import os
+import pygame
+from constants import (BACKGROUND_COLOR, BLACK_COLOR, FOCUS_PAUSE, GAME_OVER_SCENE, GAMEPLAY_SCENE, KEY_PAUSE,
+                       PAUSE_KEYS, PAUSED_SCENE, SESSION_RECORDING_DIR, SPECTATOR_LOG_DIR)
+from event_handler import handle_key_event, handle_resize
+from font_manager import FONT_MANAGER
+from game_loop import GameplayScene
+from game_over import game_over
+from game_state import GameState
+from replay import SessionRecorder
+from snapshot import restore_snapshot, take_snapshot
+from spectator_log import SpectatorLog
+from ui_renderer import draw_game_objects
+
+def draw_pause_screen(game_state, screen_manager, start_time):
+    """
+    Draws the paused game under a translucent veil with a hint how to resume.
+
+    Args:
+        game_state (GameState): The paused game.
+        screen_manager (ScreenManager): Manages the game screen.
+        start_time (int): The gameplay scene's start time, for the countdown.
+    """
+    screen = screen_manager.screen
+    draw_game_objects(game_state, screen_manager, start_time, doreturn=False)
+
+    veil = pygame.Surface(screen.get_size())
+    veil.fill(BACKGROUND_COLOR)
+    veil.set_alpha(160)
+    screen.blit(veil, (0, 0))
+
+    center_x, center_y = screen_manager.width // 2, screen_manager.height // 2
+    title = FONT_MANAGER.render("PAUSED", 80, BLACK_COLOR)
+    screen.blit(title, title.get_rect(center=(center_x, center_y - 30)))
+    hint = FONT_MANAGER.render("Press P to resume", 32, BLACK_COLOR)
+    screen.blit(hint, hint.get_rect(center=(center_x, center_y + 30)))
+    screen_manager.present()
+
+def paused(gameplay, reason=KEY_PAUSE):
+    """
+    Runs the paused scene: game time and the game state's scheduler stop, and the thread sleeps
+    until the next event, redrawing only when the window changes.
+
+    A pause caused by the window losing focus ends when it regains focus; any pause ends with a pause key.
+
+    Args:
+        gameplay (GameplayScene): The paused gameplay scene.
+        reason (str, optional): Why the game was paused, KEY_PAUSE or FOCUS_PAUSE. Defaults to KEY_PAUSE.
+
+    Returns:
+        str: The next scene, GAMEPLAY_SCENE.
+    """
+    game_state, screen_manager, recorder = gameplay.game_state, gameplay.screen_manager, gameplay.recorder
+    paused_at = pygame.time.get_ticks()
+    game_state.scheduler.pause()
+    draw_pause_screen(game_state, screen_manager, gameplay.start_time + pygame.time.get_ticks() - paused_at)
+
+    while True:
+        event = pygame.event.wait()
+
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            exit()
+
+        if (reason == FOCUS_PAUSE and event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED)) or \
+                (event.type == pygame.KEYDOWN and event.key in PAUSE_KEYS):
+            break
+
+        if event.type == pygame.VIDEORESIZE:
+            handle_resize(event, game_state, screen_manager)
+            if recorder is not None:
+                recorder.record_resize(game_state.tick, event.w, event.h)
+
+        if event.type == pygame.KEYUP:
+            # Keys released while paused must not keep the frog moving afterwards
+            handle_key_event(event, game_state.frog, False)
+            if recorder is not None:
+                recorder.record_key(game_state.tick, event.key, False)
+
+        if event.type in (pygame.VIDEORESIZE, pygame.WINDOWEXPOSED):
+            draw_pause_screen(game_state, screen_manager, gameplay.start_time + pygame.time.get_ticks() - paused_at)
+
+    game_state.scheduler.resume()
+    gameplay.resume(pygame.time.get_ticks() - paused_at)
+    return GAMEPLAY_SCENE
+
+class SceneManager:
+    def __init__(self, screen_manager, game_state, dirty_rects=False, profiler=None, snapshots=None,
+                 score_store=None, governor=None):
+        """
+        Initializes the state machine that moves between the gameplay, paused and game over
+        scenes, and restarts the game whenever the player chooses to play again.
+
+        Args:
+            screen_manager (ScreenManager): Manages the game screen.
+            game_state (GameState): The game state, reset for every session.
+            dirty_rects (bool, optional): Whether gameplay repaints only the areas that changed. Defaults to False.
+            profiler (FrameProfiler, optional): Records how long each phase of every frame takes. Defaults to None.
+            snapshots (SnapshotRing, optional): Recent game states; the latest is written out if the game crashes.
+                                                Defaults to None.
+            score_store (ScoreStore, optional): Records final scores for the leaderboard. Defaults to None.
+            governor (QualityGovernor, optional): Adapts rendering quality to the machine, kept across sessions.
+                                                  Defaults to None.
+        """
+        self.screen_manager = screen_manager
+        self.game_state = game_state
+        self.dirty_rects = dirty_rects
+        self.profiler = profiler
+        self.snapshots = snapshots
+        self.score_store = score_store
+        self.governor = governor
+        self.gameplay = None
+        self.recorder = None
+        self.spectator_log = None
+        self.spare_state = None  # Resets the next session's game while the game over screen is shown
+        self.next_session = None  # Snapshot of the next session's initial state
+
+    def prepare_next_session(self):
+        """
+        Builds the next session's initial state ahead of time, so playing again only restores a snapshot.
+        """
+        if self.spare_state is None:
+            self.spare_state = GameState(use_swarm=self.game_state.swarm is not None)
+        self.spare_state.reset(self.screen_manager.width, self.screen_manager.height)
+        self.next_session = take_snapshot(self.spare_state)
+
+    def start_session(self):
+        """
+        Resets the game and opens the session's recording and spectator log, if enabled.
+
+        The game starts from the state prepared by `prepare_next_session`, unless there is none
+        or the window was resized since.
+
+        Returns:
+            str: The first scene of the session, GAMEPLAY_SCENE.
+        """
+        screen_manager, game_state = self.screen_manager, self.game_state
+        spare = self.spare_state
+        if self.next_session is not None and \
+                (spare.screen_width, spare.screen_height) == (screen_manager.width, screen_manager.height):
+            restore_snapshot(game_state, self.next_session)
+        else:
+            game_state.reset(screen_manager.width, screen_manager.height)
+        self.next_session = None
+        if self.snapshots is not None:
+            self.snapshots.clear()
+
+        self.recorder = None
+        if SESSION_RECORDING_DIR:
+            self.recorder = SessionRecorder(game_state.seed, screen_manager.width, screen_manager.height,
+                                            obstacle_layout=game_state.obstacles.layout)
+
+        self.spectator_log = None
+        if SPECTATOR_LOG_DIR:
+            os.makedirs(SPECTATOR_LOG_DIR, exist_ok=True)
+            self.spectator_log = SpectatorLog(os.path.join(SPECTATOR_LOG_DIR, f"session_{game_state.seed}.fcl"),
+                                              screen_manager.width, screen_manager.height,
+                                              obstacle_layout=game_state.obstacles.layout)
+
+        self.gameplay = GameplayScene(screen_manager, game_state, dirty_rects=self.dirty_rects, recorder=self.recorder,
+                                      profiler=self.profiler, snapshots=self.snapshots,
+                                      spectator_log=self.spectator_log, governor=self.governor)
+        return GAMEPLAY_SCENE
+
+    def end_session(self):
+        """
+        Saves the session's recording and closes its spectator log.
+        """
+        if self.spectator_log is not None:
+            self.spectator_log.close()
+            self.spectator_log = None
+
+        if self.recorder is not None:
+            self.recorder.finish(self.game_state.tick)
+            os.makedirs(SESSION_RECORDING_DIR, exist_ok=True)
+            self.recorder.save(os.path.join(SESSION_RECORDING_DIR, f"session_{self.game_state.seed}.fcr"))
+            self.recorder = None
+
+    def game_over(self):
+        """
+        Runs the game over scene until the player chooses to play again.
+
+        Returns:
+            str: The first scene of the next session, GAMEPLAY_SCENE.
+        """
+        self.end_session()
+        self.prepare_next_session()
+        game_over(self.screen_manager, self.game_state.score, self.score_store)
+        return self.start_session()
+
+    def run(self):
+        """
+        Runs scenes until the player quits, which exits the process.
+        """
+        scenes = {
+            GAMEPLAY_SCENE: lambda: self.gameplay.run(),
+            PAUSED_SCENE: lambda: paused(self.gameplay, self.gameplay.pause_reason),
+            GAME_OVER_SCENE: self.game_over
+        }
+        scene = self.start_session()
+
+        try:
+            while True:
+                scene = scenes[scene]()
+        except Exception:
+            if self.snapshots is not None and len(self.snapshots):
+                self.snapshots.dump(f"crash_{self.game_state.seed}.fcs")
+            raise
+        finally:
+            if self.spectator_log is not None:
+                self.spectator_log.close()  # Also when the window is closed during the game
@@ -0,0 +1,126 @@
+import heapq
+from itertools import count
+from constants import SIMULATION_RATE
+
+def ms_to_ticks(milliseconds, simulation_rate=SIMULATION_RATE):
+    """
+    Converts a duration in milliseconds to whole simulation steps.
+
+    Args:
+        milliseconds (float): The duration in milliseconds.
+        simulation_rate (int, optional): Simulation steps per second. Defaults to SIMULATION_RATE.
+
+    Returns:
+        int: The duration in simulation steps, at least 1.
+    """
+    return max(1, round(milliseconds * simulation_rate / 1000))
+
+class Scheduler:
+    def __init__(self):
+        """
+        Initializes a scheduler of timed game events, measured in simulation steps rather than
+        wall-clock time, so events pause with the game and replay deterministically.
+
+        Events are kept in a binary heap ordered by due time. Events due at the same time run
+        in the order they were scheduled.
+        """
+        self.time = 0  # Simulation steps advanced so far
+        self.paused = False
+        self.queue = []  # Heap of [due time, sequence number, callback, interval] entries
+        self.sequence = count()
+        self.active = 0
+
+    def __len__(self):
+        return self.active
+
+    def schedule(self, delay, callback, interval=None):
+        """
+        Schedules a callback to run after a delay, and optionally every interval after that.
+
+        Args:
+            delay (int): Simulation steps from now until the first run, at least 1.
+            callback (callable): Called without arguments when the event is due.
+            interval (int, optional): Simulation steps between repeated runs. Defaults to None, which runs once.
+
+        Returns:
+            list: A handle that can be passed to `cancel`.
+        """
+        entry = [self.time + max(1, delay), next(self.sequence), callback, interval]
+        heapq.heappush(self.queue, entry)
+        self.active += 1
+        return entry
+
+    def cancel(self, handle):
+        """
+        Cancels a scheduled event. Cancelling an event that already ran once (and does not repeat) does nothing.
+
+        Args:
+            handle (list): The handle returned by `schedule`.
+        """
+        if handle[2] is not None:
+            handle[2] = None  # Dropped lazily when it reaches the top of the heap
+            self.active -= 1
+
+    def advance(self, steps=1):
+        """
+        Moves game time forward and runs every event that became due, in order.
+        Does nothing while the scheduler is paused.
+
+        Args:
+            steps (int, optional): Simulation steps to advance. Defaults to 1.
+
+        Returns:
+            int: The number of events that ran.
+        """
+        if self.paused:
+            return 0
+
+        self.time += steps
+        queue = self.queue
+        ran = 0
+
+        while queue and queue[0][0] <= self.time:
+            entry = queue[0]
+            callback, interval = entry[2], entry[3]
+
+            if callback is None:
+                heapq.heappop(queue)
+                continue
+
+            if interval:
+                # Reuse the entry for the next run; the sequence number keeps ties in scheduling order
+                entry[0] += interval
+                entry[1] = next(self.sequence)
+                heapq.heapreplace(queue, entry)
+            else:
+                heapq.heappop(queue)
+                entry[2] = None
+                self.active -= 1
+
+            callback()
+            ran += 1
+
+        return ran
+
+    def pause(self):
+        """
+        Stops game time, so no events run until `resume` is called.
+        """
+        self.paused = True
+
+    def resume(self):
+        """
+        Restarts game time after `pause`.
+        """
+        self.paused = False
+
+    def clear(self):
+        """
+        Cancels every event and restarts game time from zero.
+        """
+        for entry in self.queue:
+            entry[2] = None  # Handles kept by callers are stale, cancelling them does nothing
+        self.queue.clear()
+        self.time = 0
+        self.active = 0
+        self.paused = False
@@ -0,0 +1,126 @@
+import queue
+import sqlite3
+import threading
+import time
+from constants import HIGH_SCORE_DB, LEADERBOARD_SIZE
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS scores (id INTEGER PRIMARY KEY, score INTEGER NOT NULL, played_at REAL NOT NULL)",
+    # Leaderboard order: highest score first, earlier games win ties
+    "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, played_at)",
+    "CREATE INDEX IF NOT EXISTS scores_by_date ON scores (played_at)"
+)
+TOP_SCORES = "SELECT score, played_at FROM scores ORDER BY score DESC, played_at LIMIT ?"
+
+class ScoreStore:
+    def __init__(self, path=HIGH_SCORE_DB, top_n=LEADERBOARD_SIZE):
+        """
+        Initializes a local high score store backed by SQLite.
+
+        All database work happens on a background thread, so recording a score never blocks the
+        game. The top scores are kept in memory and refreshed after every write.
+
+        Args:
+            path (str, optional): The SQLite database file. Defaults to HIGH_SCORE_DB.
+            top_n (int, optional): Number of top scores kept in memory. Defaults to LEADERBOARD_SIZE.
+        """
+        self.path = path
+        self.top_n = top_n
+        self.pending = queue.Queue()  # Scores to write, None stops the thread
+        self.lock = threading.Lock()
+        self.top = []  # (score, played_at) pairs, best first
+        self.version = 0  # Incremented whenever `top` changes
+        self.error = None  # The last database error, if any
+        self.ready = threading.Event()  # Set once the database is open and the top scores loaded
+        self.thread = threading.Thread(target=self.run, name="score-store", daemon=True)
+        self.thread.start()
+
+    def add(self, score, played_at=None):
+        """
+        Queues a score to be recorded. Returns immediately.
+
+        Args:
+            score (int): The final score of a game.
+            played_at (float, optional): When the game ended, as a Unix timestamp. Defaults to now.
+        """
+        self.pending.put((score, played_at if played_at is not None else time.time()))
+
+    def top_scores(self):
+        """
+        Returns the best scores from memory, without touching the database.
+
+        Returns:
+            list: Up to `top_n` (score, played_at) pairs, best first.
+        """
+        with self.lock:
+            return list(self.top)
+
+    def flush(self):
+        """
+        Waits until every queued score has been written and the top scores refreshed.
+        """
+        self.ready.wait()
+        self.pending.join()
+
+    def close(self):
+        """
+        Writes the remaining scores and stops the background thread.
+        """
+        self.pending.put(None)
+        self.thread.join()
+
+    def run(self):
+        """
+        Opens the database and writes queued scores until `close` is called.
+        Scores queued together are written in one transaction.
+        """
+        connection = None
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")  # Readers never wait for the writer
+            connection.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, avoids a sync per game
+            for statement in SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+            self.refresh(connection)
+        except sqlite3.Error as error:
+            self.error = error
+        self.ready.set()
+
+        while True:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            scores = [entry for entry in batch if entry is not None]
+            if scores and connection is not None:
+                try:
+                    with connection:
+                        connection.executemany("INSERT INTO scores (score, played_at) VALUES (?, ?)", scores)
+                    self.refresh(connection)
+                except sqlite3.Error as error:
+                    self.error = error
+
+            for _ in batch:
+                self.pending.task_done()
+
+            if None in batch:
+                break
+
+        if connection is not None:
+            connection.close()
+
+    def refresh(self, connection):
+        """
+        Reloads the top scores into memory.
+
+        Args:
+            connection (sqlite3.Connection): The background thread's connection.
+        """
+        top = connection.execute(TOP_SCORES, (self.top_n,)).fetchall()
+        with self.lock:
+            self.top = top
+            self.version += 1
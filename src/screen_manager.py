@@ -1,11 +1,19 @@
+import os
 import pygame
+from assets import ASSETS
 from constants import INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT, BACKGROUND_COLOR
+from font_manager import FONT_MANAGER
 
 class ScreenManager:
-    def __init__(self):
+    def __init__(self, headless=False):
         """
         Initializes the screen manager with default values.
+
+        Args:
+            headless (bool, optional): Whether to render into an offscreen surface instead of opening a window.
+                                       Uses the SDL dummy video driver unless another one is set. Defaults to False.
         """
+        self.headless = headless
         self.width = INITIAL_SCREEN_WIDTH
         self.height = INITIAL_SCREEN_HEIGHT
         self.previous_width = self.width
@@ -17,12 +25,36 @@ class ScreenManager:
     def initialize_screen(self):
         """
         Sets up the Pygame screen with the specified dimensions and background color.
-        The screen is resizable.
+        The screen is resizable. In headless mode the screen is an offscreen surface.
         """
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Must be set before pygame.init
+
         pygame.init()
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
-        pygame.display.set_caption('Fly Catcher')
+        if self.headless and pygame.display.get_surface() is None:
+            # A hidden display, whatever the video driver, gives offscreen surfaces and sprites the same
+            # pixel format, so blitting sprites onto the screen takes the fast path, as in the windowed game
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.screen = self.create_surface(self.width, self.height)
+        if not self.headless:
+            pygame.display.set_caption('Fly Catcher')
         self.screen.fill(self.background_color)
+        ASSETS.preload()  # Load images now that they can be converted to the display format
+
+    def create_surface(self, width, height):
+        """
+        Creates the surface the game renders into.
+
+        Args:
+            width (int): The width of the surface.
+            height (int): The height of the surface.
+
+        Returns:
+            pygame.Surface: The display surface, or an offscreen surface in the display's format in headless mode.
+        """
+        if self.headless:
+            return pygame.Surface((width, height)).convert()
+        return pygame.display.set_mode((width, height), pygame.RESIZABLE)
 
     def resize(self, new_width, new_height):
         """
@@ -32,9 +64,29 @@ class ScreenManager:
             new_width (int): The new width of the screen.
             new_height (int): The new height of the screen.
         """
+        previous_font_size = self.get_font_size()
         self.previous_width, self.previous_height = self.width, self.height
         self.width, self.height = new_width, new_height
-        self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
+        self.screen = self.create_surface(new_width, new_height)
+
+        # Cached fonts and text were rendered for the old font size
+        if self.get_font_size() != previous_font_size:
+            FONT_MANAGER.invalidate()
+
+    def present(self, rects=None):
+        """
+        Pushes the rendered frame to the display. Does nothing in headless mode.
+
+        Args:
+            rects (list, optional): The pygame.Rect areas to push. Defaults to None, which pushes the whole screen.
+        """
+        if self.headless:
+            return
+
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
 
     def clear(self):
         """
@@ -52,3 +104,12 @@ class ScreenManager:
                    the scaling factors for width and height.
         """
         return self.width / self.previous_width, self.height / self.previous_height
+
+    def get_font_size(self):
+        """
+        Calculates the HUD and popup font size, which scales with the screen height.
+
+        Returns:
+            int: The font size in points.
+        """
+        return int(self.height * 0.05)
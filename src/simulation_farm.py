@@ -0,0 +1,227 @@
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from constants import (BASE_TICK_RATE, FLY_SPAWN_INTERVAL, GAME_DURATION, INITIAL_SCREEN_HEIGHT,
+                       INITIAL_SCREEN_WIDTH, SIMULATION_RATE, SPECIAL_FLY_SPAWN_INTERVAL)
+from game_logic import update_frog_and_flies
+from game_state import GameState
+
+DEFAULT_SETTINGS = {
+    "screen_width": INITIAL_SCREEN_WIDTH,
+    "screen_height": INITIAL_SCREEN_HEIGHT,
+    "duration": GAME_DURATION,  # Seconds, extended by special catches like in the real game
+    "max_duration": 10 * GAME_DURATION,  # Seconds, ends games that special catches would extend forever
+    "fly_spawn_interval": FLY_SPAWN_INTERVAL,  # Milliseconds
+    "special_fly_spawn_interval": SPECIAL_FLY_SPAWN_INTERVAL,  # Milliseconds
+    "policy": "chase"
+}
+
+def idle(game_state):
+    """
+    Scripted input that never moves the frog.
+
+    Args:
+        game_state (GameState): The game being played.
+    """
+
+def chase_nearest_fly(game_state):
+    """
+    Scripted input that steers the frog towards the centre of the nearest fly.
+
+    Args:
+        game_state (GameState): The game being played.
+    """
+    frog = game_state.frog
+    movement = frog.movement
+    frog_x = frog.x + frog.width / 2
+    frog_y = frog.y + frog.height / 2
+
+    target = None
+    nearest = float("inf")
+    for fly in game_state.flies:
+        distance = (fly.x + fly.width / 2 - frog_x) ** 2 + (fly.y + fly.height / 2 - frog_y) ** 2
+        if distance < nearest:
+            target, nearest = fly, distance
+
+    if target is None:
+        movement['left'] = movement['right'] = movement['up'] = movement['down'] = False
+        return
+
+    dx = target.x + target.width / 2 - frog_x
+    dy = target.y + target.height / 2 - frog_y
+    movement['left'] = dx < -frog.speed
+    movement['right'] = dx > frog.speed
+    movement['up'] = dy < -frog.speed
+    movement['down'] = dy > frog.speed
+
+# Scripted players, referenced by name so settings stay picklable
+POLICIES = {
+    "idle": idle,
+    "chase": chase_nearest_fly
+}
+
+def session_seeds(base_seed, games):
+    """
+    Derives one RNG seed per game. The seeds only depend on the base seed and the game's
+    index, so results do not change with the number of workers.
+
+    Args:
+        base_seed (int): Seed of the whole batch.
+        games (int): Number of games.
+
+    Returns:
+        list: One 32-bit seed per game.
+    """
+    rng = random.Random(base_seed)
+    return [rng.getrandbits(32) for _ in range(games)]
+
+def play_session(seed, settings=None):
+    """
+    Plays one complete game headlessly, with flies spawning at the configured intervals of game time.
+
+    Args:
+        seed (int): Seed of the game's random number generator.
+        settings (dict, optional): Overrides of DEFAULT_SETTINGS. Defaults to None.
+
+    Returns:
+        dict: The `seed`, `score`, `special_catches`, `catches`, simulated `ticks`, whether the game was
+              `capped` at the maximum duration and its `wall_time` in seconds.
+    """
+    settings = {**DEFAULT_SETTINGS, **(settings or {})}
+    width, height = settings["screen_width"], settings["screen_height"]
+    policy = POLICIES[settings["policy"]]
+
+    start = time.perf_counter()
+    game_state = GameState()
+    game_state.reset(width, height, seed=seed, fly_spawn_interval=settings["fly_spawn_interval"],
+                     special_fly_spawn_interval=settings["special_fly_spawn_interval"])
+    game_state.countdown_time = settings["duration"]
+    dt = BASE_TICK_RATE / SIMULATION_RATE
+
+    # The game ends once the elapsed time reaches the countdown, which special catches extend
+    max_ticks = settings["max_duration"] * SIMULATION_RATE
+    while game_state.tick < min(game_state.countdown_time * SIMULATION_RATE, max_ticks):
+        policy(game_state)
+        update_frog_and_flies(game_state, width, height, dt)
+
+    special_catches = (game_state.countdown_time - settings["duration"]) // 5
+    return {
+        "seed": seed,
+        "score": game_state.score,
+        "special_catches": special_catches,
+        "catches": game_state.score + special_catches,
+        "ticks": game_state.tick,
+        "capped": game_state.tick >= max_ticks,
+        "wall_time": time.perf_counter() - start
+    }
+
+def init_worker():
+    """
+    Prepares a worker process to run games without a window or audio device.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+def run_farm(games, base_seed=0, workers=None, settings=None):
+    """
+    Plays independent games in parallel worker processes.
+
+    Args:
+        games (int): Number of games to play.
+        base_seed (int, optional): Seed the per-game seeds are derived from. Defaults to 0.
+        workers (int, optional): Number of worker processes, 1 plays in this process.
+                                 Defaults to None, which uses one per CPU core.
+        settings (dict, optional): Overrides of DEFAULT_SETTINGS. Defaults to None.
+
+    Returns:
+        list: The result of every game, see `play_session`, in seed order.
+    """
+    seeds = session_seeds(base_seed, games)
+
+    if workers == 1:
+        return [play_session(seed, settings) for seed in seeds]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, games // (workers * 4))  # Few large chunks keep the inter-process overhead low
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        return list(executor.map(play_session, seeds, repeat(settings), chunksize=chunksize))
+
+def aggregate(results, elapsed=None):
+    """
+    Summarizes the results of a batch of games.
+
+    Args:
+        results (list): The game results returned by `run_farm`.
+        elapsed (float, optional): Wall-clock seconds the whole batch took. Defaults to None.
+
+    Returns:
+        dict: Game count, score statistics, catch totals and simulation throughput.
+    """
+    scores = sorted(result["score"] for result in results)
+    ticks = sum(result["ticks"] for result in results)
+    wall_time = sum(result["wall_time"] for result in results)
+    summary = {
+        "games": len(results),
+        "score": {
+            "mean": sum(scores) / len(scores) if scores else 0.0,
+            "median": scores[len(scores) // 2] if scores else 0,
+            "min": scores[0] if scores else 0,
+            "max": scores[-1] if scores else 0
+        },
+        "catches": sum(result["catches"] for result in results),
+        "special_catches": sum(result["special_catches"] for result in results),
+        "capped": sum(result["capped"] for result in results),
+        "ticks": ticks,
+        "game_time": wall_time,  # Sum of every game's wall time, across all workers
+        "ticks_per_second": ticks / wall_time if wall_time else 0.0
+    }
+    if elapsed is not None:
+        summary["elapsed"] = elapsed
+        summary["games_per_second"] = len(results) / elapsed if elapsed else 0.0
+    return summary
+
+def main():
+    """
+    Plays the games described on the command line across worker processes and reports the results.
+    """
+    parser = argparse.ArgumentParser(description="Play many headless Fly Catcher games with scripted input.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, help="worker processes, defaults to one per CPU core")
+    parser.add_argument("--seed", type=int, default=0, help="base seed of the batch")
+    parser.add_argument("--duration", type=int, default=GAME_DURATION, help="game length in seconds")
+    parser.add_argument("--fly-spawn-interval", type=int, default=FLY_SPAWN_INTERVAL, help="milliseconds")
+    parser.add_argument("--special-fly-spawn-interval", type=int, default=SPECIAL_FLY_SPAWN_INTERVAL,
+                        help="milliseconds")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="chase")
+    parser.add_argument("--output", help="write the summary and per-game results as JSON to this file")
+    args = parser.parse_args()
+
+    settings = {
+        "duration": args.duration,
+        "fly_spawn_interval": args.fly_spawn_interval,
+        "special_fly_spawn_interval": args.special_fly_spawn_interval,
+        "policy": args.policy
+    }
+
+    init_worker()
+    start = time.perf_counter()
+    results = run_farm(args.games, args.seed, args.workers, settings)
+    summary = aggregate(results, time.perf_counter() - start)
+
+    print(f"{summary['games']} games in {summary['elapsed']:.2f} s ({summary['games_per_second']:.1f} games/s)")
+    print(f"score mean {summary['score']['mean']:.2f} median {summary['score']['median']} "
+          f"min {summary['score']['min']} max {summary['score']['max']}")
+    print(f"catches {summary['catches']} (special {summary['special_catches']}), "
+          f"{summary['ticks_per_second']:.0f} simulation steps/s per worker")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"settings": settings, "summary": summary, "results": results}, file, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
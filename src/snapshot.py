@@ -0,0 +1,349 @@
+import random
+import struct
+from array import array
+from heapq import heapify
+from itertools import chain, count
+from constants import SNAPSHOT_HISTORY
+from fly import Fly
+from frog import Frog
+from special_fly import SpecialFly
+from sprite_cache import get_scaled_sprite
+
+# Magic, version, flags, frog movement, seed, tick, score, countdown time, screen width and height,
+# fly width and height, frog x, y, previous x, previous y, width and height, fly count, popup count,
+# timer count, scheduler time, has Gaussian, Gaussian, obstacle count
+HEADER = struct.Struct("<4sHBBIIiiII2d6dIIIIBdH")
+OBSTACLE = struct.Struct("<4d")  # X, y, width and height as fractions of the screen size
+FLY = struct.Struct("<6dB")  # X, y, previous x, previous y, width, height, flags
+POPUP = struct.Struct("<ddqB")  # X, y, time, special
+TIMER = struct.Struct("<IIB")  # Due time, interval, index into TIMED_EVENTS
+SWARM = struct.Struct("<I4QBI")  # Fly count, PCG64 state and increment as 64-bit halves, buffered uint32
+RNG_WORDS = 625  # Length of a Mersenne Twister state, including its position
+MAGIC = b"FCSN"
+VERSION = 2  # Version 1 had no obstacle layout
+
+# Header flags
+HAS_SWARM = 1
+SCHEDULER_PAUSED = 2
+
+# Fly flags, frog movement uses the first four
+DIRECTIONS = ("left", "right", "up", "down")
+FACING_LEFT = 16
+SPECIAL = 32
+
+# GameState methods the scheduler can run, the only timed events a snapshot can hold
+TIMED_EVENTS = ("spawn_timed_fly", "spawn_timed_special_fly")
+
+# Throwaway generator for flies created while restoring, their random state is overwritten
+SCRATCH_RNG = random.Random(0)
+
+def movement_bits(movement):
+    """
+    Packs a movement dictionary into four bits.
+
+    Args:
+        movement (dict): Movement directions (`left`, `right`, `up`, `down`) set to True or False.
+
+    Returns:
+        int: Bit i set if DIRECTIONS[i] is active.
+    """
+    return movement["left"] | movement["right"] << 1 | movement["up"] << 2 | movement["down"] << 3
+
+def unpack_movement(bits):
+    """
+    Unpacks four movement bits into a movement dictionary.
+
+    Args:
+        bits (int): The bits packed by `movement_bits`.
+
+    Returns:
+        dict: Movement directions (`left`, `right`, `up`, `down`) set to True or False.
+    """
+    return {"left": bool(bits & 1), "right": bool(bits & 2), "up": bool(bits & 4), "down": bool(bits & 8)}
+
+def take_snapshot(game_state):
+    """
+    Serializes a game state into a compact fixed-layout binary snapshot.
+
+    The snapshot holds everything the simulation depends on: the frog, every fly, score,
+    countdown, popups, the obstacle layout, the spawn timers and the random generators' states,
+    so restoring it continues the session exactly as if it had never been interrupted.
+
+    Args:
+        game_state (GameState): The game state to serialize.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    frog = game_state.frog
+    flies = game_state.flies
+    swarm = game_state.swarm
+    scheduler = game_state.scheduler
+
+    timers = []
+    events = [getattr(game_state, name) for name in TIMED_EVENTS]
+    for due, _, callback, interval in sorted(scheduler.queue, key=lambda entry: (entry[0], entry[1])):
+        if callback in events:
+            timers.append(TIMER.pack(due, interval or 0, events.index(callback)))
+
+    version, rng_state, gauss = game_state.rng.getstate()
+    flags = (HAS_SWARM if swarm is not None else 0) | (SCHEDULER_PAUSED if scheduler.paused else 0)
+    layout = game_state.obstacles.layout
+    parts = [
+        HEADER.pack(MAGIC, VERSION, flags, movement_bits(frog.movement), game_state.seed or 0, game_state.tick,
+                    game_state.score, game_state.countdown_time,
+                    int(game_state.screen_width), int(game_state.screen_height),
+                    game_state.fly_width, game_state.fly_height,
+                    frog.x, frog.y, frog.previous_x, frog.previous_y, frog.width, frog.height,
+                    len(flies), len(game_state.score_popups), len(timers), scheduler.time,
+                    gauss is not None, gauss or 0.0, len(layout)),
+        array('I', rng_state).tobytes(),
+        struct.pack(f"<{OBSTACLE.format[1:] * len(layout)}", *chain.from_iterable(layout))
+    ]
+
+    # One flat pack call for every fly, '<' records have no padding so they concatenate exactly
+    values = []
+    extend = values.extend
+    for fly in flies:
+        movement = fly.movement
+        extend((fly.x, fly.y, fly.previous_x, fly.previous_y, fly.width, fly.height,
+                movement["left"] | movement["right"] << 1 | movement["up"] << 2 | movement["down"] << 3 |
+                (FACING_LEFT if fly.facing_left else 0) | (SPECIAL if isinstance(fly, SpecialFly) else 0)))
+    parts.append(struct.pack(f"<{FLY.format[1:] * len(flies)}", *values))
+
+    parts.extend(POPUP.pack(*popup) for popup in game_state.score_popups)
+    parts.extend(timers)
+
+    if swarm is not None:
+        state = swarm.rng.bit_generator.state
+        pcg = state["state"]
+        n = swarm.count
+        parts.append(SWARM.pack(n, pcg["state"] >> 64, pcg["state"] & (2 ** 64 - 1),
+                                pcg["inc"] >> 64, pcg["inc"] & (2 ** 64 - 1), state["has_uint32"], state["uinteger"]))
+        parts.extend(getattr(swarm, name)[:n].tobytes() for name in swarm.FIELDS)
+
+    return b"".join(parts)
+
+def restore_snapshot(game_state, snapshot):
+    """
+    Overwrites a game state with a snapshot taken by `take_snapshot`.
+
+    Flies are recycled through the game state's fly pool and the random generators keep their
+    identity, so objects holding on to them stay valid.
+
+    Args:
+        game_state (GameState): The game state to overwrite. Must use the same fly backend as the snapshot.
+        snapshot (bytes): The snapshot to restore.
+
+    Raises:
+        ValueError: If the data is not a snapshot of a supported version or was taken with another fly backend.
+    """
+    if len(snapshot) < HEADER.size:
+        raise ValueError("not a game state snapshot")
+
+    (magic, version, flags, frog_bits, seed, tick, score, countdown_time, screen_width, screen_height,
+     fly_width, fly_height, frog_x, frog_y, frog_previous_x, frog_previous_y, frog_width, frog_height,
+     fly_count, popup_count, timer_count, scheduler_time, has_gauss, gauss,
+     obstacle_count) = HEADER.unpack_from(snapshot)
+
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} game state snapshot")
+    if bool(flags & HAS_SWARM) != (game_state.swarm is not None):
+        raise ValueError("snapshot was taken with a different fly backend")
+
+    offset = HEADER.size
+    rng_state = array('I')
+    rng_state.frombytes(snapshot[offset:offset + 4 * RNG_WORDS])
+    offset += 4 * RNG_WORDS
+    game_state.rng.setstate((3, tuple(rng_state), gauss if has_gauss else None))
+    layout = tuple(OBSTACLE.iter_unpack(snapshot[offset:offset + OBSTACLE.size * obstacle_count]))
+    offset += OBSTACLE.size * obstacle_count
+
+    game_state.seed, game_state.tick = seed, tick
+    game_state.score, game_state.countdown_time = score, countdown_time
+    game_state.screen_width, game_state.screen_height = screen_width, screen_height
+    game_state.obstacles.build(screen_width, screen_height, layout)
+    game_state.fly_width, game_state.fly_height = fly_width, fly_height
+
+    frog = game_state.frog
+    if frog is None:
+        frog = game_state.frog = Frog(frog_x, frog_y, frog_width, frog_height)
+    frog.x, frog.y, frog.previous_x, frog.previous_y = frog_x, frog_y, frog_previous_x, frog_previous_y
+    if (frog.width, frog.height) != (frog_width, frog_height):
+        frog.width, frog.height = frog_width, frog_height
+        frog.img = get_scaled_sprite(frog.original_img, None, frog_width, frog_height)
+    frog.movement.update(unpack_movement(frog_bits))
+
+    # Recycle the current flies and overwrite pooled ones with the snapshot's flies
+    pool = game_state.fly_pool
+    pool.release_all(game_state.flies)
+    flies = []
+    images = {}  # (fly class, facing left, width, height) -> scaled image, looked up once per restore
+    for x, y, previous_x, previous_y, width, height, bits in FLY.iter_unpack(
+            snapshot[offset:offset + FLY.size * fly_count]):
+        fly_class = SpecialFly if bits & SPECIAL else Fly
+        fly = pool.reuse(fly_class, screen_width, screen_height, width, height, rng=SCRATCH_RNG)
+        fly.rng = game_state.rng
+        fly.x, fly.y, fly.previous_x, fly.previous_y = x, y, previous_x, previous_y
+        fly.width, fly.height = width, height
+        fly.movement = unpack_movement(bits)
+        fly.facing_left = facing_left = bool(bits & FACING_LEFT)
+
+        key = (fly_class, facing_left, width, height)
+        img = images.get(key)
+        if img is None:
+            if facing_left:
+                img = images[key] = get_scaled_sprite(fly.img_left, "left", width, height)
+            else:
+                img = images[key] = get_scaled_sprite(fly.img_right, "right", width, height)
+        fly.img = img
+        flies.append(fly)
+    offset += FLY.size * fly_count
+    game_state.flies = flies
+    game_state.rebuild_spatial_hash()
+
+    popups = game_state.score_popups
+    popups.clear()
+    for popup in POPUP.iter_unpack(snapshot[offset:offset + POPUP.size * popup_count]):
+        popups.add(*popup)
+    offset += POPUP.size * popup_count
+
+    # Rebuild the scheduler's heap, keeping the order of timers due at the same time
+    scheduler = game_state.scheduler
+    scheduler.clear()
+    scheduler.time = scheduler_time
+    scheduler.paused = bool(flags & SCHEDULER_PAUSED)
+    for sequence, (due, interval, event) in enumerate(TIMER.iter_unpack(
+            snapshot[offset:offset + TIMER.size * timer_count])):
+        scheduler.queue.append([due, sequence, getattr(game_state, TIMED_EVENTS[event]), interval or None])
+    heapify(scheduler.queue)
+    scheduler.active = timer_count
+    scheduler.sequence = count(timer_count)
+    offset += TIMER.size * timer_count
+
+    if flags & HAS_SWARM:
+        restore_swarm(game_state.swarm, snapshot, offset)
+
+def restore_swarm(swarm, snapshot, offset):
+    """
+    Overwrites a FlySwarm with the swarm section of a snapshot.
+
+    Args:
+        swarm (FlySwarm): The swarm to overwrite.
+        snapshot (bytes): The snapshot.
+        offset (int): Where the swarm section starts.
+    """
+    import numpy as np  # Only needed with the swarm backend
+
+    n, state_high, state_low, inc_high, inc_low, has_uint32, uinteger = SWARM.unpack_from(snapshot, offset)
+    offset += SWARM.size
+    swarm.rng.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": state_high << 64 | state_low, "inc": inc_high << 64 | inc_low},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger
+    }
+
+    if n > swarm.capacity:
+        swarm.allocate(n)
+    for name, dtype in swarm.FIELDS.items():
+        size = n * np.dtype(dtype).itemsize
+        getattr(swarm, name)[:n] = np.frombuffer(snapshot, dtype=dtype, count=n, offset=offset)
+        offset += size
+    swarm.count = n
+
+def load_snapshot(path):
+    """
+    Reads a snapshot written by `SnapshotRing.dump`.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        bytes: The snapshot, to pass to `restore_snapshot`.
+    """
+    with open(path, "rb") as file:
+        return file.read()
+
+class SnapshotRing:
+    def __init__(self, capacity=SNAPSHOT_HISTORY):
+        """
+        Initializes a ring buffer of the most recent game state snapshots, for rollback and crash dumps.
+
+        Args:
+            capacity (int, optional): Number of snapshots to keep. Defaults to SNAPSHOT_HISTORY.
+        """
+        self.capacity = capacity
+        self.snapshots = [None] * capacity
+        self.index = 0  # Next slot to write
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, game_state):
+        """
+        Takes a snapshot of a game state, replacing the oldest one if the ring is full.
+
+        Args:
+            game_state (GameState): The game state to snapshot.
+
+        Returns:
+            bytes: The snapshot.
+        """
+        snapshot = take_snapshot(game_state)
+        self.snapshots[self.index] = snapshot
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return snapshot
+
+    def get(self, frames_back=0):
+        """
+        Returns a stored snapshot.
+
+        Args:
+            frames_back (int, optional): How many snapshots before the latest one. Defaults to 0, the latest.
+
+        Returns:
+            bytes: The snapshot.
+
+        Raises:
+            IndexError: If fewer snapshots are stored.
+        """
+        if not 0 <= frames_back < self.count:
+            raise IndexError(f"only {self.count} snapshots stored")
+        return self.snapshots[(self.index - 1 - frames_back) % self.capacity]
+
+    def rollback(self, game_state, frames_back=0):
+        """
+        Restores a stored snapshot and forgets every snapshot taken after it, so the session
+        continues from there.
+
+        Args:
+            game_state (GameState): The game state to overwrite.
+            frames_back (int, optional): How many snapshots before the latest one. Defaults to 0, the latest.
+
+        Raises:
+            IndexError: If fewer snapshots are stored.
+        """
+        restore_snapshot(game_state, self.get(frames_back))
+        self.index = (self.index - frames_back) % self.capacity
+        self.count -= frames_back
+
+    def dump(self, path):
+        """
+        Writes the latest snapshot to a file, e.g. as a crash dump.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, "wb") as file:
+            file.write(self.get())
+
+    def clear(self):
+        """
+        Forgets every snapshot.
+        """
+        self.snapshots = [None] * self.capacity
+        self.index = 0
+        self.count = 0
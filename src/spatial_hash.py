@@ -0,0 +1,127 @@
+from constants import SPATIAL_HASH_CELL_SIZE
+
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """
+        Initializes a uniform grid that maps screen cells to the entities overlapping them.
+
+        Args:
+            cell_size (float, optional): The width and height of each grid cell in pixels.
+                                         Defaults to SPATIAL_HASH_CELL_SIZE.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entity_cells = {}
+
+    def __len__(self):
+        return len(self.entity_cells)
+
+    def __contains__(self, entity):
+        return entity in self.entity_cells
+
+    def cell_range(self, x, y, width, height):
+        """
+        Calculates the range of cells covered by a rectangle.
+
+        Args:
+            x (float): The x-coordinate of the rectangle.
+            y (float): The y-coordinate of the rectangle.
+            width (float): The width of the rectangle.
+            height (float): The height of the rectangle.
+
+        Returns:
+            tuple: (first_column, first_row, last_column, last_row), inclusive.
+        """
+        size = self.cell_size
+        return (int(x // size), int(y // size),
+                int((x + width) // size), int((y + height) // size))
+
+    def insert(self, entity, x, y, width, height):
+        """
+        Registers an entity in every cell its bounds overlap, or moves it if it is already registered.
+
+        Args:
+            entity (object): The entity to register.
+            x (float): The x-coordinate of the entity.
+            y (float): The y-coordinate of the entity.
+            width (float): The width of the entity.
+            height (float): The height of the entity.
+        """
+        cell_range = self.cell_range(x, y, width, height)
+        previous_range = self.entity_cells.get(entity)
+
+        if previous_range == cell_range:
+            return  # Still in the same cells, nothing to update
+
+        if previous_range is not None:
+            self.unlink(entity, previous_range)
+
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((column, row), set()).add(entity)
+
+        self.entity_cells[entity] = cell_range
+
+    # Moving an entity is the same operation as registering it again
+    update = insert
+
+    def remove(self, entity):
+        """
+        Unregisters an entity. Unknown entities are ignored.
+
+        Args:
+            entity (object): The entity to remove.
+        """
+        cell_range = self.entity_cells.pop(entity, None)
+        if cell_range is not None:
+            self.unlink(entity, cell_range)
+
+    def unlink(self, entity, cell_range):
+        """
+        Removes an entity from the cells in the given range, dropping cells that become empty.
+
+        Args:
+            entity (object): The entity to unlink.
+            cell_range (tuple): The cells to unlink it from, as returned by `cell_range`.
+        """
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells.get((column, row))
+                if cell is not None:
+                    cell.discard(entity)
+                    if not cell:
+                        del self.cells[(column, row)]
+
+    def query(self, x, y, width, height):
+        """
+        Finds the entities registered in the cells overlapped by a rectangle.
+
+        This is a broadphase: returned entities share a cell with the rectangle but
+        may not actually overlap it.
+
+        Args:
+            x (float): The x-coordinate of the rectangle.
+            y (float): The y-coordinate of the rectangle.
+            width (float): The width of the rectangle.
+            height (float): The height of the rectangle.
+
+        Returns:
+            set: The candidate entities.
+        """
+        first_column, first_row, last_column, last_row = self.cell_range(x, y, width, height)
+        found = set()
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    found |= cell
+        return found
+
+    def clear(self):
+        """
+        Removes all entities from the grid.
+        """
+        self.cells.clear()
+        self.entity_cells.clear()
@@ -1,12 +1,12 @@
-import pygame
-import random
-from constants import SPECIAL_FLY_LEFT, SPECIAL_FLY_RIGHT
+from assets import ASSETS
 from fly import Fly
+from sprite_cache import get_scaled_sprite
 
 class SpecialFly(Fly):
-    def __init__(self, screen_width, screen_height, width, height):
+    def __init__(self, screen_width, screen_height, width, height, rng=None):
         # Call the parent class (Fly) constructor to inherit its properties
-        super().__init__(screen_width, screen_height, width, height, img_left=SPECIAL_FLY_LEFT, img_right=SPECIAL_FLY_RIGHT)
+        super().__init__(screen_width, screen_height, width, height, img_left=ASSETS.get("special_fly_left"),
+                         img_right=ASSETS.get("special_fly_right"), rng=rng)
         """
         A special fly that disappears when it moves off the screen.
 
@@ -17,10 +17,28 @@ class SpecialFly(Fly):
                 height (float): Height of the special fly.
                 special_fly_img_left (pygame.Surface, optional): Image of the special fly facing left. Defaults to SPECIAL_FLY_LEFT.
                 special_fly_img_right (pygame.Surface, optional): Image of the special fly facing right. Defaults to SPECIAL_FLY_RIGHT.
+                rng (random.Random, optional): Random number generator for position and movement. Defaults to None.
         """
+
+    def reinitialize(self, screen_width, screen_height, width, height, rng=None):
+        """
+        Gives the special fly a new size, position near the center of the screen and movement,
+        as if it had just been created.
+
+        Args:
+            screen_width (int): Width of the screen the fly can move within.
+            screen_height (int): Height of the screen the fly can move within.
+            width (float): Width of the special fly.
+            height (float): Height of the special fly.
+            rng (random.Random, optional): Random number generator for position and movement.
+                                           Defaults to None, which keeps the current one.
+        """
+        super().reinitialize(screen_width, screen_height, width, height, rng)
+
         # Randomly spawn near the center of the screen
-        self.x = random.randint(screen_width // 4, 3 * screen_width // 4)  # Random position from the first to the third quarter of the screen width
-        self.y = random.randint(screen_height // 4, 3 * screen_height // 4)  # Random position from the first to the third quarter of the screen height
+        self.x = self.rng.randint(screen_width // 4, 3 * screen_width // 4)  # Random position from the first to the third quarter of the screen width
+        self.y = self.rng.randint(screen_height // 4, 3 * screen_height // 4)  # Random position from the first to the third quarter of the screen height
+        self.previous_x, self.previous_y = self.x, self.y
 
         # Adjust initial movement direction after random position is set
         self.adjust_movement(screen_width, screen_height)
@@ -45,13 +63,13 @@ class SpecialFly(Fly):
         if fly_center_x < screen_center_x and self.movement["left"]:
             self.movement["left"] = False
             self.movement["right"] = True
-            self.img = pygame.transform.scale(self.img_right, (int(self.width), int(self.height)))
+            self.img = get_scaled_sprite(self.img_right, "right", self.width, self.height)
 
         # If the fly is in the right half and moving right, change direction to left
         if fly_center_x > screen_center_x and self.movement["right"]:
             self.movement["right"] = False
             self.movement["left"] = True
-            self.img = pygame.transform.scale(self.img_left, (int(self.width), int(self.height)))
+            self.img = get_scaled_sprite(self.img_left, "left", self.width, self.height)
 
         # If the fly is in the top half and moving up, change direction to down
         if fly_center_y < screen_center_y and self.movement["up"]:
@@ -63,7 +81,7 @@ class SpecialFly(Fly):
             self.movement["down"] = False
             self.movement["up"] = True
 
-    def move(self, screen_width, screen_height):
+    def move(self, screen_width, screen_height, dt=1.0, obstacles=None):
         """
         Moves the special fly and returns a boolean indicating whether the fly is still on the screen.
         The special fly will be removed if it moves off the screen.
@@ -71,12 +89,16 @@ class SpecialFly(Fly):
         Args:
             screen_width (int): The width of the screen, used to check if the fly has moved off the screen.
             screen_height (int): The height of the screen, used to check if the fly has moved off the screen.
+            dt (float, optional): The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
+            obstacles (ObstacleGrid, optional): Obstacles the fly bounces off. Defaults to None.
 
         Returns:
             bool: True if the fly is still on the screen, False if it has moved off the screen.
         """
         # Update the fly's position based on its movement direction
-        self.update_position()
+        self.update_position(dt)
+        if obstacles is not None:
+            self.check_obstacles(obstacles)
 
         # Check if the special fly is off the screen
         if not self.is_on_screen(screen_width, screen_height):
@@ -84,19 +106,25 @@ class SpecialFly(Fly):
 
         return True
 
-    def update_position(self):
+    def update_position(self, dt=1.0):
         """
         Update the position of the special fly based on its current movement direction.
+
+        Args:
+            dt (float, optional): The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
         """
+        self.previous_x, self.previous_y = self.x, self.y
+        step = self.speed * dt
+
         if self.movement["left"]:
-            self.x -= self.speed
+            self.x -= step
         elif self.movement["right"]:
-            self.x += self.speed
+            self.x += step
             
         if self.movement["up"]:
-            self.y -= self.speed
+            self.y -= step
         elif self.movement["down"]:
-            self.y += self.speed
+            self.y += step
 
     def is_on_screen(self, screen_width, screen_height):
         """
@@ -0,0 +1,331 @@
+import argparse
+import mmap
+import random
+import struct
+from array import array
+import pygame
+from constants import OBSTACLE_LAYOUT, SIMULATION_RATE, SPECTATOR_KEYFRAME_INTERVAL, SPECTATOR_LOG_BUFFER
+from fly import Fly
+from special_fly import SpecialFly
+from sprite_cache import get_scaled_sprite
+
+# Magic, version, screen width, screen height, simulation rate, keyframe interval, obstacle count
+HEADER = struct.Struct("<4sHHHHHH")
+OBSTACLE = struct.Struct("<4d")  # X, y, width and height as fractions of the screen size
+# Tick, score, countdown time, frog x, y, width and height, fly width and height, fly count, followed by
+# an x and y float32 per fly, then one flags byte per fly
+RECORD = struct.Struct("<Iii6dI")
+FOOTER = struct.Struct("<QI4s")  # Offset of the keyframe index, number of records, end magic
+MAGIC = b"FCSL"
+INDEX_MAGIC = b"FCSI"
+VERSION = 2  # Version 1 had no obstacle layout, so playback drew whatever layout was current
+
+# Fly flags
+FACING_LEFT = 1
+SPECIAL = 2
+
+# Throwaway generator for flies created for playback, whose state comes from the log
+SCRATCH_RNG = random.Random(0)
+
+class SpectatorLog:
+    def __init__(self, path, screen_width, screen_height, simulation_rate=SIMULATION_RATE,
+                 keyframe_interval=SPECTATOR_KEYFRAME_INTERVAL, obstacle_layout=OBSTACLE_LAYOUT):
+        """
+        Opens a spectator log for writing, one record per simulation step.
+
+        Records go through a large write buffer, so the game loop only pays for packing them.
+        The offset of every `keyframe_interval`-th record is kept and written as an index by `close`.
+
+        Args:
+            path (str): The file to write.
+            screen_width (int): The width of the screen.
+            screen_height (int): The height of the screen.
+            simulation_rate (int, optional): Simulation steps per second. Defaults to SIMULATION_RATE.
+            keyframe_interval (int, optional): Records between index entries. Defaults to SPECTATOR_KEYFRAME_INTERVAL.
+            obstacle_layout (tuple, optional): The session's obstacles, see ObstacleGrid. Defaults to OBSTACLE_LAYOUT.
+        """
+        self.file = open(path, "wb", buffering=SPECTATOR_LOG_BUFFER)
+        self.file.write(HEADER.pack(MAGIC, VERSION, int(screen_width), int(screen_height), simulation_rate,
+                                    keyframe_interval, len(obstacle_layout)))
+        self.file.writelines(OBSTACLE.pack(*obstacle) for obstacle in obstacle_layout)
+        self.offset = HEADER.size + OBSTACLE.size * len(obstacle_layout)
+        self.keyframe_interval = keyframe_interval
+        self.keyframes = array('Q')
+        self.records = 0
+
+    def record(self, game_state):
+        """
+        Appends the game state after a simulation step.
+
+        Args:
+            game_state (GameState): The game state to record.
+        """
+        if self.records % self.keyframe_interval == 0:
+            self.keyframes.append(self.offset)
+
+        frog = game_state.frog
+        swarm = game_state.swarm
+        if swarm is not None:
+            import numpy as np  # Only needed with the swarm backend
+
+            n = swarm.count
+            positions = np.empty(2 * n, dtype="<f4")
+            positions[0::2], positions[1::2] = swarm.x[:n], swarm.y[:n]
+            flags = (swarm.facing_left[:n] * FACING_LEFT | swarm.special[:n] * SPECIAL).astype(np.uint8).tobytes()
+        else:
+            flies = game_state.flies
+            n = len(flies)
+            positions = array('f', bytes(8 * n))
+            positions[0::2] = array('f', [fly.x for fly in flies])
+            positions[1::2] = array('f', [fly.y for fly in flies])
+            flags = bytes([(FACING_LEFT if fly.facing_left else 0) | (SPECIAL if isinstance(fly, SpecialFly) else 0)
+                           for fly in flies])
+
+        record = b"".join((RECORD.pack(game_state.tick, game_state.score, game_state.countdown_time,
+                                       frog.x, frog.y, frog.width, frog.height,
+                                       game_state.fly_width, game_state.fly_height, n),
+                           positions.tobytes(), flags))
+        self.file.write(record)
+        self.offset += len(record)
+        self.records += 1
+
+    def close(self):
+        """
+        Writes the keyframe index and closes the file.
+        """
+        self.file.write(self.keyframes.tobytes())
+        self.file.write(FOOTER.pack(self.offset, self.records, INDEX_MAGIC))
+        self.file.close()
+
+def record_size(fly_count):
+    """
+    Calculates the size of a record.
+
+    Args:
+        fly_count (int): The number of flies in the record.
+
+    Returns:
+        int: The record's size in bytes.
+    """
+    return RECORD.size + 9 * fly_count
+
+class SpectatorLogReader:
+    def __init__(self, path):
+        """
+        Memory-maps a spectator log for playback.
+
+        A log that was not closed, e.g. because the game crashed, has no index; its records are
+        scanned once to build one.
+
+        Args:
+            path (str): The file to read.
+
+        Raises:
+            ValueError: If the file is not a spectator log of a supported version.
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"{path} is not a spectator log")
+        (magic, version, self.screen_width, self.screen_height, self.simulation_rate, self.keyframe_interval,
+         obstacle_count) = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} spectator log")
+
+        self.records_start = HEADER.size + OBSTACLE.size * obstacle_count
+        if len(self.data) < self.records_start:
+            raise ValueError(f"{path} is not a spectator log")
+        self.obstacle_layout = tuple(OBSTACLE.iter_unpack(self.data[HEADER.size:self.records_start]))
+        index_offset, self.records, index_magic = 0, 0, None
+        if len(self.data) >= self.records_start + FOOTER.size:
+            index_offset, self.records, index_magic = FOOTER.unpack_from(self.data, len(self.data) - FOOTER.size)
+        if index_magic == INDEX_MAGIC:
+            self.keyframes = memoryview(self.data)[index_offset:len(self.data) - FOOTER.size].cast('Q')
+        else:
+            self.scan()
+
+    def __len__(self):
+        return self.records
+
+    def scan(self):
+        """
+        Builds the keyframe index of a log that has none, ignoring a partly written last record.
+        """
+        self.keyframes = array('Q')
+        self.records = 0
+        offset = self.records_start
+        end = len(self.data)
+
+        while offset + RECORD.size <= end:
+            size = record_size(RECORD.unpack_from(self.data, offset)[-1])
+            if offset + size > end:
+                break
+            if self.records % self.keyframe_interval == 0:
+                self.keyframes.append(offset)
+            offset += size
+            self.records += 1
+
+    def offset(self, index):
+        """
+        Finds a record from the nearest keyframe before it, without reading the log from the start.
+
+        Args:
+            index (int): The record's position in the log.
+
+        Returns:
+            int: The record's offset in the file.
+        """
+        offset = self.keyframes[index // self.keyframe_interval]
+        for _ in range(index % self.keyframe_interval):
+            offset += record_size(RECORD.unpack_from(self.data, offset)[-1])
+        return offset
+
+    def index_at(self, seconds):
+        """
+        Converts a time in the session to a record position.
+
+        Args:
+            seconds (float): Seconds since the first recorded step.
+
+        Returns:
+            int: The position of the record shown at that time, clamped to the log.
+        """
+        return max(0, min(self.records - 1, int(seconds * self.simulation_rate)))
+
+    def record(self, index):
+        """
+        Reads a record.
+
+        Args:
+            index (int): The record's position in the log.
+
+        Returns:
+            tuple: (tick, score, countdown time, frog x, y, width and height, fly width and height,
+                    fly positions as interleaved float32 x and y, fly flags).
+        """
+        offset = self.offset(index)
+        values = RECORD.unpack_from(self.data, offset)
+        n = values[-1]
+        start = offset + RECORD.size
+        view = memoryview(self.data)
+        positions = view[start:start + 8 * n].cast('f')
+        flags = view[start + 8 * n:start + 9 * n]
+        return values[:-1] + (positions, flags)
+
+    def apply(self, game_state, index):
+        """
+        Sets a game state to a recorded step, so it can be drawn with the regular renderer.
+
+        Flies are reused between steps by position in the fly list and recycled through the game state's fly pool.
+
+        Args:
+            game_state (GameState): The game state to overwrite, with a frog.
+            index (int): The record's position in the log.
+        """
+        (game_state.tick, game_state.score, game_state.countdown_time, frog_x, frog_y, frog_width, frog_height,
+         fly_width, fly_height, positions, flags) = self.record(index)
+
+        frog = game_state.frog
+        frog.previous_x, frog.previous_y = frog.x, frog.y = frog_x, frog_y
+        if (frog.width, frog.height) != (frog_width, frog_height):
+            frog.width, frog.height = frog_width, frog_height
+            frog.img = get_scaled_sprite(frog.original_img, None, frog_width, frog_height)
+        game_state.fly_width, game_state.fly_height = fly_width, fly_height
+
+        flies = game_state.flies
+        pool = game_state.fly_pool
+        n = len(flags)
+        if len(flies) > n:
+            pool.release_all(flies[n:])
+            del flies[n:]
+
+        for i, bits in enumerate(flags):
+            fly_class = SpecialFly if bits & SPECIAL else Fly
+            fly = flies[i] if i < len(flies) else None
+            if type(fly) is not fly_class:
+                if fly is not None:
+                    pool.release(fly)
+                fly = pool.reuse(fly_class, self.screen_width, self.screen_height, fly_width, fly_height,
+                                 rng=SCRATCH_RNG)
+                if i < len(flies):
+                    flies[i] = fly
+                else:
+                    flies.append(fly)
+
+            fly.previous_x = fly.x = positions[2 * i]
+            fly.previous_y = fly.y = positions[2 * i + 1]
+            fly.width, fly.height = fly_width, fly_height
+            fly.facing_left = bool(bits & FACING_LEFT)
+            if fly.facing_left:
+                fly.img = get_scaled_sprite(fly.img_left, "left", fly_width, fly_height)
+            else:
+                fly.img = get_scaled_sprite(fly.img_right, "right", fly_width, fly_height)
+
+    def close(self):
+        """
+        Unmaps the log.
+        """
+        if isinstance(self.keyframes, memoryview):
+            self.keyframes.release()
+        self.data.close()
+
+def play_log(reader, screen_manager, start_seconds=0.0):
+    """
+    Plays a spectator log back in real time with the regular renderer.
+    The left and right arrow keys seek five seconds back and forward.
+
+    Args:
+        reader (SpectatorLogReader): The log to play.
+        screen_manager (ScreenManager): Manages the game screen.
+        start_seconds (float, optional): Where to start playing. Defaults to 0.0.
+    """
+    from frog import Frog
+    from game_state import GameState
+    from ui_renderer import draw_game_objects
+
+    game_state = GameState()
+    game_state.frog = Frog(0, 0, 1, 1)
+    game_state.obstacles.build(reader.screen_width, reader.screen_height, reader.obstacle_layout)
+    clock = pygame.time.Clock()
+    started = pygame.time.get_ticks() - start_seconds * 1000  # Wall time at which the log started
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                started += 5000 if event.key == pygame.K_LEFT else -5000
+
+        now = pygame.time.get_ticks()
+        index = reader.index_at((now - started) / 1000)
+        reader.apply(game_state, index)
+
+        # The countdown shown is the recorded one
+        start_time = now - game_state.tick * 1000 // reader.simulation_rate
+        draw_game_objects(game_state, screen_manager, start_time, doreturn=False)
+        screen_manager.present()
+
+        if index == len(reader) - 1 and now - started >= len(reader) * 1000 / reader.simulation_rate:
+            return
+        clock.tick(reader.simulation_rate)
+
+def main():
+    """
+    Plays back a spectator log from the second chosen on the command line.
+    """
+    parser = argparse.ArgumentParser(description="Watch a Fly Catcher spectator log.")
+    parser.add_argument("path")
+    parser.add_argument("--start", type=float, default=0.0, help="second of the session to start at")
+    args = parser.parse_args()
+
+    from screen_manager import ScreenManager  # Opens the window, only needed for watching
+
+    reader = SpectatorLogReader(args.path)
+    screen_manager = ScreenManager()
+    screen_manager.resize(reader.screen_width, reader.screen_height)
+    play_log(reader, screen_manager, args.start)
+    reader.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+import pygame
+from constants import SPRITE_CACHE_SIZE
+
+class SpriteCache:
+    def __init__(self, max_size=SPRITE_CACHE_SIZE):
+        """
+        Initializes an LRU cache of scaled sprite surfaces shared by all game entities.
+
+        Args:
+            max_size (int, optional): Maximum number of scaled surfaces to keep. Defaults to SPRITE_CACHE_SIZE.
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image, facing, width, height):
+        """
+        Returns the source image scaled to the given size, scaling it only on a cache miss.
+
+        Args:
+            image (pygame.Surface): The source image to scale.
+            facing (str): The direction the sprite faces ("left", "right"), or None for unflipped sprites.
+            width (float): The width of the scaled sprite. Truncated to an integer.
+            height (float): The height of the scaled sprite. Truncated to an integer.
+
+        Returns:
+            pygame.Surface: The shared scaled surface. Callers must not draw onto it.
+        """
+        key = (image, facing, int(width), int(height))
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)  # Mark as most recently used
+            return surface
+
+        self.misses += 1
+        surface = pygame.transform.scale(image, (int(width), int(height)))
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Match the display format so blits take the fast path
+        self.surfaces[key] = surface
+
+        # Evict the least recently used surfaces once the cache is full
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self):
+        """
+        Removes all cached surfaces and resets the hit and miss counters.
+        """
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Reports how effective the cache has been.
+
+        Returns:
+            dict: The number of cached surfaces (`size`), `hits`, `misses` and the `hit_rate` as a float.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+# Process-wide cache used by the frog and all flies
+SPRITE_CACHE = SpriteCache()
+
+def get_scaled_sprite(image, facing, width, height):
+    """
+    Returns a scaled sprite from the shared sprite cache.
+
+    Args:
+        image (pygame.Surface): The source image to scale.
+        facing (str): The direction the sprite faces ("left", "right"), or None for unflipped sprites.
+        width (float): The width of the scaled sprite.
+        height (float): The height of the scaled sprite.
+
+    Returns:
+        pygame.Surface: The shared scaled surface.
+    """
+    return SPRITE_CACHE.get(image, facing, width, height)
@@ -0,0 +1,573 @@
+import math
+import numpy as np
+from assets import ASSETS
+from constants import FLY_SPEED
+from sprite_cache import get_scaled_sprite
+
+# Directions of the four moves a fly that stopped can be given: left, right, up, down
+RANDOM_MOVE_DX = np.array((-1, 1, 0, 0), dtype=np.int8)
+RANDOM_MOVE_DY = np.array((0, 0, -1, 1), dtype=np.int8)
+
+def obstacle_mask(obstacles, width, height):
+    """
+    Marks every pixel the top-left corner of a rectangle can lie in while the rectangle overlaps
+    an obstacle, so ruling out a rectangle away from the obstacles takes one lookup (see `near_obstacles`).
+
+    Args:
+        obstacles (ObstacleGrid): The obstacles, built for a screen size.
+        width (float): The width of the rectangles.
+        height (float): The height of the rectangles.
+
+    Returns:
+        numpy.ndarray: The marked pixels, shape (screen_height + 1, screen_width + 1).
+    """
+    screen_width, screen_height = obstacles.screen_size
+    columns, rows = int(screen_width) + 1, int(screen_height) + 1
+    mask = np.zeros((rows, columns), dtype=np.bool_)
+    for x, y, obstacle_width, obstacle_height in obstacles:
+        # A corner in column c overlaps for some position in [c, c + 1) if c + 1 > x - width and
+        # c < x + obstacle_width. Clamping both ends keeps the mask conservative for corners off the screen
+        first_column = min(max(math.floor(x - width), 0), columns - 1)
+        last_column = min(max(math.ceil(x + obstacle_width) - 1, 0), columns - 1)
+        first_row = min(max(math.floor(y - height), 0), rows - 1)
+        last_row = min(max(math.ceil(y + obstacle_height) - 1, 0), rows - 1)
+        mask[first_row:last_row + 1, first_column:last_column + 1] = True
+    return mask
+
+def near_obstacles(mask, x, y):
+    """
+    Looks the top-left corners of rectangles up in an `obstacle_mask`.
+
+    Args:
+        mask (numpy.ndarray): The mask built for the rectangles' size.
+        x (numpy.ndarray): The x-coordinates of the rectangles.
+        y (numpy.ndarray): The y-coordinates of the rectangles.
+
+    Returns:
+        numpy.ndarray: Whether each rectangle may overlap an obstacle. Rectangles not flagged do not.
+    """
+    rows, columns = mask.shape
+
+    # Corners off the screen are looked up in the nearest pixel, which the mask marks conservatively
+    column = np.clip(x, 0, columns - 1).astype(np.intp)
+    row = np.clip(y, 0, rows - 1).astype(np.intp)
+    row *= columns
+    row += column
+    return mask.ravel().take(row)
+
+def obstacle_bounds(obstacles):
+    """
+    Lays the obstacles out for `overlap_obstacles`.
+
+    Args:
+        obstacles (ObstacleGrid): The obstacles, built for a screen size.
+
+    Returns:
+        tuple: The left, top, right and bottom edges of the obstacles, each with one row per obstacle.
+    """
+    rects = np.array(list(obstacles), dtype=np.float64).reshape(-1, 4, 1)
+    left, top, width, height = rects.transpose(1, 0, 2)
+    return left, top, left + width, top + height
+
+def overlap_obstacles(bounds, x, y, width, height):
+    """
+    Vectorized ObstacleGrid.blocking.
+
+    Args:
+        bounds (tuple): The obstacles laid out by `obstacle_bounds`.
+        x (numpy.ndarray): The x-coordinates of the rectangles.
+        y (numpy.ndarray): The y-coordinates of the rectangles.
+        width (numpy.ndarray or float): The widths of the rectangles.
+        height (numpy.ndarray or float): The heights of the rectangles.
+
+    Returns:
+        numpy.ndarray: Whether each rectangle overlaps any obstacle. Touching an obstacle's edge does not count.
+    """
+    left, top, right, bottom = bounds
+    return ((x < right) & (left < x + width) & (y < bottom) & (top < y + height)).any(axis=0)
+
+class FlySwarm:
+    # Per-fly arrays and their types
+    FIELDS = {
+        "x": np.float64, "y": np.float64,
+        "previous_x": np.float64, "previous_y": np.float64,
+        "width": np.float64, "height": np.float64,
+        "dx": np.int8, "dy": np.int8,
+        "special": np.bool_, "facing_left": np.bool_
+    }
+
+    def __init__(self, capacity=1024, seed=None):
+        """
+        Initializes a structure-of-arrays store that moves a whole fly population with NumPy.
+
+        Movement directions are stored as -1, 0 or 1 per axis (`dx` is left/right, `dy` is up/down),
+        which mirrors the `movement` dictionaries used by Fly and SpecialFly.
+
+        Args:
+            capacity (int, optional): Initial number of flies the arrays can hold. Grows as needed. Defaults to 1024.
+            seed (int, optional): Seed for the swarm's random generator. Defaults to None.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.speed = FLY_SPEED
+        self.count = 0
+        self.obstacle_key = None  # Obstacle layout, screen size and fly size `obstacle_mask` was built for
+        self.obstacle_mask = None
+        self.obstacle_bounds = None
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """
+        Allocates (or grows) the per-fly arrays, keeping the existing flies.
+
+        Args:
+            capacity (int): The number of flies the arrays should hold.
+        """
+        old = self.count
+        for name, dtype in self.FIELDS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)[:old]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def reseed(self, seed):
+        """
+        Restarts the swarm's random generator from a seed.
+
+        Args:
+            seed (int): The new seed.
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """
+        Removes all flies from the swarm.
+        """
+        self.count = 0
+
+    def spawn(self, n, screen_width, screen_height, width, height, special=False):
+        """
+        Spawns flies using the same placement and movement rules as Fly and SpecialFly.
+
+        Args:
+            n (int): The number of flies to spawn.
+            screen_width (int): The width of the screen.
+            screen_height (int): The height of the screen.
+            width (float): The width of each fly.
+            height (float): The height of each fly.
+            special (bool, optional): Whether to spawn special flies. Defaults to False.
+        """
+        if not n:
+            return
+        if self.count + n > self.capacity:
+            self.allocate(max(self.count + n, self.capacity * 2))
+
+        new = slice(self.count, self.count + n)
+        self.width[new] = width
+        self.height[new] = height
+        self.special[new] = special
+
+        if special:
+            # Special flies spawn between the first and third quarter of the screen
+            self.x[new] = self.rng.integers(int(screen_width) // 4, 3 * int(screen_width) // 4, n, endpoint=True)
+            self.y[new] = self.rng.integers(int(screen_height) // 4, 3 * int(screen_height) // 4, n, endpoint=True)
+        else:
+            self.x[new] = self.rng.integers(0, int(screen_width) - int(width), n, endpoint=True)
+            self.y[new] = self.rng.integers(0, int(screen_height) - int(height), n, endpoint=True)
+        self.previous_x[new] = self.x[new]
+        self.previous_y[new] = self.y[new]
+
+        # Equivalent of Fly.generate_valid_movement
+        self.dx[new] = self.random_axis(n)
+        self.dy[new] = self.random_axis(n)
+        self.ensure_at_least_one_direction(np.arange(self.count, self.count + n))
+        self.facing_left[new] = self.dx[new] <= 0
+        self.count += n
+
+        if special:
+            self.adjust_movement(new, screen_width, screen_height)
+
+    def add_fly(self, fly, special=False):
+        """
+        Copies an existing Fly or SpecialFly into the swarm.
+
+        Args:
+            fly (Fly): The fly to copy.
+            special (bool, optional): Whether the fly should follow the special fly rules. Defaults to False.
+        """
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        i = self.count
+        self.x[i], self.y[i] = fly.x, fly.y
+        self.previous_x[i], self.previous_y[i] = fly.x, fly.y
+        self.width[i], self.height[i] = fly.width, fly.height
+        self.dx[i] = int(fly.movement["right"]) - int(fly.movement["left"])
+        self.dy[i] = int(fly.movement["down"]) - int(fly.movement["up"])
+        self.special[i] = special
+        self.facing_left[i] = fly.facing_left
+        self.count += 1
+
+    def random_axis(self, n):
+        """
+        Draws one axis of movement the way two independent random booleans are resolved in Fly.
+
+        Both directions are drawn at random and, if both are set, one of them is dropped at random.
+        The result is -1 or 1 with probability 3/8 each and 0 with probability 1/4.
+
+        Args:
+            n (int): The number of values to draw.
+
+        Returns:
+            numpy.ndarray: The drawn directions as int8 values.
+        """
+        return self.resolve_axis(*(self.rng.random((3, n)) < 0.5))
+
+    @staticmethod
+    def resolve_axis(negative, positive, keep_negative):
+        """
+        Turns the random booleans drawn by `random_axis` into directions.
+
+        Args:
+            negative (numpy.ndarray): Whether the negative direction was drawn.
+            positive (numpy.ndarray): Whether the positive direction was drawn.
+            keep_negative (numpy.ndarray): Which direction is kept if both were drawn.
+
+        Returns:
+            numpy.ndarray: The directions as int8 values.
+        """
+        # Both drawn: -1 if the negative direction is kept, else 1
+        return np.where(negative & positive, 1 - 2 * keep_negative.view(np.int8),
+                        positive.view(np.int8) - negative.view(np.int8))
+
+    def ensure_at_least_one_direction(self, indices):
+        """
+        Gives a random direction to every indexed fly that is not moving at all.
+
+        Args:
+            indices (numpy.ndarray): Indices of the flies to check.
+        """
+        idle = indices[(self.dx[indices] == 0) & (self.dy[indices] == 0)]
+        if not idle.size:
+            return
+
+        # Pick one of left, right, up, down uniformly
+        choice = self.rng.integers(0, 4, idle.size)
+        self.dx[idle] = RANDOM_MOVE_DX[choice]
+        self.dy[idle] = RANDOM_MOVE_DY[choice]
+
+    def handle_edge_collision(self, indices, away, horizontal):
+        """
+        Vectorized Fly.handle_edge_collision for the flies that hit an edge.
+
+        The direction of the hit edge is cleared, the direction away from it is chosen at random,
+        and the other axis is redrawn as in Fly.generate_valid_movement.
+
+        Args:
+            indices (numpy.ndarray): Indices of the flies that hit an edge.
+            away (numpy.ndarray): The direction pointing away from the hit edge (-1 or 1) for each fly.
+            horizontal (bool): True for the left/right edges, False for the top/bottom edges.
+        """
+        if not indices.size:
+            return
+
+        # One draw for the direction away from the edge and three for the other axis, as in `random_axis`
+        turn_away, *other = self.rng.random((4, indices.size)) < 0.5
+        hit_axis = away * turn_away
+        other_axis = self.resolve_axis(*other)
+
+        # Equivalent of ensure_at_least_one_direction, without reading the directions back
+        idle = np.flatnonzero(~turn_away & (other_axis == 0))
+        if idle.size:
+            choice = self.rng.integers(0, 4, idle.size)
+            dx, dy = RANDOM_MOVE_DX[choice], RANDOM_MOVE_DY[choice]
+            hit_axis[idle], other_axis[idle] = (dx, dy) if horizontal else (dy, dx)
+
+        if horizontal:
+            self.dx[indices], self.dy[indices] = hit_axis, other_axis
+        else:
+            self.dy[indices], self.dx[indices] = hit_axis, other_axis
+
+    def adjust_movement(self, indices, screen_width, screen_height):
+        """
+        Vectorized SpecialFly.adjust_movement, turning flies back towards the screen center.
+
+        Args:
+            indices (slice or numpy.ndarray): The flies to adjust.
+            screen_width (int): The width of the screen.
+            screen_height (int): The height of the screen.
+        """
+        center_x = self.x[indices] + self.width[indices] / 2
+        center_y = self.y[indices] + self.height[indices] / 2
+        dx = self.dx[indices]
+        dy = self.dy[indices]
+
+        dx = np.where((center_x < screen_width / 2) & (dx < 0), 1, dx)
+        dx = np.where((center_x > screen_width / 2) & (dx > 0), -1, dx)
+        dy = np.where((center_y < screen_height / 2) & (dy < 0), 1, dy)
+        dy = np.where((center_y > screen_height / 2) & (dy > 0), -1, dy)
+
+        self.dx[indices] = dx
+        self.dy[indices] = dy
+        self.facing_left[indices] = np.where(dx != 0, dx < 0, self.facing_left[indices])
+
+    def obstacle_cells(self, obstacles, width, height):
+        """
+        Returns the `obstacle_mask` of the obstacles for the largest fly. Rebuilt only when the
+        obstacles were rebuilt for another layout or screen size, or the largest fly changed.
+
+        Args:
+            obstacles (ObstacleGrid): The obstacles on the screen.
+            width (float): The width of the widest fly.
+            height (float): The height of the tallest fly.
+
+        Returns:
+            numpy.ndarray: The pixels a fly's top-left corner must lie in to overlap an obstacle.
+        """
+        key = (obstacles.layout, obstacles.screen_size, width, height)
+        if key != self.obstacle_key:
+            self.obstacle_mask = obstacle_mask(obstacles, width, height)
+            self.obstacle_bounds = obstacle_bounds(obstacles)
+            self.obstacle_key = key
+        return self.obstacle_mask
+
+    def check_obstacles(self, obstacles):
+        """
+        Vectorized Fly.check_obstacles: flies that moved into an obstacle are moved back. The
+        bounces are left to the caller, which makes them together with the edge bounces.
+
+        The obstacle mask rules out every fly away from the obstacles; only the remaining flies
+        are tested against the obstacles themselves.
+
+        Args:
+            obstacles (ObstacleGrid): The obstacles on the screen.
+
+        Returns:
+            tuple: (hit_x, away_x, hit_y, away_y), the indices of the flies that were moved back along
+                   each axis and the direction pointing away from the obstacle (-1 or 1) for each fly.
+        """
+        n = self.count
+        none = np.empty(0, dtype=np.intp)
+        if not n or not len(obstacles):
+            return none, none, none, none
+
+        x, y = self.x[:n], self.y[:n]
+        mask = self.obstacle_cells(obstacles, self.width[:n].max(), self.height[:n].max())
+        candidates = np.flatnonzero(near_obstacles(mask, x, y))
+        if not candidates.size:
+            return none, none, none, none
+
+        bounds = self.obstacle_bounds
+        width, height = self.width[candidates], self.height[candidates]
+
+        def blocked(fly_x, fly_y):
+            # Whether each candidate overlaps any obstacle at the given position
+            return overlap_obstacles(bounds, fly_x, fly_y, width, height)
+
+        # Only flies that are inside an obstacle now but were not before entered one
+        previous_x, previous_y = self.previous_x[candidates], self.previous_y[candidates]
+        new_x, new_y = x[candidates], y[candidates]
+        entered = blocked(new_x, new_y) & ~blocked(previous_x, previous_y)
+        if not entered.any():
+            return none, none, none, none
+
+        candidates, new_x, new_y = candidates[entered], new_x[entered], new_y[entered]
+        previous_x, previous_y = previous_x[entered], previous_y[entered]
+        width, height = width[entered], height[entered]
+        blocked_x = blocked(new_x, previous_y)
+        blocked_y = blocked(previous_x, new_y)
+        corner = ~blocked_x & ~blocked_y  # Only moving along both axes led into the obstacle
+        blocked_x |= corner
+        blocked_y |= corner
+
+        hit_x, hit_y = candidates[blocked_x], candidates[blocked_y]
+        x[hit_x] = previous_x[blocked_x]
+        y[hit_y] = previous_y[blocked_y]
+        return (hit_x, np.where(new_x[blocked_x] < previous_x[blocked_x], 1, -1),
+                hit_y, np.where(new_y[blocked_y] < previous_y[blocked_y], 1, -1))
+
+    def step(self, screen_width, screen_height, dt=1.0, obstacles=None):
+        """
+        Advances every fly by one simulation step, bouncing regular flies off the edges and
+        removing special flies that left the screen.
+
+        Args:
+            screen_width (int): The width of the screen.
+            screen_height (int): The height of the screen.
+            dt (float, optional): The length of the simulation step in base ticks (1/60 s). Defaults to 1.0.
+            obstacles (ObstacleGrid, optional): Obstacles every fly bounces off. Defaults to None.
+
+        Returns:
+            int: The number of special flies removed for leaving the screen.
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        width, height = self.width[:n], self.height[:n]
+        dx, dy = self.dx[:n], self.dy[:n]
+        special = self.special[:n]
+        specials = np.flatnonzero(special)
+
+        self.previous_x[:n] = x
+        self.previous_y[:n] = y
+        x += dx * (self.speed * dt)
+        y += dy * (self.speed * dt)
+
+        # Regular flies are clamped inside the screen (Fly.move). Clamping every fly and putting
+        # the few special flies back is much cheaper than a masked clip
+        special_x, special_y = x[specials], y[specials]
+        right, bottom = screen_width - width, screen_height - height
+        np.maximum(x, 0, out=x)
+        np.minimum(x, right, out=x)
+        np.maximum(y, 0, out=y)
+        np.minimum(y, bottom, out=y)
+        x[specials], y[specials] = special_x, special_y
+
+        if obstacles is not None:
+            obstacle_x, obstacle_away_x, obstacle_y, obstacle_away_y = self.check_obstacles(obstacles)
+
+        # Bounce regular flies off the edges (Fly.check_edges)
+        hit_x = np.flatnonzero((x <= 0) | (x >= right))
+        hit_x = hit_x[~special[hit_x]]
+        away_x = np.where(x[hit_x] <= 0, 1, -1)
+        hit_y = np.flatnonzero((y <= 0) | (y >= bottom))
+        hit_y = hit_y[~special[hit_y]]
+        away_y = np.where(y[hit_y] <= 0, 1, -1)
+
+        if obstacles is not None and (obstacle_x.size or obstacle_y.size):
+            # Fly.move bounces off obstacles before the edges, and every bounce redraws both axes, so
+            # only a fly's last bounce counts. Obstacle bounces followed by an edge bounce are dropped,
+            # and the rest join the edge bounces, which saves two rounds of random draws per step
+            edge_x, edge_y = np.zeros(n, dtype=np.bool_), np.zeros(n, dtype=np.bool_)
+            edge_x[hit_x] = True
+            edge_y[hit_y] = True
+            last = ~(edge_x[obstacle_y] | edge_y[obstacle_y])
+            hit_y, away_y = np.concatenate((obstacle_y[last], hit_y)), np.concatenate((obstacle_away_y[last], away_y))
+            last = ~edge_x[obstacle_x]
+            hit_x, away_x = np.concatenate((obstacle_x[last], hit_x)), np.concatenate((obstacle_away_x[last], away_x))
+        self.handle_edge_collision(hit_x, away_x, horizontal=True)
+        self.handle_edge_collision(hit_y, away_y, horizontal=False)
+
+        # Keep the facing in sync with the horizontal direction (Fly.update_image)
+        facing_left = self.facing_left[:n]
+        facing_left &= dx == 0
+        facing_left |= dx < 0
+
+        # Remove special flies that moved off the screen (SpecialFly.is_on_screen)
+        off_screen = specials[(x[specials] + width[specials] <= 0) | (x[specials] >= screen_width) |
+                              (y[specials] + height[specials] <= 0) | (y[specials] >= screen_height)]
+        if off_screen.size:
+            mask = np.zeros(n, dtype=np.bool_)
+            mask[off_screen] = True
+            self.remove(mask)
+        return off_screen.size
+
+    def collide(self, x, y, width, height):
+        """
+        Finds the flies overlapping a rectangle, using the same integer truncation as pygame.Rect.
+
+        The rectangle can also be given as arrays with one value per fly, to test every fly
+        against its own rectangle.
+
+        Args:
+            x (float or numpy.ndarray): The x-coordinate of the rectangle.
+            y (float or numpy.ndarray): The y-coordinate of the rectangle.
+            width (float or numpy.ndarray): The width of the rectangle.
+            height (float or numpy.ndarray): The height of the rectangle.
+
+        Returns:
+            numpy.ndarray: A boolean mask over the current flies.
+        """
+        n = self.count
+        left, top, w, h = np.trunc(x), np.trunc(y), np.trunc(width), np.trunc(height)
+        fly_left = np.trunc(self.x[:n])
+        fly_top = np.trunc(self.y[:n])
+        fly_w = np.trunc(self.width[:n])
+        fly_h = np.trunc(self.height[:n])
+        return ((w > 0) & (h > 0) & (fly_w > 0) & (fly_h > 0) &
+                (fly_left < left + w) & (left < fly_left + fly_w) &
+                (fly_top < top + h) & (top < fly_top + fly_h))
+
+    def remove(self, mask):
+        """
+        Removes the flies selected by a boolean mask, compacting the arrays in place.
+
+        Args:
+            mask (numpy.ndarray): A boolean mask over the current flies.
+        """
+        keep = np.flatnonzero(~mask)
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:keep.size] = array[keep]
+        self.count = keep.size
+
+    def resize(self, new_width, new_height):
+        """
+        Updates the size of every fly.
+
+        Args:
+            new_width (float): The new width of the flies.
+            new_height (float): The new height of the flies.
+        """
+        self.width[:self.count] = new_width
+        self.height[:self.count] = new_height
+
+    def reposition(self, width_scale, height_scale):
+        """
+        Scales every fly's position to keep its relative placement after a resize.
+
+        Args:
+            width_scale (float): Factor to scale the x positions.
+            height_scale (float): Factor to scale the y positions.
+        """
+        self.x[:self.count] *= width_scale
+        self.y[:self.count] *= height_scale
+        self.previous_x[:self.count] *= width_scale
+        self.previous_y[:self.count] *= height_scale
+
+    def draw(self, screen, doreturn=False, alpha=1.0):
+        """
+        Renders all flies with one batched blit call.
+
+        Args:
+            screen (pygame.Surface): The screen where the flies will be drawn.
+            doreturn (bool, optional): Whether to return the drawn areas. Defaults to False.
+            alpha (float, optional): How far to interpolate between the previous and current
+                                     positions, from 0.0 to 1.0. Defaults to 1.0.
+
+        Returns:
+            list: The pygame.Rect areas that were drawn, or None if `doreturn` is False.
+        """
+        return screen.blits(self.blit_sequence(alpha), doreturn=doreturn)
+
+    def blit_sequence(self, alpha=1.0):
+        """
+        Builds the (surface, position) pairs of all flies for `Surface.blits`.
+
+        Args:
+            alpha (float, optional): How far to interpolate between the previous and current
+                                     positions, from 0.0 to 1.0. Defaults to 1.0.
+
+        Returns:
+            list: One (surface, (x, y)) pair per fly.
+        """
+        images = {
+            (False, True): (ASSETS.get("fly_left"), "left"), (False, False): (ASSETS.get("fly_right"), "right"),
+            (True, True): (ASSETS.get("special_fly_left"), "left"), (True, False): (ASSETS.get("special_fly_right"), "right")
+        }
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            x = self.previous_x[:n] + (x - self.previous_x[:n]) * alpha
+            y = self.previous_y[:n] + (y - self.previous_y[:n]) * alpha
+
+        blits = []
+        for special, facing_left, x, y, width, height in zip(
+                self.special[:n].tolist(), self.facing_left[:n].tolist(),
+                x.tolist(), y.tolist(),
+                self.width[:n].tolist(), self.height[:n].tolist()):
+            image, facing = images[(special, facing_left)]
+            blits.append((get_scaled_sprite(image, facing, width, height), (x, y)))
+        return blits
@@ -1,64 +1,142 @@
+from itertools import chain
+from math import ceil
 import pygame
-from constants import BLACK_COLOR, GOLD_COLOR, GRAY_COLOR
+from constants import BLACK_COLOR, OBSTACLE_COLOR, POPUP_DURATION
+from font_manager import FONT_MANAGER
+from popups import POPUP_LABELS
+from special_fly import SpecialFly
 
-def draw_flies(game_state, screen):
+# Sprite types in the order they are drawn, later types end up on top
+DRAW_ORDER = ("frog", "flies", "special_flies", "swarm", "popups", "hud")
+
+def fly_draw_lists(game_state, alpha=1.0, fly_share=None):
+    """
+    Builds the (surface, position) pairs of all flies, grouped by sprite type.
+
+    Args:
+        game_state (object): The game state containing the list of flies.
+        alpha (float, optional): Interpolation between the previous and current simulation step. Defaults to 1.0.
+        fly_share (float, optional): Draws only this share of the regular flies, rounded up; special flies are
+                                     always drawn. With the swarm backend, this share of all flies. Defaults to
+                                     None, which draws every fly.
+
+    Returns:
+        dict: The "flies", "special_flies" and "swarm" draw lists.
+    """
+    flies = []
+    special_flies = []
+
+    # Inlined rather than calling fly.blit_args, the per-fly method call dominates with thousands of flies
+    if alpha < 1.0:
+        for fly in game_state.flies:
+            previous_x, previous_y = fly.previous_x, fly.previous_y
+            (special_flies if isinstance(fly, SpecialFly) else flies).append(
+                (fly.img, (previous_x + (fly.x - previous_x) * alpha, previous_y + (fly.y - previous_y) * alpha)))
+    else:
+        for fly in game_state.flies:
+            (special_flies if isinstance(fly, SpecialFly) else flies).append((fly.img, (fly.x, fly.y)))
+
+    swarm = game_state.swarm.blit_sequence(alpha) if game_state.swarm is not None else []
+    if fly_share is not None:
+        del flies[ceil(len(flies) * fly_share):]
+        del swarm[ceil(len(swarm) * fly_share):]
+    return {"flies": flies, "special_flies": special_flies, "swarm": swarm}
+
+def draw_batch(screen, draw_lists, doreturn=True):
+    """
+    Draws several draw lists with a single `Surface.blits` call, in DRAW_ORDER.
+
+    Args:
+        screen (pygame.Surface): The surface to draw on.
+        draw_lists (dict): (surface, position) lists keyed by sprite type. Missing types are skipped.
+        doreturn (bool, optional): Whether to return the drawn areas. Defaults to True.
+
+    Returns:
+        list: The pygame.Rect areas that were drawn, or None if `doreturn` is False.
+    """
+    batch = chain.from_iterable(draw_lists[kind] for kind in DRAW_ORDER if kind in draw_lists)
+    return screen.blits(batch, doreturn=doreturn)
+
+def draw_flies(game_state, screen, alpha=1.0):
     """
     Draws all flies on the screen.
 
     Args:
         game_state (object): The game state containing the list of flies.
         screen (pygame.Surface): The game screen where the flies will be drawn.
+        alpha (float, optional): Interpolation between the previous and current simulation step. Defaults to 1.0.
+
+    Returns:
+        list: The pygame.Rect areas that were drawn.
+    """
+    return draw_batch(screen, fly_draw_lists(game_state, alpha))
+
+def popup_draw_list(score_popups, screen_height):
     """
-    for fly in game_state.flies:
-        fly.draw(screen)
+    Builds the (surface, position) pairs of the active score popups and removes expired ones.
+
+    Args:
+        score_popups (PopupBuffer): The score popups, see `draw_popups`.
+        screen_height (int): The height of the game screen, used for the font size.
+
+    Returns:
+        list: One (surface, (x, y)) pair per active popup.
+    """
+    current_time = pygame.time.get_ticks()
+    font_size = int(screen_height * 0.05)
+    score_popups.expire(current_time, POPUP_DURATION)  # Show for 1 second
+
+    return [(POPUP_LABELS.get(special, font_size, current_time - time), (x, y - 20))
+            for x, y, time, special in score_popups]
 
 def draw_popups(score_popups, screen, screen_height):
     """
     Draws score popups on the screen and removes expired ones.
 
     Args:
-        score_popups (list): A list of dictionaries, each representing a popup with keys:
-            - "time" (int): The timestamp when the popup was created.
-            - "pos" (tuple): The (x, y) position of the popup.
-            - "special" (bool): Whether it's a special popup (+25s) or a normal one (+5s).
+        score_popups (PopupBuffer): The popups, each with the (x, y) position of the caught fly,
+            the timestamp when it was created and whether it's a special popup (+5s) or a normal one (+1).
         screen (pygame.Surface): The game screen where the popups will be drawn.
+
+    Returns:
+        list: The pygame.Rect areas that were drawn.
     """
-    current_time = pygame.time.get_ticks()
-    font = pygame.font.Font(None, int(screen_height * 0.05))
-    
-    active_popups = []  # Collect active popups to update the list for the next frame
+    return screen.blits(popup_draw_list(score_popups, screen_height))
 
-    for popup in score_popups:
-        if current_time - popup["time"] < 1000:  # Show for 1 second
-            color = GOLD_COLOR if popup["special"] else GRAY_COLOR
-            text = font.render("+5s" if popup["special"] else "+1", True, color)
-            screen.blit(text, (popup["pos"][0], popup["pos"][1] - 20))
-            active_popups.append(popup)  # Keep active popups
+def draw_obstacles(screen, obstacles):
+    """
+    Draws the obstacles on the screen.
 
-    score_popups[:] = active_popups  # Update list with active popups only
+    Args:
+        screen (pygame.Surface): The game screen where the obstacles will be drawn.
+        obstacles (ObstacleGrid): The obstacles to draw.
+    """
+    for rect in obstacles:
+        screen.fill(OBSTACLE_COLOR, rect)
 
-def draw_score_and_time(screen, screen_height, score, time_remaining):
+def hud_draw_list(screen_height, score, time_remaining):
     """
-    Draws the score and remaining time on the screen.
+    Builds the (surface, position) pairs of the score and remaining time.
 
     Args:
-        screen (pygame.Surface): The game screen where the score and time will be displayed.
+        screen_height (int): The height of the game screen, used for the font size.
         score (int): The current score of the player.
         time_remaining (int): The remaining time in seconds.
+
+    Returns:
+        list: The score and time text as (surface, (x, y)) pairs.
     """
     font_size = int(screen_height * 0.05)
-    font = pygame.font.SysFont("Arial", font_size)
     score_x_position = 10
     minutes = time_remaining // 60
     seconds = time_remaining % 60
 
     # Render the score text
-    score_text = font.render(f"Score: {score}", True, BLACK_COLOR)
+    score_text = FONT_MANAGER.render(f"Score: {score}", font_size, BLACK_COLOR, face="Arial")
     score_width = score_text.get_width()
-    screen.blit(score_text, (score_x_position, 10))  # Display score at position (10, 10)
 
     # Render the time remaining text
-    time_text = font.render(f"{minutes:02}:{seconds:02}", True, BLACK_COLOR)  # Format time as MM:SS
+    time_text = FONT_MANAGER.render(f"{minutes:02}:{seconds:02}", font_size, BLACK_COLOR, face="Arial")  # Format time as MM:SS
     time_width = time_text.get_width()
 
     # Calculate x-coordinate to center the time text under the score
@@ -66,9 +144,40 @@ def draw_score_and_time(screen, screen_height, score, time_remaining):
 
     # Position the time based on the font size (to keep spacing proportional)
     vertical_spacing = int(font_size * 1.2)  # 1.2x font size as spacing
-    screen.blit(time_text, (time_x_position, int(screen_height * 0.02) + vertical_spacing)) 
+    return [(score_text, (score_x_position, 10)),  # Display score at position (10, 10)
+            (time_text, (time_x_position, int(screen_height * 0.02) + vertical_spacing))]
+
+def game_hud_draw_list(game_state, screen_height, start_time):
+    """
+    Builds the (surface, position) pairs of a running game's score and remaining time.
+
+    Args:
+        game_state (GameState): The current state of the game.
+        screen_height (int): The height of the game screen, used for the font size.
+        start_time (int): The timestamp when the game started, used for countdown calculations.
+
+    Returns:
+        list: The score and time text as (surface, (x, y)) pairs, see `hud_draw_list`.
+    """
+    elapsed_time = (pygame.time.get_ticks() - start_time) // 1000
+    remaining_time = max(0, game_state.countdown_time - elapsed_time)
+    return hud_draw_list(screen_height, game_state.score, remaining_time)
+
+def draw_score_and_time(screen, screen_height, score, time_remaining):
+    """
+    Draws the score and remaining time on the screen.
+
+    Args:
+        screen (pygame.Surface): The game screen where the score and time will be displayed.
+        score (int): The current score of the player.
+        time_remaining (int): The remaining time in seconds.
 
-def draw_game_objects(game_state, screen_manager, start_time):
+    Returns:
+        list: The pygame.Rect areas of the score and time text.
+    """
+    return screen.blits(hud_draw_list(screen_height, score, time_remaining))
+
+def draw_game_objects(game_state, screen_manager, start_time, alpha=1.0, doreturn=True, quality=None):
     """
     Updates and renders all game objects on the screen.
 
@@ -76,17 +185,49 @@ def draw_game_objects(game_state, screen_manager, start_time):
         game_state (GameState): The current state of the game, including frog, flies, score, etc.
         screen_manager (ScreenManager): Manages the game screen.
         start_time (int): The timestamp when the game started, used for countdown calculations.
+        alpha (float, optional): Interpolation between the previous and current simulation step. Defaults to 1.0.
+        doreturn (bool, optional): Whether to collect the drawn areas. Defaults to True.
+        quality (QualityGovernor, optional): Decides what to leave out on slow machines. Defaults to None, full quality.
+
+    Returns:
+        list: The pygame.Rect areas that were drawn, or None if `doreturn` is False.
     """
     screen_manager.clear()  # Clear the screen to prepare for new frame rendering
+    return draw_game_elements(game_state, screen_manager, start_time, alpha, doreturn, quality)
 
-    # Draw individual game elements
-    game_state.frog.draw(screen_manager.screen)  # Draw frog
-    draw_flies(game_state, screen_manager.screen)  # Draw flies
-    draw_popups(game_state.score_popups, screen_manager.screen, screen_manager.height)  # Draw score popups (+5s and +25s)
+def draw_game_elements(game_state, screen_manager, start_time, alpha=1.0, doreturn=True, quality=None, hud=True):
+    """
+    Renders the obstacles, frog, flies, popups and HUD on top of the current screen contents.
 
-    # Calculate the remaining time
-    elapsed_time = (pygame.time.get_ticks() - start_time) // 1000
-    remaining_time = max(0, game_state.countdown_time - elapsed_time)
+    Args:
+        game_state (GameState): The current state of the game, including frog, flies, score, etc.
+        screen_manager (ScreenManager): Manages the game screen.
+        start_time (int): The timestamp when the game started, used for countdown calculations.
+        alpha (float, optional): Interpolation between the previous and current simulation step. Defaults to 1.0.
+        doreturn (bool, optional): Whether to collect the drawn areas. Defaults to True.
+        quality (QualityGovernor, optional): Decides what to leave out on slow machines. Defaults to None, full quality.
+        hud (bool, optional): Whether to draw the score and time. Defaults to True.
+
+    Returns:
+        list: The pygame.Rect areas that were drawn, or None if `doreturn` is False.
+    """
+    # Obstacles never move, so only the parts erased under last frame's sprites change. Those areas
+    # are pushed to the display anyway, so the obstacles are not reported as drawn
+    draw_obstacles(screen_manager.screen, game_state.obstacles)
+
+    if quality is not None and not quality.interpolate:
+        alpha = 1.0  # Sprites are drawn where the last step left them, without computing positions in between
+
+    # Draw the frog, flies, score popups (+5s and +25s) and HUD in one batch
+    draw_lists = fly_draw_lists(game_state, alpha, quality.fly_share if quality is not None else None)
+    draw_lists["frog"] = [game_state.frog.blit_args(alpha)]
+
+    if quality is None or quality.popups:
+        draw_lists["popups"] = popup_draw_list(game_state.score_popups, screen_manager.height)
+    else:
+        game_state.score_popups.expire(pygame.time.get_ticks(), POPUP_DURATION)
+
+    if hud:
+        draw_lists["hud"] = game_hud_draw_list(game_state, screen_manager.height, start_time)
 
-    # Draw score and time
-    draw_score_and_time(screen_manager.screen, screen_manager.height, game_state.score, remaining_time)
+    return draw_batch(screen_manager.screen, draw_lists, doreturn)
@@ -0,0 +1,280 @@
+import numpy as np
+from constants import (BASE_TICK_RATE, FLY_SPAWN_INTERVAL, FROG_SPEED, GAME_DURATION, INITIAL_FLY_COUNT,
+                       INITIAL_SCREEN_HEIGHT, INITIAL_SCREEN_WIDTH, OBSTACLE_LAYOUT, SIMULATION_RATE,
+                       SPECIAL_FLY_SPAWN_INTERVAL)
+from obstacles import ObstacleGrid
+from scheduler import ms_to_ticks
+from swarm import FlySwarm, obstacle_bounds, overlap_obstacles
+
+# Frog movement per action as (dx, dy): stay, the four arrow keys and the four diagonals
+ACTIONS = np.array([(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)], dtype=np.int8)
+
+class MultiSwarm(FlySwarm):
+    # Every fly also records which environment it belongs to
+    FIELDS = {**FlySwarm.FIELDS, "env": np.int32}
+
+    def spawn_in(self, envs, screen_width, screen_height, width, height, special=False):
+        """
+        Spawns one fly in each of the given environments.
+
+        Args:
+            envs (numpy.ndarray): Environment index of every fly to spawn. May repeat an index.
+            screen_width (int): The width of the screen.
+            screen_height (int): The height of the screen.
+            width (float): The width of each fly.
+            height (float): The height of each fly.
+            special (bool, optional): Whether to spawn special flies. Defaults to False.
+        """
+        if not envs.size:
+            return
+        first = self.count
+        self.spawn(envs.size, screen_width, screen_height, width, height, special=special)
+        self.env[first:self.count] = envs
+
+    def remove(self, mask):
+        """
+        Removes the flies selected by a boolean mask by moving the last remaining flies into the gaps.
+
+        Flies of different games don't interact, so their order does not matter, and filling the
+        gaps only touches as many flies as were removed instead of compacting every array.
+
+        Args:
+            mask (numpy.ndarray): A boolean mask over the current flies.
+        """
+        removed = np.flatnonzero(mask)
+        count = self.count - removed.size
+        gaps = removed[removed < count]
+        movers = count + np.flatnonzero(~mask[count:])
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[gaps] = array[movers]
+        self.count = count
+
+class VectorEnv:
+    def __init__(self, num_envs, screen_width=INITIAL_SCREEN_WIDTH, screen_height=INITIAL_SCREEN_HEIGHT,
+                 seed=None, nearest_flies=8, obstacle_layout=OBSTACLE_LAYOUT):
+        """
+        Initializes a batch of games that advance in lockstep, for training automated players.
+
+        All frogs, scores and timers are stacked in arrays with one entry per game, and the flies of
+        every game share one MultiSwarm, so a step costs a fixed number of NumPy operations no matter
+        how many games are played. The rules mirror update_frog_and_flies with the FlySwarm backend,
+        obstacles included, and flies spawn after the same steps as with GameState's scheduler.
+
+        Args:
+            num_envs (int): Number of games.
+            screen_width (int, optional): The width of every game's screen. Defaults to INITIAL_SCREEN_WIDTH.
+            screen_height (int, optional): The height of every game's screen. Defaults to INITIAL_SCREEN_HEIGHT.
+            seed (int, optional): Seed for the random generator shared by all games. Defaults to None.
+            nearest_flies (int, optional): Number of flies included in each observation. Defaults to 8.
+            obstacle_layout (tuple, optional): The obstacles of every game, see ObstacleGrid.
+                                               Defaults to OBSTACLE_LAYOUT.
+        """
+        self.num_envs = num_envs
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.nearest_flies = nearest_flies
+        self.swarm = MultiSwarm(capacity=num_envs * INITIAL_FLY_COUNT * 2, seed=seed)
+
+        # Entity sizes follow GameState.reset
+        self.frog_width = screen_width / 10
+        self.frog_height = screen_width / 12
+        self.fly_width = screen_width / 25
+        self.fly_height = screen_width / 25
+
+        # A fly overlaps a frog when its truncated offset from the frog is less than
+        # `catch_extent` away from `catch_center` on both axes (see pygame.Rect.colliderect)
+        frog_size = np.trunc((self.frog_width, self.frog_height))
+        fly_size = np.trunc((self.fly_width, self.fly_height))
+        self.catch_center = (frog_size - fly_size) / 2
+        self.catch_extent = (frog_size + fly_size) / 2
+
+        # Every game has the same screen size, so one grid serves all of them
+        self.obstacles = ObstacleGrid(obstacle_layout)
+        self.obstacles.build(screen_width, screen_height)
+        self.obstacle_bounds = obstacle_bounds(self.obstacles)
+
+        self.dt = BASE_TICK_RATE / SIMULATION_RATE
+        self.fly_every = ms_to_ticks(FLY_SPAWN_INTERVAL)
+        self.special_every = ms_to_ticks(SPECIAL_FLY_SPAWN_INTERVAL)
+
+        self.frog_x = np.zeros(num_envs)
+        self.frog_y = np.zeros(num_envs)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.countdown_time = np.zeros(num_envs, dtype=np.int64)  # Seconds, extended by special catches
+        self.tick = np.zeros(num_envs, dtype=np.int64)  # Simulation steps completed in each game
+
+    def reset(self, seed=None):
+        """
+        Starts a new game in every environment.
+
+        Args:
+            seed (int, optional): Reseeds the random generator first. Defaults to None.
+
+        Returns:
+            dict: The observations, see `observe`.
+        """
+        if seed is not None:
+            self.swarm.reseed(seed)
+        self.swarm.clear()
+        self.reset_envs(np.ones(self.num_envs, dtype=np.bool_))
+        return self.observe()
+
+    def reset_envs(self, mask):
+        """
+        Starts a new game in the selected environments, leaving the others untouched.
+
+        Args:
+            mask (numpy.ndarray): A boolean mask over the environments.
+        """
+        envs = np.flatnonzero(mask)
+        if not envs.size:
+            return
+
+        if self.swarm.count:
+            self.swarm.remove(mask[self.swarm.env[:self.swarm.count]])
+
+        self.frog_x[envs] = self.screen_width / 2
+        self.frog_y[envs] = self.screen_height / 2
+        self.score[envs] = 0
+        self.countdown_time[envs] = GAME_DURATION
+        self.tick[envs] = 0
+        self.swarm.spawn_in(np.repeat(envs, INITIAL_FLY_COUNT), self.screen_width, self.screen_height,
+                            self.fly_width, self.fly_height)
+
+    def step(self, actions, observe=True):
+        """
+        Advances every game by one simulation step. Finished games are restarted automatically,
+        so the returned observations of those games belong to their new game.
+
+        Building the observations costs about as much as the step itself, so steps whose
+        observations are not looked at (e.g. repeating an action for several steps) can skip it.
+
+        Args:
+            actions (numpy.ndarray): One index into ACTIONS per game.
+            observe (bool, optional): Whether to build the observations. Defaults to True.
+
+        Returns:
+            tuple: (observations, rewards, dones), where rewards holds the flies caught in each game
+                   this step and dones flags the games that ended. Observations are None if `observe` is False.
+        """
+        swarm = self.swarm
+        width, height = self.screen_width, self.screen_height
+
+        # Spawn timers, firing after the same steps as GameState's scheduler
+        ticking = self.tick > 0
+        swarm.spawn_in(np.flatnonzero(ticking & (self.tick % self.fly_every == 0)),
+                       width, height, self.fly_width, self.fly_height)
+        swarm.spawn_in(np.flatnonzero(ticking & (self.tick % self.special_every == 0)),
+                       width, height, self.fly_width, self.fly_height, special=True)
+        self.tick += 1
+
+        # Frog.move, with the arrow keys given by the action. Each axis is blocked by obstacles on its own
+        step = FROG_SPEED * self.dt
+        move = ACTIONS[np.asarray(actions)]
+        previous_x = self.frog_x.copy()
+        self.frog_x -= step * ((move[:, 0] < 0) & (self.frog_x > 0))
+        self.frog_x += step * ((move[:, 0] > 0) & (self.frog_x + self.frog_width < width))
+        self.block_frogs(previous_x, self.frog_y)
+        previous_y = self.frog_y.copy()
+        self.frog_y -= step * ((move[:, 1] < 0) & (self.frog_y > 0))
+        self.frog_y += step * ((move[:, 1] > 0) & (self.frog_y + self.frog_height < height))
+        self.block_frogs(self.frog_x, previous_y)
+
+        # update_swarm: flies overlapping their game's frog are caught before the flies move.
+        # Every rectangle has the same size, so the overlap test of pygame.Rect reduces to the
+        # truncated offsets lying in a fixed range around each frog. Offsets within two pixels of
+        # that range on the x axis pick the few candidates the exact test is needed for
+        n = swarm.count
+        env = swarm.env[:n]
+        offset_x = swarm.x[:n] - self.frog_x.take(env)
+        offset_x -= self.catch_center[0]
+        caught = np.flatnonzero(np.abs(offset_x, out=offset_x) < self.catch_extent[0] + 2)
+        near = env[caught]
+        caught = caught[(np.abs(np.trunc(swarm.x[caught]) - np.trunc(self.frog_x[near]) - self.catch_center[0])
+                         < self.catch_extent[0]) &
+                        (np.abs(np.trunc(swarm.y[caught]) - np.trunc(self.frog_y[near]) - self.catch_center[1])
+                         < self.catch_extent[1])]
+        caught_env = env[caught]
+        special = swarm.special[caught]
+        regular_catches = np.bincount(caught_env[~special], minlength=self.num_envs)
+        special_catches = np.bincount(caught_env[special], minlength=self.num_envs)
+        self.score += regular_catches
+        self.countdown_time += 5 * special_catches
+        if caught.size:
+            mask = np.zeros(n, dtype=np.bool_)
+            mask[caught] = True
+            swarm.remove(mask)
+
+        swarm.step(width, height, self.dt, self.obstacles)
+
+        dones = self.tick >= self.countdown_time * SIMULATION_RATE
+        self.reset_envs(dones)
+        rewards = (regular_catches + special_catches).astype(np.float32)
+        return self.observe() if observe else None, rewards, dones
+
+    def block_frogs(self, previous_x, previous_y):
+        """
+        Moves frogs back if their move along one axis took them into an obstacle, like Frog.move.
+        A frog that did not move overlaps an obstacle at both positions or at neither, so it stays put.
+
+        Args:
+            previous_x (numpy.ndarray): The frogs' x-coordinates before the move.
+            previous_y (numpy.ndarray): The frogs' y-coordinates before the move. Only one of the
+                                        two axes may differ from the current positions.
+        """
+        if not len(self.obstacles):
+            return
+        width, height = self.frog_width, self.frog_height
+        blocked = np.flatnonzero(overlap_obstacles(self.obstacle_bounds, self.frog_x, self.frog_y, width, height))
+        blocked = blocked[~overlap_obstacles(self.obstacle_bounds, previous_x[blocked], previous_y[blocked],
+                                             width, height)]
+        self.frog_x[blocked] = previous_x[blocked]
+        self.frog_y[blocked] = previous_y[blocked]
+
+    def observe(self):
+        """
+        Builds fixed-size observations of every game.
+
+        Returns:
+            dict: `frog` positions (num_envs, 2), seconds of `time_remaining` (num_envs,), `score`
+                  (num_envs,) and the `flies` nearest to each frog (num_envs, nearest_flies, 3) as
+                  x and y offsets from the frog plus 1.0 for special flies. Missing flies are all zero.
+        """
+        swarm = self.swarm
+        n = swarm.count
+        k = self.nearest_flies
+        env = swarm.env[:n]
+        offset_x = swarm.x[:n] - self.frog_x.take(env)
+        offset_y = swarm.y[:n] - self.frog_y.take(env)
+
+        # Sort flies by game, then by distance, with one key (cheaper than np.lexsort)
+        distance = offset_x * offset_x
+        distance += offset_y * offset_y
+        key = env * (distance.max(initial=0.0) + 1.0)
+        key += distance
+        order = np.argsort(key)
+        sorted_env = env.take(order)
+
+        # Each fly's rank within its game picks its row of the observation. Flies past the
+        # `nearest_flies` nearest all land in one extra row per game, which is dropped
+        counts = np.bincount(env, minlength=self.num_envs)
+        rank = np.arange(n) - (np.cumsum(counts) - counts).take(sorted_env)
+        np.minimum(rank, k, out=rank)
+        slot = np.empty(n, dtype=np.intp)
+        slot[order] = sorted_env * (k + 1) + rank
+
+        # One plane per feature; scattering single values is much cheaper than scattering rows
+        planes = np.zeros((3, self.num_envs, k + 1), dtype=np.float32)
+        flat = planes.reshape(3, -1)
+        flat[0, slot] = offset_x
+        flat[1, slot] = offset_y
+        flat[2, slot] = swarm.special[:n]
+        flies = planes[:, :, :k].transpose(1, 2, 0).copy()
+
+        return {
+            "frog": np.stack((self.frog_x, self.frog_y), axis=1).astype(np.float32),
+            "time_remaining": (self.countdown_time - self.tick / SIMULATION_RATE).astype(np.float32),
+            "score": self.score.copy(),
+            "flies": flies
+        }
@@ -0,0 +1,50 @@
+import os
+import pygame
+import pytest
+import constants
+from assets import ASSET_FILES, ASSETS, AssetManager, prepare_fly_sprites
+from sprite_cache import SPRITE_CACHE
+
+@pytest.fixture
+def manager():
+    """
+    Fixture to create an AssetManager with nothing loaded yet.
+    """
+    return AssetManager()
+
+def test_asset_paths_exist(manager):
+    """
+    Test that every asset resolves to an existing file independent of the working directory.
+    """
+    for name in ASSET_FILES:
+        assert os.path.isabs(manager.path(name))
+        assert os.path.isfile(manager.path(name))
+
+def test_get_loads_lazily_and_once(manager):
+    """
+    Test that images are loaded on first use and the same surface is returned afterwards.
+    """
+    assert manager.images == {}
+    image = manager.get("frog")
+    assert isinstance(image, pygame.Surface)
+    assert manager.get("frog") is image
+    assert list(manager.images) == ["frog"]
+
+def test_constants_resolve_through_assets():
+    """
+    Test that the image constants are served by the shared asset manager.
+    """
+    assert constants.FROG is ASSETS.get("frog")
+    assert constants.SPECIAL_FLY_RIGHT is ASSETS.get("special_fly_right")
+    with pytest.raises(AttributeError):
+        constants.NOT_AN_ASSET
+
+def test_prepare_fly_sprites_fills_cache():
+    """
+    Test that both facings of both fly types are scaled ahead of time.
+    """
+    SPRITE_CACHE.clear()
+    prepare_fly_sprites(30, 30)
+    assert SPRITE_CACHE.stats()["size"] == 4
+    SPRITE_CACHE.get(ASSETS.get("fly_left"), "left", 30, 30)
+    assert SPRITE_CACHE.stats()["hits"] == 1
@@ -2,7 +2,9 @@ import pygame
 import pytest
 from frog import Frog
 from fly import Fly
-from game_logic import check_collision
+from game_logic import check_collision, update_frog_and_flies
+from game_state import GameState
+from special_fly import SpecialFly
 
 @pytest.fixture(scope="session", autouse=True)
 def init_pygame():
@@ -44,3 +46,43 @@ def test_no_collision_occurs(frog, fly):
     fly.x, fly.y = 100, 100
 
     assert check_collision(frog, fly) is False
+
+def test_update_catches_fly_in_frog_cell(frog):
+    """
+    Test that a fly registered next to the frog is caught and one far away is not.
+    """
+    game_state = GameState()
+    game_state.frog = frog
+    near = Fly(screen_width=500, screen_height=500, width=30.0, height=30.0)
+    far = Fly(screen_width=500, screen_height=500, width=30.0, height=30.0)
+    near.x, near.y = 260, 260
+    far.x, far.y = 0, 0
+    game_state.add_fly(near)
+    game_state.add_fly(far)
+
+    update_frog_and_flies(game_state, 500, 500)
+    assert game_state.flies == [far]
+    assert game_state.score == 1
+
+def test_update_compacts_fly_list_in_place(frog):
+    """
+    Test that caught and escaped flies are removed in one pass, keeping the survivors' order and the list itself.
+    """
+    game_state = GameState()
+    game_state.frog = frog
+    flies = [Fly(screen_width=500, screen_height=500, width=30.0, height=30.0) for _ in range(4)]
+    escaped = SpecialFly(500, 500, 30.0, 30.0)
+    escaped.x, escaped.y = -29, 0
+    escaped.movement = {"left": True, "right": False, "up": False, "down": False}
+    for fly, position in zip(flies, [(260, 260), (0, 0), (255, 255), (0, 400)]):
+        fly.x, fly.y = position
+        game_state.add_fly(fly)
+    game_state.add_fly(escaped)
+    fly_list = game_state.flies
+
+    update_frog_and_flies(game_state, 500, 500)
+    assert game_state.flies is fly_list
+    assert game_state.flies == [flies[1], flies[3]]
+    assert game_state.score == 2
+    assert escaped not in game_state.spatial_hash
+    assert game_state.fly_pool.stats()["free"] == 3
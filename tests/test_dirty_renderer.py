@@ -0,0 +1,62 @@
+import pygame
+import pytest
+from constants import BACKGROUND_COLOR
+from dirty_renderer import DirtyRectRenderer
+from game_state import GameState
+from screen_manager import ScreenManager
+
+@pytest.fixture
+def screen_manager():
+    """
+    Fixture to create a ScreenManager instance.
+    """
+    return ScreenManager()
+
+@pytest.fixture
+def game_state(screen_manager):
+    """
+    Fixture to create a GameState instance reset for the screen.
+    """
+    game_state = GameState()
+    game_state.reset(screen_manager.width, screen_manager.height)
+    return game_state
+
+def test_first_frame_is_full_repaint(game_state, screen_manager):
+    """
+    Test that the first frame pushes the whole screen.
+    """
+    renderer = DirtyRectRenderer()
+    rects = renderer.draw(game_state, screen_manager, pygame.time.get_ticks())
+    assert rects == [screen_manager.screen.get_rect()]
+
+def test_later_frames_push_only_changed_areas(game_state, screen_manager):
+    """
+    Test that later frames push the old and new areas of moved sprites and erase the old ones.
+    """
+    renderer = DirtyRectRenderer()
+    start_time = pygame.time.get_ticks()
+    renderer.draw(game_state, screen_manager, start_time)
+
+    fly = game_state.flies[0]
+    old_rect = pygame.Rect(fly.x, fly.y, fly.img.get_width(), fly.img.get_height())
+    game_state.flies.remove(fly)
+
+    rects = renderer.draw(game_state, screen_manager, start_time)
+    assert screen_manager.screen.get_rect() not in rects
+    assert any(rect.contains(old_rect) for rect in rects)
+
+    total_area = sum(rect.width * rect.height for rect in rects)
+    assert total_area < screen_manager.width * screen_manager.height
+
+def test_resize_triggers_full_repaint(game_state, screen_manager):
+    """
+    Test that a new screen size repaints the whole screen.
+    """
+    renderer = DirtyRectRenderer()
+    start_time = pygame.time.get_ticks()
+    renderer.draw(game_state, screen_manager, start_time)
+    screen_manager.resize(600, 400)
+
+    rects = renderer.draw(game_state, screen_manager, start_time)
+    assert rects == [pygame.Rect(0, 0, 600, 400)]
+    assert screen_manager.screen.get_at((599, 399))[:3] == BACKGROUND_COLOR
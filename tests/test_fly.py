@@ -82,6 +82,17 @@ def test_move(fly, screen_manager):
     fly.move(screen_manager.width, screen_manager.height)
     assert fly.y == 250 - fly.speed
 
+def test_move_scales_with_dt(fly, screen_manager):
+    """
+    Test that the fly's step length scales with the simulation step length.
+    """
+    fly.x = 250
+    fly.y = 250
+    fly.movement = {"left": False, "right": True, "up": False, "down": False}
+    fly.move(screen_manager.width, screen_manager.height, dt=0.5)
+    assert fly.x == 250 + fly.speed / 2
+    assert fly.previous_x == 250
+
 def test_check_edges(fly, screen_manager):
     """
     Test that the fly correctly handles screen edge collisions.
@@ -105,6 +116,7 @@ def test_resize(fly):
     fly.resize(50, 50)
     assert fly.width == 50
     assert fly.height == 50
+    assert fly.img.get_size() == (50, 50)
 
 def test_reposition(fly):
     """
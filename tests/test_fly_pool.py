@@ -0,0 +1,75 @@
+import random
+import pytest
+from fly import Fly
+from fly_pool import FlyPool
+from special_fly import SpecialFly
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 500
+
+@pytest.fixture
+def pool():
+    """
+    Fixture to create a small FlyPool instance.
+    """
+    return FlyPool(max_free=2)
+
+def test_released_fly_is_reused(pool):
+    """
+    Test that a released fly is handed out again and counted as reused.
+    """
+    fly = pool.acquire(Fly, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    first_id = fly.id
+    pool.release(fly)
+    assert pool.acquire(Fly, SCREEN_WIDTH, SCREEN_HEIGHT, 20.0, 20.0) is fly
+    assert fly.id != first_id  # A recycled fly is a new fly
+    assert fly.width == 20.0
+    assert fly.img.get_size() == (20, 20)
+    assert pool.stats()["created"] == 1
+    assert pool.stats()["reused"] == 1
+
+def test_reuse_keeps_the_fly_or_creates_one(pool):
+    """
+    Test that reuse hands out a released fly unchanged, creates one when none is pooled, and gives both a new id.
+    """
+    fly = pool.acquire(Fly, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    first_id = fly.id
+    pool.release(fly)
+    assert pool.reuse(Fly, SCREEN_WIDTH, SCREEN_HEIGHT, 20.0, 20.0) is fly
+    assert fly.id != first_id and fly.width == 30.0
+
+    created = pool.reuse(Fly, SCREEN_WIDTH, SCREEN_HEIGHT, 20.0, 20.0)
+    assert created is not fly and created.width == 20.0
+    assert created.id not in (first_id, fly.id)
+    assert pool.stats()["created"] == 2
+
+def test_pool_keeps_fly_types_apart(pool):
+    """
+    Test that a released regular fly is never handed out as a special fly.
+    """
+    pool.release(pool.acquire(Fly, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0))
+    special = pool.acquire(SpecialFly, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    assert type(special) is SpecialFly
+    assert pool.stats()["free"] == 1
+
+def test_reinitialized_fly_matches_new_fly(pool):
+    """
+    Test that a recycled fly draws the same position and movement as a new one with the same seed.
+    """
+    for fly_class in (Fly, SpecialFly):
+        stale = pool.acquire(fly_class, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+        stale.move(SCREEN_WIDTH, SCREEN_HEIGHT)
+        pool.release(stale)
+
+        recycled = pool.acquire(fly_class, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0, rng=random.Random(7))
+        fresh = fly_class(SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0, rng=random.Random(7))
+        assert (recycled.x, recycled.y, recycled.movement) == (fresh.x, fresh.y, fresh.movement)
+        assert (recycled.previous_x, recycled.previous_y) == (fresh.x, fresh.y)
+        assert recycled.img is fresh.img
+
+def test_full_pool_discards(pool):
+    """
+    Test that flies beyond the pool size are discarded rather than kept.
+    """
+    pool.release_all(Fly(SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0) for _ in range(3))
+    assert pool.stats()["free"] == 2
+    assert pool.stats()["discarded"] == 1
@@ -0,0 +1,46 @@
+import pygame
+import pytest
+from font_manager import FontManager
+
+@pytest.fixture
+def font_manager():
+    """
+    Fixture to create a small FontManager instance.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+    return FontManager(max_text_surfaces=2)
+
+def test_get_font_is_cached(font_manager):
+    """
+    Test that a font is only created once per face and size.
+    """
+    font = font_manager.get_font(None, 20)
+    assert font_manager.get_font(None, 20) is font
+    assert font_manager.get_font(None, 30) is not font
+
+def test_render_is_cached(font_manager):
+    """
+    Test that rendering the same text, size and color reuses the surface.
+    """
+    surface = font_manager.render("+1", 20, (0, 0, 0))
+    assert font_manager.render("+1", 20, (0, 0, 0)) is surface
+    assert font_manager.render("+1", 20, (255, 0, 0)) is not surface
+
+def test_render_evicts_least_recently_used(font_manager):
+    """
+    Test that the text cache stays within its bounds.
+    """
+    first = font_manager.render("a", 20, (0, 0, 0))
+    font_manager.render("b", 20, (0, 0, 0))
+    font_manager.render("c", 20, (0, 0, 0))
+    assert len(font_manager.text_surfaces) == 2
+    assert font_manager.render("a", 20, (0, 0, 0)) is not first
+
+def test_invalidate(font_manager):
+    """
+    Test that invalidating drops all fonts and text surfaces.
+    """
+    font_manager.render("+1", 20, (0, 0, 0))
+    font_manager.invalidate()
+    assert font_manager.fonts == {}
+    assert len(font_manager.text_surfaces) == 0
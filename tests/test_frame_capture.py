@@ -0,0 +1,82 @@
+import os
+import pygame
+import pytest
+from constants import BACKGROUND_COLOR, INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT
+
+pytest.importorskip("numpy")
+from frame_capture import FrameCapture, frame_view, read_raw_frames
+from screen_manager import ScreenManager
+
+@pytest.fixture
+def screen_manager():
+    """
+    Fixture to create a headless ScreenManager instance.
+    """
+    screen_manager = ScreenManager(headless=True)
+    screen_manager.clear()
+    return screen_manager
+
+def test_headless_renders_offscreen(screen_manager):
+    """
+    Test that headless mode renders into an offscreen surface and present is a no-op.
+    """
+    assert screen_manager.screen.get_size() == (INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT)
+    assert screen_manager.screen is not pygame.display.get_surface()
+    screen_manager.present()
+    screen_manager.resize(400, 300)
+    assert screen_manager.screen.get_size() == (400, 300)
+
+def test_headless_uses_display_format(screen_manager):
+    """
+    Test that the offscreen surface matches the display's pixel format, so sprites blit without conversion.
+    """
+    assert screen_manager.screen.get_masks() == pygame.display.get_surface().get_masks()
+
+def test_frame_view_is_zero_copy(screen_manager):
+    """
+    Test that the frame view shares memory with the surface and can be downsampled.
+    """
+    view = frame_view(screen_manager.screen)
+    assert tuple(view[0, 0]) == BACKGROUND_COLOR
+    view[0, 0] = (1, 2, 3)
+    del view
+    assert screen_manager.screen.get_at((0, 0))[:3] == (1, 2, 3)
+
+    small = frame_view(screen_manager.screen, downsample=4)
+    assert small.shape == (INITIAL_SCREEN_WIDTH // 4, INITIAL_SCREEN_HEIGHT // 4, 3)
+
+def test_capture_png_sequence(screen_manager, tmp_path):
+    """
+    Test that captured frames are written as a PNG sequence.
+    """
+    capture = FrameCapture(str(tmp_path), downsample=2)
+    for _ in range(3):
+        assert capture.capture(screen_manager.screen)
+    capture.close()
+
+    assert sorted(os.listdir(tmp_path)) == ["frame_000000.png", "frame_000001.png", "frame_000002.png"]
+    image = pygame.image.load(str(tmp_path / "frame_000001.png"))
+    assert image.get_size() == (INITIAL_SCREEN_WIDTH // 2, INITIAL_SCREEN_HEIGHT // 2)
+
+def test_capture_raw_file(screen_manager, tmp_path):
+    """
+    Test that captured frames are written to a raw frame file and can be read back.
+    """
+    path = str(tmp_path / "frames.raw")
+    capture = FrameCapture(path, file_format="raw")
+    capture.capture(screen_manager.screen)
+    screen_manager.screen.fill((0, 0, 0))
+    capture.capture(screen_manager.screen)
+    capture.close()
+
+    frames = read_raw_frames(path)
+    assert frames.shape == (2, INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT, 3)
+    assert tuple(frames[0, 0, 0]) == BACKGROUND_COLOR
+    assert tuple(frames[1, 0, 0]) == (0, 0, 0)
+
+def test_unsupported_format(tmp_path):
+    """
+    Test that unknown file formats are rejected.
+    """
+    with pytest.raises(ValueError):
+        FrameCapture(str(tmp_path), file_format="gif")
@@ -145,3 +145,25 @@ def test_reposition_with_no_change(frog):
     frog.reposition(1.0, 1.0)
     assert frog.x == initial_x
     assert frog.y == initial_y
+
+def test_move_scales_with_dt(frog, screen_manager):
+    """
+    Test that two half-length simulation steps move the Frog as far as one full step.
+    """
+    initial_x = frog.x
+    frog.movement['right'] = True
+    frog.move(screen_manager.width, screen_manager.height, dt=0.5)
+    frog.move(screen_manager.width, screen_manager.height, dt=0.5)
+    assert frog.x == initial_x + frog.speed
+    assert frog.previous_x == initial_x + frog.speed / 2
+
+def test_draw_interpolates_position(frog, screen_manager):
+    """
+    Test that drawing with an interpolation factor blits between the previous and current position.
+    """
+    frog.movement['right'] = True
+    frog.move(screen_manager.width, screen_manager.height)
+    rect = frog.draw(screen_manager.screen, alpha=0.0)
+    assert rect.x == int(frog.previous_x)
+    rect = frog.draw(screen_manager.screen)
+    assert rect.x == int(frog.x)
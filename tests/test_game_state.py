@@ -3,6 +3,7 @@ import pytest
 from constants import GAME_DURATION, INITIAL_FLY_COUNT
 from frog import Frog
 from game_state import GameState
+from scheduler import ms_to_ticks
 from screen_manager import ScreenManager
 
 @pytest.fixture
@@ -39,7 +40,7 @@ def test_initialization(game_state):
     assert game_state.frog == None
     assert game_state.flies == []
     assert game_state.score == 0
-    assert game_state.score_popups == []
+    assert len(game_state.score_popups) == 0
     assert game_state.fly_width == 0
     assert game_state.fly_height == 0
 
@@ -50,7 +51,7 @@ def test_reset(game_state, screen_manager, frog):
     game_state.reset(screen_manager.width, screen_manager.height)
     assert game_state.countdown_time == GAME_DURATION
     assert game_state.score == 0
-    assert game_state.score_popups == []
+    assert len(game_state.score_popups) == 0
     assert game_state.fly_width == screen_manager.width / 25
     assert game_state.fly_height == screen_manager.width / 25
 
@@ -59,3 +60,41 @@ def test_reset(game_state, screen_manager, frog):
     assert game_state.frog.width == frog.width
     assert game_state.frog.height == frog.height
     assert len(game_state.flies) == INITIAL_FLY_COUNT
+
+def test_entities_in_rect(game_state, screen_manager):
+    """
+    Test that flies added to the game state can be found by area.
+    """
+    game_state.reset(screen_manager.width, screen_manager.height)
+    fly = game_state.flies[0]
+    fly.x, fly.y = 10, 10
+    game_state.rebuild_spatial_hash()
+    assert fly in game_state.entities_in_rect((0, 0, 20, 20))
+
+    game_state.remove_fly(fly)
+    assert fly not in game_state.entities_in_rect((0, 0, 20, 20))
+    assert fly not in game_state.flies
+
+def test_reset_recycles_flies(game_state):
+    """
+    Test that resetting the game reuses the previous session's flies.
+    """
+    game_state.reset(800, 500, seed=1)
+    previous_flies = set(map(id, game_state.flies))
+    game_state.reset(800, 500, seed=2)
+    assert set(map(id, game_state.flies)) == previous_flies
+    assert game_state.fly_pool.stats()["reused"] == len(game_state.flies)
+
+def test_flies_spawn_on_game_time(game_state):
+    """
+    Test that the spawn timers fire after the configured game time and stop while paused.
+    """
+    game_state.reset(800, 500, seed=1, fly_spawn_interval=100, special_fly_spawn_interval=1000)
+    game_state.scheduler.advance(ms_to_ticks(100) - 1)
+    assert len(game_state.flies) == INITIAL_FLY_COUNT
+    game_state.scheduler.advance()
+    assert len(game_state.flies) == INITIAL_FLY_COUNT + 1
+
+    game_state.scheduler.pause()
+    game_state.scheduler.advance(ms_to_ticks(1000))
+    assert len(game_state.flies) == INITIAL_FLY_COUNT + 1
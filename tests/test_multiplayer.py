@@ -0,0 +1,103 @@
+import asyncio
+import pygame
+import pytest
+from game_state import GameState
+from multiplayer import FLY_UPDATE, REMOVAL, DeltaEncoder, GameClient, GameServer, UPDATE, predict
+from screen_manager import ScreenManager
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    """
+    Fixture to initialize pygame for the fly sprites.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+
+async def play(steps, movements=()):
+    """
+    Runs a server with two connected clients for a number of steps, applying every update.
+    """
+    server = GameServer(seed=5)
+    port = await server.start(port=0)
+    clients = [GameClient(), GameClient()]
+    for client, movement in zip(clients, movements):
+        await client.connect(port=port)
+        client.send_movement(movement)
+    for client in clients[len(movements):]:
+        await client.connect(port=port)
+    await asyncio.sleep(0.05)  # Let the server read the inputs
+
+    for step in range(steps):
+        if step % 100 == 0:
+            for _ in range(20):
+                server.game_state.spawn_fly(server.game_state.screen_width, server.game_state.screen_height)
+        server.step()
+        for client in clients:
+            assert await client.receive()
+
+    for client in clients:
+        await client.close()
+    await server.close()
+    return server, clients
+
+def test_predict_follows_movement():
+    """
+    Test that predictions move along the movement bits, left and up winning conflicts like Fly.
+    """
+    assert predict(10.0, 10.0, 0b0001, 2.0) == (8.0, 10.0)
+    assert predict(10.0, 10.0, 0b1010, 2.0) == (12.0, 12.0)
+    assert predict(10.0, 10.0, 0b0111, 2.0) == (8.0, 8.0)
+
+def test_clients_mirror_the_server():
+    """
+    Test that clients end up with the server's flies, frogs, scores and countdown.
+    """
+    right = {"left": False, "right": True, "up": False, "down": False}
+    server, clients = asyncio.run(play(600, [right]))
+    game_state = server.game_state
+
+    assert [player.score for player in server.players] == clients[0].scores == clients[1].scores
+    assert sum(clients[0].scores) > 0
+    assert server.players[0].frog.x > server.players[1].frog.x
+    for client in clients:
+        assert client.game_state.countdown_time == game_state.countdown_time
+        assert [(type(fly), fly.x, fly.y) for fly in client.game_state.flies] == \
+               [(type(fly), fly.x, fly.y) for fly in game_state.flies]
+
+def test_updates_skip_predictable_flies():
+    """
+    Test that updates only carry the flies that spawned or changed direction, not every fly.
+    """
+    server, _ = asyncio.run(play(300))
+    message = server.step()
+    assert len(message) < UPDATE.size + FLY_UPDATE.size * len(server.game_state.flies) // 4
+
+def test_recycled_fly_is_sent_as_a_new_fly():
+    """
+    Test that a fly object recycled by the fly pool in the same step is removed and announced again under a new id.
+    """
+    game_state = GameState()
+    game_state.reset(800, 500, seed=2)
+    encoder = DeltaEncoder(1.0)
+    encoder.encode(game_state, [], [])
+
+    fly = game_state.flies[0]
+    old_id = fly.id
+    game_state.remove_fly(fly)
+    game_state.spawn_fly(800, 500)
+    assert game_state.flies[-1] is fly
+
+    message = encoder.encode(game_state, [], [])
+    _, _, _, update_count, removal_count, _ = UPDATE.unpack_from(message)
+    updates = [update[0] for update in FLY_UPDATE.iter_unpack(
+        message[UPDATE.size:UPDATE.size + FLY_UPDATE.size * update_count])]
+    removals = [removal[0] for removal in REMOVAL.iter_unpack(
+        message[UPDATE.size + FLY_UPDATE.size * update_count:][:REMOVAL.size * removal_count])]
+    assert updates == [fly.id] and fly.id != old_id
+    assert removals == [old_id]
+
+def test_client_renders_received_state():
+    """
+    Test that a client can draw its game with the regular renderer.
+    """
+    _, clients = asyncio.run(play(10))
+    clients[1].draw(ScreenManager(headless=True), alpha=0.5)
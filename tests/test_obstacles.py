@@ -0,0 +1,83 @@
+import random
+import pygame
+import pytest
+from fly import Fly
+from frog import Frog
+from obstacles import ObstacleGrid
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 500
+LAYOUT = ((0.5, 0.5, 0.1, 0.1),)  # One obstacle at (400, 250), 80 by 50 pixels
+
+@pytest.fixture
+def obstacles():
+    """
+    Fixture to create an ObstacleGrid with one obstacle, built for an 800x500 screen.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+    obstacles = ObstacleGrid(LAYOUT, cell_size=64)
+    obstacles.build(SCREEN_WIDTH, SCREEN_HEIGHT)
+    return obstacles
+
+def test_grid_only_indexes_covered_cells(obstacles):
+    """
+    Test that obstacles are found through the cells they cover, touching edges don't block,
+    and the grid is only rebuilt when the screen size changes.
+    """
+    rect = (400.0, 250.0, 80.0, 50.0)
+    assert list(obstacles) == [rect]
+    assert set(obstacles.cells) == {(column, row) for column in range(6, 8) for row in range(3, 5)}
+    assert obstacles.blocking(470, 290, 20, 20) == rect
+    assert obstacles.blocking(480, 290, 20, 20) is None
+    assert obstacles.blocking(0, 0, 20, 20) is None
+
+    cells = obstacles.cells
+    obstacles.build(SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert obstacles.cells is cells
+    obstacles.build(400, 250)
+    assert list(obstacles) == [(200.0, 125.0, 40.0, 25.0)]
+
+def test_frog_is_blocked_and_slides_along(obstacles):
+    """
+    Test that the frog cannot move into an obstacle but keeps moving along it.
+    """
+    frog = Frog(x=330.0, y=240.0, width=70.0, height=60.0)
+    frog.movement["right"] = frog.movement["down"] = True
+    frog.move(SCREEN_WIDTH, SCREEN_HEIGHT, obstacles=obstacles)
+    assert (frog.x, frog.y) == (330.0, 245.0)
+
+def test_fly_bounces_off_obstacle(obstacles):
+    """
+    Test that a fly moving into an obstacle is moved back and turned away like at a screen edge.
+    """
+    fly = Fly(SCREEN_WIDTH, SCREEN_HEIGHT, 20, 20, rng=random.Random(3))
+    fly.x, fly.y = 379.0, 260.0
+    fly.movement = {"left": False, "right": True, "up": False, "down": False}
+    fly.move(SCREEN_WIDTH, SCREEN_HEIGHT, obstacles=obstacles)
+    assert fly.x == 379.0
+    assert not fly.movement["right"]
+    assert any(fly.movement.values())
+
+    # A fly that spawned inside an obstacle is not trapped
+    fly.x, fly.y = 420.0, 260.0
+    fly.movement = {"left": True, "right": False, "up": False, "down": False}
+    fly.move(SCREEN_WIDTH, SCREEN_HEIGHT, obstacles=obstacles)
+    assert fly.x == 418.0
+
+def test_swarm_bounces_like_flies(obstacles):
+    """
+    Test that swarm flies moving into an obstacle are moved back and turned away.
+    """
+    pytest.importorskip("numpy")
+    from swarm import FlySwarm
+
+    swarm = FlySwarm(seed=1)
+    swarm.spawn(3, SCREEN_WIDTH, SCREEN_HEIGHT, 20.0, 20.0)
+    swarm.x[:3] = (379.0, 420.0, 100.0)
+    swarm.y[:3] = (260.0, 301.0, 100.0)
+    swarm.dx[:3] = (1, 0, 1)
+    swarm.dy[:3] = (0, -1, 0)
+    swarm.step(SCREEN_WIDTH, SCREEN_HEIGHT, obstacles=obstacles)
+
+    assert swarm.x[:3].tolist() == [379.0, 420.0, 102.0]
+    assert swarm.y[:3].tolist() == [260.0, 301.0, 100.0]
+    assert swarm.dx[0] != 1 and swarm.dy[1] != -1
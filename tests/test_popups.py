@@ -0,0 +1,53 @@
+import pygame
+import pytest
+from popups import PopupBuffer, PopupLabels
+
+@pytest.fixture
+def popups():
+    """
+    Fixture to create a small PopupBuffer instance.
+    """
+    return PopupBuffer(capacity=3)
+
+def test_add_and_iterate(popups):
+    """
+    Test that popups are iterated oldest first with their compact fields.
+    """
+    popups.add(10, 20, 100, False)
+    popups.add(30, 40, 200, True)
+    assert len(popups) == 2
+    assert list(popups) == [(10, 20, 100, False), (30, 40, 200, True)]
+
+def test_full_buffer_replaces_oldest(popups):
+    """
+    Test that adding to a full buffer drops the oldest popup, also after wrapping around.
+    """
+    for time in range(5):
+        popups.add(time, time, time, False)
+    assert len(popups) == 3
+    assert [popup[2] for popup in popups] == [2, 3, 4]
+
+def test_expire_drops_old_popups(popups):
+    """
+    Test that only popups shown for their full duration are dropped.
+    """
+    popups.add(0, 0, 0, False)
+    popups.add(0, 0, 500, False)
+    popups.expire(1200, duration=1000)
+    assert [popup[2] for popup in popups] == [500]
+    popups.clear()
+    assert len(popups) == 0
+
+def test_labels_are_reused_per_fade_step():
+    """
+    Test that labels are rendered once per font size and faded copies are cached per step.
+    """
+    pygame.font.init()
+    labels = PopupLabels(fade_steps=4)
+    opaque = labels.get(True, 20, age=0)
+    assert labels.get(True, 20, age=100) is opaque
+    faded = labels.get(True, 20, age=900)
+    assert faded is not opaque
+    assert faded.get_alpha() == 63
+    assert labels.get(True, 20, age=950) is faded
+    assert labels.get(True, 24) is not opaque  # New font size renders new labels
@@ -0,0 +1,87 @@
+import pytest
+from constants import PROFILER_DUMP_KEY, PROFILER_OVERLAY_KEY
+from profiler import EVENTS, PHASES, RENDERING, FrameProfiler
+from screen_manager import ScreenManager
+
+@pytest.fixture
+def profiler():
+    """
+    Fixture to create a FrameProfiler that keeps three frames.
+    """
+    return FrameProfiler(capacity=3)
+
+def record_frame(profiler, seconds, entity_count):
+    """
+    Helper function that records a frame with fixed phase durations.
+    """
+    profiler.begin_frame()
+    for phase in range(len(PHASES)):
+        profiler.durations[profiler.index * len(PHASES) + phase] = seconds
+    profiler.end_frame(entity_count)
+
+def test_mark_accumulates_phase_time(profiler):
+    """
+    Test that marks add elapsed time to the current frame's phases.
+    """
+    profiler.begin_frame()
+    profiler.mark(EVENTS)
+    profiler.mark(RENDERING)
+    profiler.end_frame(5)
+
+    durations, entity_count = next(profiler.rows())
+    assert entity_count == 5
+    assert all(seconds >= 0 for seconds in durations)
+
+def test_ring_buffer_keeps_latest_frames(profiler):
+    """
+    Test that the ring buffer overwrites the oldest frames and iterates oldest first.
+    """
+    for i in range(5):
+        record_frame(profiler, 0.001 * (i + 1), i)
+
+    assert [entity_count for _, entity_count in profiler.rows()] == [2, 3, 4]
+    assert profiler.last_frame() == (0.005,) * len(PHASES)
+
+def test_frame_time_percentiles(profiler):
+    """
+    Test that percentiles are computed over total frame times in milliseconds.
+    """
+    assert profiler.frame_time_percentiles() == {}
+    for i in range(3):
+        record_frame(profiler, 0.001 * (i + 1), 0)
+
+    percentiles = profiler.frame_time_percentiles((50, 99))
+    assert percentiles[50] == pytest.approx(2 * len(PHASES))
+    assert percentiles[99] == pytest.approx(3 * len(PHASES))
+
+def test_dump_writes_csv(profiler, tmp_path):
+    """
+    Test that dumping writes a header and one row per recorded frame.
+    """
+    record_frame(profiler, 0.001, 7)
+    path = tmp_path / "profile.csv"
+    profiler.dump(str(path))
+
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("events_ms,")
+    assert len(lines) == 2
+    assert lines[1].endswith(",7")
+
+def test_hotkeys(profiler, tmp_path, monkeypatch):
+    """
+    Test that the hotkeys toggle the overlay and dump the buffer.
+    """
+    monkeypatch.chdir(tmp_path)
+    profiler.handle_key(PROFILER_OVERLAY_KEY)
+    assert profiler.show_overlay
+    path = profiler.handle_key(PROFILER_DUMP_KEY)
+    assert (tmp_path / path).exists()
+
+def test_draw_overlay(profiler):
+    """
+    Test that the overlay draws in the top-right corner of the screen.
+    """
+    screen_manager = ScreenManager()
+    record_frame(profiler, 0.001, 3)
+    rect = profiler.draw_overlay(screen_manager.screen, screen_manager.height)
+    assert rect.right == screen_manager.width - 10
@@ -0,0 +1,133 @@
+from math import ceil
+import pygame
+import pytest
+from constants import FRAME_RATE, QUALITY_DOWNGRADE_FRAMES, QUALITY_UPGRADE_FRAMES
+from dirty_renderer import DirtyRectRenderer
+from game_state import GameState
+from quality import TIERS, QualityGovernor
+from screen_manager import ScreenManager
+from ui_renderer import draw_game_objects
+
+BUDGET = 1000 / 60
+
+@pytest.fixture
+def governor():
+    """
+    Fixture to create a QualityGovernor with a 60 fps budget.
+    """
+    return QualityGovernor(BUDGET)
+
+def feed(governor, frames, frame_ms, work_ms=None):
+    """
+    Records a number of identical frames.
+    """
+    for _ in range(frames):
+        governor.record(frame_ms, work_ms)
+
+def test_sustained_slow_frames_lower_quality(governor):
+    """
+    Test that quality drops one tier at a time while frames miss the budget, but not for a single hitch.
+    """
+    feed(governor, 1, 2000)
+    feed(governor, 60, BUDGET)
+    assert governor.tier == 0
+
+    feed(governor, QUALITY_DOWNGRADE_FRAMES + 10, 25)
+    assert governor.tier == 1
+    assert not governor.popups
+    feed(governor, 10 * QUALITY_DOWNGRADE_FRAMES, 25)
+    assert governor.tier == len(TIERS) - 1
+    assert governor.frame_rate < FRAME_RATE
+    assert [(old, new) for _, old, new, _ in governor.transitions] == [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+def test_headroom_raises_quality_without_oscillating(governor):
+    """
+    Test that quality only rises after lasting headroom, and that frames within the budget keep the tier.
+    """
+    feed(governor, QUALITY_DOWNGRADE_FRAMES + 10, 25)
+    assert governor.tier == 1
+
+    # Running at the frame rate with little time to spare is neither slow nor fast
+    feed(governor, 1000, BUDGET, 13)
+    assert governor.tier == 1
+
+    feed(governor, QUALITY_UPGRADE_FRAMES // 2, BUDGET, 5)
+    assert governor.tier == 1
+    feed(governor, QUALITY_UPGRADE_FRAMES, BUDGET, 5)
+    assert governor.tier == 0
+
+def test_low_frame_rate_tier_recovers(governor):
+    """
+    Test that frames held to the lowest tier's frame rate are not slow frames, so headroom raises the quality again.
+    """
+    governor.change_tier(len(TIERS) - 1)
+    feed(governor, QUALITY_UPGRADE_FRAMES + 30, 1000 / governor.frame_rate, 5)
+    assert governor.tier == len(TIERS) - 2
+
+def test_failed_upgrade_waits_longer(governor):
+    """
+    Test that a tier that was too slow again right after being raised is retried later each time.
+    """
+    feed(governor, QUALITY_DOWNGRADE_FRAMES + 10, 25)
+    feed(governor, QUALITY_UPGRADE_FRAMES + 30, BUDGET, 5)
+    assert governor.tier == 0
+    feed(governor, QUALITY_DOWNGRADE_FRAMES + 10, 25)
+    assert governor.tier == 1
+
+    feed(governor, QUALITY_UPGRADE_FRAMES + 30, BUDGET, 5)
+    assert governor.tier == 1
+    feed(governor, QUALITY_UPGRADE_FRAMES, BUDGET, 5)
+    assert governor.tier == 0
+
+def test_renderer_follows_the_tier(governor):
+    """
+    Test that popups, interpolation and a share of the flies are left out as the tier requires.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+    screen_manager = ScreenManager(headless=True)
+    game_state = GameState()
+    game_state.reset(screen_manager.width, screen_manager.height, seed=4)
+    game_state.spawn_fly(screen_manager.width, screen_manager.height, special=True)
+    fly = game_state.flies[0]
+    fly.previous_x, fly.x = 100.0, 200.0
+    start_time = pygame.time.get_ticks()
+
+    game_state.score_popups.add(100, 100, pygame.time.get_ticks(), False)
+    full = draw_game_objects(game_state, screen_manager, start_time, alpha=0.5, quality=governor)
+    assert len(full) == 1 + len(game_state.flies) + 1 + 2
+    assert full[1].x == 150
+
+    governor.change_tier(len(TIERS) - 1)
+    regular = len(game_state.flies) - 1
+    reduced = draw_game_objects(game_state, screen_manager, start_time, alpha=0.5, quality=governor)
+    assert len(reduced) == 1 + ceil(regular * governor.fly_share) + 1 + 2
+    assert reduced[1].x == 200
+
+def test_dirty_renderer_keeps_the_hud_between_redraws(governor):
+    """
+    Test that frames between HUD redraws neither erase nor push the HUD, unless a sprite erased part of it.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+    screen_manager = ScreenManager(headless=True)
+    game_state = GameState()
+    game_state.reset(screen_manager.width, screen_manager.height, seed=4)
+    renderer = DirtyRectRenderer()
+    start_time = pygame.time.get_ticks()
+    governor.change_tier(len(TIERS) - 1)
+    renderer.draw(game_state, screen_manager, start_time, quality=governor)
+    hud_rects = renderer.hud_rects
+    assert len(hud_rects) == 2
+
+    governor.record(BUDGET)
+    assert not governor.hud_due()
+    rects = renderer.draw(game_state, screen_manager, start_time, quality=governor)
+    assert renderer.hud_rects is hud_rects
+    assert not any(rect in rects for rect in hud_rects)
+
+    # A fly last drawn over the HUD erases part of it, so the HUD is drawn again
+    fly = game_state.flies[0]
+    fly.x, fly.y = hud_rects[0].topleft
+    renderer.draw(game_state, screen_manager, start_time, quality=governor)
+    fly.x, fly.y = screen_manager.width / 2, screen_manager.height / 2
+    rects = renderer.draw(game_state, screen_manager, start_time, quality=governor)
+    assert all(rect in rects for rect in renderer.hud_rects)
@@ -0,0 +1,99 @@
+import pygame
+import pytest
+from constants import INITIAL_FLY_COUNT
+from event_handler import handle_events
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from replay import SessionRecorder, replay_session
+from screen_manager import ScreenManager
+
+@pytest.fixture
+def screen_manager():
+    """
+    Fixture to create a ScreenManager instance.
+    """
+    return ScreenManager()
+
+def play_session(screen_manager, seed):
+    """
+    Helper function that plays a short scripted session through the real event handler.
+    """
+    game_state = GameState()
+    game_state.reset(screen_manager.width, screen_manager.height, seed=seed)
+    recorder = SessionRecorder(game_state.seed, screen_manager.width, screen_manager.height)
+    pygame.event.clear()
+
+    for tick in range(300):
+        if tick == 10:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+        if tick == 100:
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+        handle_events(game_state, screen_manager, recorder)
+        update_frog_and_flies(game_state, screen_manager.width, screen_manager.height)
+
+    recorder.finish(game_state.tick)
+    return game_state, recorder
+
+def snapshot(game_state):
+    """
+    Helper function that summarizes the parts of the game state a replay must reproduce.
+    """
+    return (game_state.score, game_state.countdown_time, game_state.frog.x, game_state.frog.y,
+            [(fly.x, fly.y, dict(fly.movement)) for fly in game_state.flies])
+
+def test_reset_with_seed_is_deterministic(screen_manager):
+    """
+    Test that two sessions reset with the same seed spawn identical flies.
+    """
+    first, second = GameState(), GameState()
+    first.reset(screen_manager.width, screen_manager.height, seed=7)
+    second.reset(screen_manager.width, screen_manager.height, seed=7)
+    assert snapshot(first) == snapshot(second)
+
+def test_recorder_ignores_other_keys():
+    """
+    Test that only keys that affect the simulation are recorded.
+    """
+    recorder = SessionRecorder(1, 800, 500)
+    recorder.record_key(0, pygame.K_SPACE, True)
+    recorder.record_key(0, pygame.K_UP, True)
+    assert len(recorder) == 1
+
+def test_replay_reproduces_session(screen_manager, tmp_path):
+    """
+    Test that replaying a saved recording ends in exactly the recorded game state.
+    """
+    game_state, recorder = play_session(screen_manager, seed=1234)
+    assert len(recorder) == 3  # Fly spawns are not recorded, the scheduler repeats them
+    assert len(game_state.flies) > INITIAL_FLY_COUNT - game_state.score
+
+    path = str(tmp_path / "session.fcr")
+    recorder.save(path)
+    replayed = replay_session(SessionRecorder.load(path))
+
+    assert replayed.tick == game_state.tick
+    assert snapshot(replayed) == snapshot(game_state)
+
+def test_load_rejects_other_files(tmp_path):
+    """
+    Test that loading a file that is not a recording raises a ValueError.
+    """
+    path = tmp_path / "not_a_recording.fcr"
+    path.write_bytes(b"hello world, this is not a recording")
+    with pytest.raises(ValueError):
+        SessionRecorder.load(str(path))
+
+def test_recording_keeps_the_obstacle_layout(tmp_path):
+    """
+    Test that a saved recording replays with the obstacle layout it was recorded with.
+    """
+    layout = ((0.5, 0.5, 0.1, 0.1),)
+    recorder = SessionRecorder(1, 800, 500, obstacle_layout=layout)
+    recorder.finish(10)
+    path = str(tmp_path / "session.fcr")
+    recorder.save(path)
+
+    loaded = SessionRecorder.load(path)
+    assert loaded.obstacle_layout == layout
+    assert list(replay_session(loaded).obstacles) == [(400.0, 250.0, 80.0, 50.0)]
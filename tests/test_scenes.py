@@ -0,0 +1,104 @@
+import pygame
+import pytest
+from constants import FOCUS_PAUSE, GAME_OVER_SCENE, GAMEPLAY_SCENE, KEY_PAUSE, PAUSED_SCENE
+from event_handler import handle_events
+from game_loop import GameplayScene
+from game_state import GameState
+from scenes import SceneManager, paused
+from screen_manager import ScreenManager
+from snapshot import take_snapshot
+
+@pytest.fixture
+def screen_manager():
+    """
+    Fixture to create a ScreenManager instance.
+    """
+    return ScreenManager()
+
+@pytest.fixture
+def gameplay(screen_manager):
+    """
+    Fixture to create a GameplayScene for a freshly reset game.
+    """
+    game_state = GameState()
+    game_state.reset(screen_manager.width, screen_manager.height, seed=1)
+    pygame.event.clear()
+    return GameplayScene(screen_manager, game_state)
+
+def test_focus_loss_and_pause_key_request_a_pause(screen_manager, gameplay):
+    """
+    Test that losing focus or pressing a pause key asks to pause with its reason, while other events do not.
+    """
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+    assert handle_events(gameplay.game_state, screen_manager) is None
+    pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    assert handle_events(gameplay.game_state, screen_manager) == FOCUS_PAUSE
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+    assert handle_events(gameplay.game_state, screen_manager) == KEY_PAUSE
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+    pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    assert handle_events(gameplay.game_state, screen_manager) == KEY_PAUSE
+
+def test_gameplay_ends_on_pause_or_time_up(gameplay):
+    """
+    Test that the gameplay scene hands over to the paused and game over scenes.
+    """
+    pygame.event.post(pygame.event.Event(pygame.WINDOWMINIMIZED))
+    assert gameplay.run() == PAUSED_SCENE
+    assert gameplay.pause_reason == FOCUS_PAUSE
+
+    gameplay.game_state.countdown_time = 0
+    assert gameplay.run() == GAME_OVER_SCENE
+
+def test_pause_stops_game_time(gameplay):
+    """
+    Test that the paused scene stops the scheduler and the countdown, and releases keys let go meanwhile.
+    """
+    game_state = gameplay.game_state
+    game_state.frog.movement["left"] = True
+    start_time, scheduler_time = gameplay.start_time, game_state.scheduler.time
+
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+    timer_set_at = pygame.time.get_ticks()
+    pygame.time.set_timer(pygame.event.Event(pygame.WINDOWFOCUSGAINED), 50, loops=1)
+    assert paused(gameplay, FOCUS_PAUSE) == GAMEPLAY_SCENE
+    elapsed = pygame.time.get_ticks() - timer_set_at
+
+    assert not game_state.scheduler.paused
+    assert game_state.scheduler.time == scheduler_time
+    # The pause lasted until the timer fired, and the countdown moved forward by no more than that
+    assert elapsed >= 50
+    assert 0 < gameplay.start_time - start_time <= elapsed
+    assert not game_state.frog.movement["left"]
+
+def test_manual_pause_ignores_focus_changes(gameplay):
+    """
+    Test that a pause started with a pause key keeps going when the window regains focus, until a pause key is pressed.
+    """
+    game_state = gameplay.game_state
+    game_state.frog.movement["left"] = True
+
+    pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSGAINED))
+    pygame.event.post(pygame.event.Event(pygame.WINDOWRESTORED))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+    assert paused(gameplay, KEY_PAUSE) == GAMEPLAY_SCENE
+
+    # The key released after the focus events was still handled by the paused scene
+    assert not game_state.frog.movement["left"]
+    assert not game_state.scheduler.paused
+
+def test_play_again_restores_the_prepared_game(screen_manager, monkeypatch):
+    """
+    Test that a new session starts from the state prepared during the game over screen instead of resetting.
+    """
+    game_state = GameState()
+    scene_manager = SceneManager(screen_manager, game_state)
+    scene_manager.prepare_next_session()
+    prepared = scene_manager.next_session
+
+    monkeypatch.setattr(game_state, "reset", lambda *args, **kwargs: pytest.fail("the game was reset"))
+    assert scene_manager.start_session() == GAMEPLAY_SCENE
+    assert take_snapshot(game_state) == prepared
+    assert game_state.seed == scene_manager.spare_state.seed
+    assert scene_manager.next_session is None
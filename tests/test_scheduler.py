@@ -0,0 +1,67 @@
+import pytest
+from scheduler import Scheduler, ms_to_ticks
+
+@pytest.fixture
+def scheduler():
+    """
+    Fixture to create a Scheduler instance.
+    """
+    return Scheduler()
+
+def test_ms_to_ticks():
+    """
+    Test that milliseconds are converted to whole simulation steps, at least one.
+    """
+    assert ms_to_ticks(2000, 60) == 120
+    assert ms_to_ticks(1, 60) == 1
+
+def test_events_run_in_time_then_scheduling_order(scheduler):
+    """
+    Test that due events run ordered by time, and events due together in the order they were scheduled.
+    """
+    ran = []
+    scheduler.schedule(2, lambda: ran.append("b"))
+    scheduler.schedule(1, lambda: ran.append("a"))
+    scheduler.schedule(2, lambda: ran.append("c"))
+    assert scheduler.advance() == 1
+    assert scheduler.advance(5) == 2
+    assert ran == ["a", "b", "c"]
+    assert len(scheduler) == 0
+
+def test_repeating_event_catches_up(scheduler):
+    """
+    Test that a repeating event runs once per interval, also when advancing several steps at once.
+    """
+    ran = []
+    scheduler.schedule(3, lambda: ran.append(scheduler.time), interval=3)
+    scheduler.advance(10)
+    assert len(ran) == 3
+    assert len(scheduler) == 1
+
+def test_pause_and_cancel(scheduler):
+    """
+    Test that a paused scheduler neither advances nor runs events, and cancelled events never run.
+    """
+    ran = []
+    handle = scheduler.schedule(1, lambda: ran.append("cancelled"))
+    scheduler.schedule(1, lambda: ran.append("kept"))
+    scheduler.cancel(handle)
+    scheduler.pause()
+    assert scheduler.advance(5) == 0
+    assert scheduler.time == 0
+    scheduler.resume()
+    scheduler.advance()
+    assert ran == ["kept"]
+
+def test_cancel_after_clear_does_nothing(scheduler):
+    """
+    Test that handles left over from before `clear`, or of events that already ran, do not change the event count.
+    """
+    stale = scheduler.schedule(5, lambda: None)
+    ran = scheduler.schedule(1, lambda: None)
+    scheduler.advance()
+    scheduler.clear()
+    scheduler.schedule(2, lambda: None)
+    scheduler.cancel(stale)
+    scheduler.cancel(ran)
+    assert len(scheduler) == 1
@@ -0,0 +1,66 @@
+import sqlite3
+import time
+import pytest
+from score_store import ScoreStore
+
+@pytest.fixture
+def store(tmp_path):
+    """
+    Fixture to create a ScoreStore in a temporary database.
+    """
+    store = ScoreStore(str(tmp_path / "scores.db"), top_n=3)
+    yield store
+    store.close()
+
+def test_top_scores_are_cached_best_first(store):
+    """
+    Test that the cached leaderboard holds the best scores, earlier games winning ties.
+    """
+    for score, played_at in [(5, 1.0), (12, 2.0), (7, 3.0), (12, 4.0), (1, 5.0)]:
+        store.add(score, played_at)
+    store.flush()
+    assert store.top_scores() == [(12, 2.0), (12, 4.0), (7, 3.0)]
+
+def test_add_does_not_wait_for_the_database(store, tmp_path):
+    """
+    Test that adding a score returns while another connection locks the database, and the cache updates once it is released.
+    """
+    store.flush()
+    version = store.version
+    blocker = sqlite3.connect(str(tmp_path / "scores.db"))
+    blocker.execute("BEGIN EXCLUSIVE")
+
+    start = time.perf_counter()
+    store.add(3, 1.0)
+    assert time.perf_counter() - start < 0.1
+    time.sleep(0.2)  # Give the background thread time to reach the lock
+    assert store.version == version
+    assert store.top_scores() == []
+
+    blocker.rollback()
+    blocker.close()
+    store.flush()
+    assert store.error is None
+    assert store.version > version
+    assert store.top_scores() == [(3, 1.0)]
+
+def test_scores_persist_in_wal_mode(tmp_path):
+    """
+    Test that scores survive reopening the store and that the database uses write-ahead logging.
+    """
+    path = str(tmp_path / "scores.db")
+    store = ScoreStore(path)
+    store.add(9, 1.0)
+    store.close()
+    assert store.error is None
+
+    reopened = ScoreStore(path)
+    reopened.flush()
+    assert reopened.top_scores() == [(9, 1.0)]
+    reopened.close()
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")} >= \
+           {"scores_by_score", "scores_by_date"}
+    connection.close()
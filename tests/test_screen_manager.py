@@ -1,4 +1,6 @@
+import pygame
 import pytest
+from font_manager import FONT_MANAGER
 from screen_manager import ScreenManager
 from constants import BACKGROUND_COLOR, INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT
 
@@ -43,3 +45,28 @@ def test_scaling_factors(screen_manager):
     width_scale, height_scale = screen_manager.get_scaling_factors()
     assert width_scale == 500 / INITIAL_SCREEN_WIDTH
     assert height_scale == 500 / INITIAL_SCREEN_HEIGHT
+
+def test_resize_invalidates_font_cache(screen_manager):
+    """
+    Test that resizing to a different font size drops cached text, and keeps it otherwise.
+    """
+    FONT_MANAGER.invalidate()
+    FONT_MANAGER.render("+1", screen_manager.get_font_size(), (0, 0, 0))
+    screen_manager.resize(INITIAL_SCREEN_WIDTH + 100, INITIAL_SCREEN_HEIGHT)
+    assert len(FONT_MANAGER.text_surfaces) == 1
+
+    screen_manager.resize(INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT * 2)
+    assert len(FONT_MANAGER.text_surfaces) == 0
+
+def test_headless_works_with_any_video_driver(monkeypatch):
+    """
+    Test that headless mode opens its hidden display under a video driver other than dummy.
+    """
+    pygame.display.quit()
+    monkeypatch.setenv("SDL_VIDEODRIVER", "offscreen")
+    try:
+        screen_manager = ScreenManager(headless=True)
+        assert pygame.display.get_driver() == "offscreen"
+        assert screen_manager.screen.get_size() == (INITIAL_SCREEN_WIDTH, INITIAL_SCREEN_HEIGHT)
+    finally:
+        pygame.display.quit()  # The next test initializes the display with its own driver
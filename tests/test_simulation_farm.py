@@ -0,0 +1,40 @@
+from simulation_farm import aggregate, play_session, run_farm, session_seeds
+
+SETTINGS = {"duration": 3, "fly_spawn_interval": 500, "special_fly_spawn_interval": 1000, "max_duration": 6}
+
+def without_timing(results):
+    """
+    Drops the wall time, the only field that differs between identical games.
+    """
+    return [{key: value for key, value in result.items() if key != "wall_time"} for result in results]
+
+def test_session_seeds_are_deterministic():
+    """
+    Test that the per-game seeds only depend on the base seed.
+    """
+    assert session_seeds(5, 4) == session_seeds(5, 4)
+    assert session_seeds(5, 4)[:2] == session_seeds(5, 2)
+    assert session_seeds(5, 4) != session_seeds(6, 4)
+
+def test_play_session_is_reproducible():
+    """
+    Test that a game with the same seed and settings plays out identically.
+    """
+    first = play_session(42, SETTINGS)
+    assert without_timing([first]) == without_timing([play_session(42, SETTINGS)])
+    assert first["ticks"] >= SETTINGS["duration"] * 60
+    assert first["catches"] == first["score"] + first["special_catches"]
+    assert first["ticks"] <= SETTINGS["max_duration"] * 60
+
+def test_run_farm_matches_serial_run():
+    """
+    Test that spreading games across processes gives the same results as playing them in-process.
+    """
+    serial = run_farm(4, base_seed=1, workers=1, settings=SETTINGS)
+    parallel = run_farm(4, base_seed=1, workers=2, settings=SETTINGS)
+    assert without_timing(parallel) == without_timing(serial)
+
+    summary = aggregate(serial, elapsed=1.0)
+    assert summary["games"] == 4
+    assert summary["catches"] == sum(result["catches"] for result in serial)
+    assert summary["games_per_second"] == 4.0
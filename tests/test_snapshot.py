@@ -0,0 +1,96 @@
+import pygame
+import pytest
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from snapshot import SnapshotRing, restore_snapshot, take_snapshot
+
+WIDTH, HEIGHT = 800, 600
+
+@pytest.fixture
+def game_state():
+    """
+    Fixture to create a seeded GameState whose frog moves right.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+    game_state = GameState()
+    game_state.reset(WIDTH, HEIGHT, seed=3)
+    game_state.frog.movement["right"] = True
+    return game_state
+
+def run(game_state, steps):
+    """
+    Advances the game by a number of simulation steps.
+    """
+    for _ in range(steps):
+        update_frog_and_flies(game_state, WIDTH, HEIGHT)
+
+def state(game_state):
+    """
+    Collects everything that determines how the game continues, except wall-clock popup times.
+    """
+    return (game_state.tick, game_state.score, game_state.countdown_time, game_state.frog.x, game_state.frog.y,
+            [(type(fly), fly.x, fly.y, fly.movement, fly.facing_left) for fly in game_state.flies],
+            [(x, y, special) for x, y, _, special in game_state.score_popups],
+            game_state.scheduler.time, [entry[0] for entry in game_state.scheduler.queue],
+            game_state.rng.getstate())
+
+def test_restore_continues_identically(game_state):
+    """
+    Test that a restored game state continues exactly like the original did.
+    """
+    run(game_state, 500)
+    snapshot = take_snapshot(game_state)
+    run(game_state, 300)
+    expected = state(game_state)
+
+    restore_snapshot(game_state, snapshot)
+    run(game_state, 300)
+    assert state(game_state) == expected
+
+def test_restore_into_fresh_game_state(game_state):
+    """
+    Test that a snapshot can be restored into another game state, creating the flies it needs.
+    """
+    run(game_state, 200)
+    other = GameState()
+    restore_snapshot(other, take_snapshot(game_state))
+    assert state(other)[:-1] == state(game_state)[:-1]
+    assert other.rng.getstate() == game_state.rng.getstate()
+    assert len({fly.id for fly in other.flies}) == len(other.flies)
+    assert other.fly_pool.stats()["created"] == len(other.flies)
+
+def test_restore_rebuilds_the_obstacle_layout(game_state):
+    """
+    Test that a snapshot carries its obstacle layout into a game state that uses another one.
+    """
+    layout = ((0.5, 0.5, 0.1, 0.1),)
+    game_state.obstacles.build(game_state.screen_width, game_state.screen_height, layout)
+    other = GameState()
+    restore_snapshot(other, take_snapshot(game_state))
+    assert other.obstacles.layout == layout
+    assert list(other.obstacles) == list(game_state.obstacles)
+
+def test_ring_rollback(game_state):
+    """
+    Test that rolling back restores an earlier frame and forgets the newer ones.
+    """
+    ring = SnapshotRing(capacity=4)
+    for _ in range(6):
+        run(game_state, 1)
+        ring.push(game_state)
+    assert len(ring) == 4
+
+    ring.rollback(game_state, frames_back=2)
+    assert game_state.tick == 4
+    assert len(ring) == 2
+    with pytest.raises(IndexError):
+        ring.get(2)
+
+def test_restore_rejects_other_data(game_state):
+    """
+    Test that data that is not a snapshot, or a snapshot of the other fly backend, is rejected.
+    """
+    with pytest.raises(ValueError):
+        restore_snapshot(game_state, b"FCR" + bytes(200))
+    with pytest.raises(ValueError):
+        restore_snapshot(GameState(use_swarm=True), take_snapshot(game_state))
@@ -0,0 +1,53 @@
+import pytest
+from spatial_hash import SpatialHash
+
+@pytest.fixture
+def grid():
+    """
+    Fixture to create a SpatialHash instance with 50 pixel cells.
+    """
+    return SpatialHash(cell_size=50)
+
+def test_insert_and_query(grid):
+    """
+    Test that an entity is found by queries overlapping its cells only.
+    """
+    grid.insert("fly", 10, 10, 20, 20)
+    assert grid.query(0, 0, 30, 30) == {"fly"}
+    assert grid.query(200, 200, 30, 30) == set()
+
+def test_entity_spanning_cells(grid):
+    """
+    Test that an entity crossing a cell boundary is registered in every cell it overlaps.
+    """
+    grid.insert("fly", 40, 40, 20, 20)
+    assert len(grid.cells) == 4
+    assert grid.query(55, 55, 1, 1) == {"fly"}
+
+def test_update_moves_entity(grid):
+    """
+    Test that updating an entity's position moves it to its new cells.
+    """
+    grid.insert("fly", 10, 10, 20, 20)
+    grid.update("fly", 210, 210, 20, 20)
+    assert grid.query(0, 0, 30, 30) == set()
+    assert grid.query(200, 200, 30, 30) == {"fly"}
+    assert len(grid.cells) == 1
+
+def test_remove(grid):
+    """
+    Test that removed entities are no longer found and empty cells are dropped.
+    """
+    grid.insert("fly", 10, 10, 20, 20)
+    grid.remove("fly")
+    grid.remove("unknown")  # Unknown entities are ignored
+    assert "fly" not in grid
+    assert grid.cells == {}
+
+def test_negative_positions(grid):
+    """
+    Test that entities partly off the top-left of the screen are still found.
+    """
+    grid.insert("fly", -30, -30, 20, 20)
+    assert grid.query(-40, -40, 5, 5) == {"fly"}
+    assert grid.query(10, 10, 5, 5) == set()
@@ -0,0 +1,99 @@
+import pygame
+import pytest
+from constants import OBSTACLE_LAYOUT
+from game_logic import update_frog_and_flies
+from game_state import GameState
+from spectator_log import SpectatorLog, SpectatorLogReader
+
+WIDTH, HEIGHT = 800, 600
+
+@pytest.fixture
+def game_state():
+    """
+    Fixture to create a seeded GameState.
+    """
+    pygame.init()  # Ensure pygame is initialized in the test environment
+    game_state = GameState()
+    game_state.reset(WIDTH, HEIGHT, seed=2)
+    return game_state
+
+def write_log(path, game_state, steps, close=True, obstacle_layout=OBSTACLE_LAYOUT):
+    """
+    Records a number of simulation steps, returning what each step looked like.
+    """
+    log = SpectatorLog(path, WIDTH, HEIGHT, keyframe_interval=10, obstacle_layout=obstacle_layout)
+    states = []
+    for _ in range(steps):
+        update_frog_and_flies(game_state, WIDTH, HEIGHT)
+        log.record(game_state)
+        states.append((game_state.tick, game_state.score, game_state.countdown_time,
+                       [(type(fly), fly.facing_left, round(fly.x, 2), round(fly.y, 2)) for fly in game_state.flies]))
+    if close:
+        log.close()
+    else:
+        log.file.flush()
+    return states
+
+def recorded(reader, index, game_state):
+    """
+    Applies a record to a game state and collects the same values as write_log.
+    """
+    reader.apply(game_state, index)
+    return (game_state.tick, game_state.score, game_state.countdown_time,
+            [(type(fly), fly.facing_left, round(fly.x, 2), round(fly.y, 2)) for fly in game_state.flies])
+
+def test_seek_to_any_step(tmp_path, game_state):
+    """
+    Test that every step can be read back from the index, in any order.
+    """
+    path = tmp_path / "session.fcl"
+    states = write_log(path, game_state, 250)
+
+    reader = SpectatorLogReader(path)
+    playback = GameState()
+    playback.reset(WIDTH, HEIGHT, seed=0)
+    assert len(reader) == 250
+    for index in (249, 0, 137, 10, 9, 200):
+        assert recorded(reader, index, playback) == states[index]
+    assert reader.index_at(2.5) == 150
+    assert reader.index_at(1000) == 249
+    reader.close()
+
+def test_unclosed_log_is_scanned(tmp_path, game_state):
+    """
+    Test that a log without an index, e.g. after a crash, can still be played.
+    """
+    path = tmp_path / "crashed.fcl"
+    states = write_log(path, game_state, 35, close=False)
+
+    reader = SpectatorLogReader(path)
+    playback = GameState()
+    playback.reset(WIDTH, HEIGHT, seed=0)
+    assert len(reader) == 35
+    assert recorded(reader, 34, playback) == states[34]
+    reader.close()
+
+def test_rejects_other_files(tmp_path):
+    """
+    Test that files that are not spectator logs are rejected.
+    """
+    path = tmp_path / "other.fcl"
+    path.write_bytes(b"FCRS" + bytes(40))
+    with pytest.raises(ValueError):
+        SpectatorLogReader(path)
+
+def test_obstacle_layout_is_recorded(tmp_path, game_state):
+    """
+    Test that the log keeps the session's obstacle layout, whatever the current one is.
+    """
+    layout = ((0.1, 0.2, 0.3, 0.1), (0.6, 0.5, 0.05, 0.25))
+    path = tmp_path / "level.fcl"
+    states = write_log(path, game_state, 15, close=False, obstacle_layout=layout)
+
+    reader = SpectatorLogReader(path)
+    playback = GameState()
+    playback.reset(WIDTH, HEIGHT, seed=0)
+    assert reader.obstacle_layout == layout
+    assert len(reader) == 15
+    assert recorded(reader, 14, playback) == states[14]
+    reader.close()
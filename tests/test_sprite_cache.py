@@ -0,0 +1,65 @@
+import pygame
+import pytest
+from sprite_cache import SpriteCache
+
+@pytest.fixture
+def image():
+    """
+    Fixture to create a source image to scale.
+    """
+    return pygame.Surface((40, 40))
+
+@pytest.fixture
+def cache():
+    """
+    Fixture to create a small SpriteCache instance.
+    """
+    return SpriteCache(max_size=2)
+
+def test_get_scales_image(cache, image):
+    """
+    Test that the cache returns a surface of the requested integer size.
+    """
+    surface = cache.get(image, "left", 20.7, 10.2)
+    assert surface.get_size() == (20, 10)
+
+def test_repeated_get_hits_cache(cache, image):
+    """
+    Test that identical requests share one surface and are counted as hits.
+    """
+    first = cache.get(image, "left", 20, 20)
+    second = cache.get(image, "left", 20.5, 20.5)
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_facing_is_part_of_key(cache, image):
+    """
+    Test that the same image and size with different facings are cached separately.
+    """
+    left = cache.get(image, "left", 20, 20)
+    right = cache.get(image, "right", 20, 20)
+    assert left is not right
+    assert cache.misses == 2
+
+def test_least_recently_used_is_evicted(cache, image):
+    """
+    Test that the least recently used surface is evicted once the cache is full.
+    """
+    small = cache.get(image, None, 10, 10)
+    cache.get(image, None, 20, 20)
+    cache.get(image, None, 10, 10)  # Mark the small sprite as recently used
+    cache.get(image, None, 30, 30)  # Evicts the 20x20 sprite
+
+    assert cache.get(image, None, 10, 10) is small
+    assert cache.stats()["size"] == 2
+    cache.get(image, None, 20, 20)
+    assert cache.misses == 4
+
+def test_clear(cache, image):
+    """
+    Test that clearing removes all surfaces and resets the counters.
+    """
+    cache.get(image, None, 10, 10)
+    cache.clear()
+    assert cache.stats() == {"size": 0, "hits": 0, "misses": 0, "hit_rate": 0.0}
@@ -0,0 +1,91 @@
+import pygame
+import pytest
+from constants import FLY_SPEED
+
+np = pytest.importorskip("numpy")
+from swarm import FlySwarm
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 500
+
+@pytest.fixture
+def swarm():
+    """
+    Fixture to create a seeded FlySwarm instance.
+    """
+    return FlySwarm(capacity=4, seed=1)
+
+def test_spawn_within_screen(swarm):
+    """
+    Test that spawned flies are placed on screen with valid movement directions.
+    """
+    swarm.spawn(1000, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    assert len(swarm) == 1000
+    assert swarm.capacity >= 1000
+    assert (swarm.x[:1000] >= 0).all() and (swarm.x[:1000] <= SCREEN_WIDTH - 30).all()
+    assert (swarm.y[:1000] >= 0).all() and (swarm.y[:1000] <= SCREEN_HEIGHT - 30).all()
+    assert ((swarm.dx[:1000] != 0) | (swarm.dy[:1000] != 0)).all()
+
+def test_special_spawn_moves_towards_center(swarm):
+    """
+    Test that special flies spawn near the center and never move further away from it.
+    """
+    swarm.spawn(1000, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0, special=True)
+    center_x = swarm.x[:1000] + 15
+    assert (swarm.x[:1000] >= SCREEN_WIDTH // 4).all() and (swarm.x[:1000] <= 3 * SCREEN_WIDTH // 4).all()
+    assert not ((center_x < SCREEN_WIDTH / 2) & (swarm.dx[:1000] < 0)).any()
+    assert not ((center_x > SCREEN_WIDTH / 2) & (swarm.dx[:1000] > 0)).any()
+
+def test_step_moves_and_clamps(swarm):
+    """
+    Test that regular flies move by their speed and stay inside the screen.
+    """
+    swarm.spawn(2, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    swarm.x[:2] = [250, 1]
+    swarm.y[:2] = [250, 250]
+    swarm.dx[:2] = [1, -1]
+    swarm.dy[:2] = [0, 0]
+
+    swarm.step(SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert swarm.x[0] == 250 + FLY_SPEED
+    assert swarm.x[1] == 0  # Clamped at the left edge
+    assert swarm.dx[1] != -1  # Bounced off the left edge
+    assert not swarm.facing_left[0]
+
+def test_special_flies_despawn_off_screen(swarm):
+    """
+    Test that special flies are removed once they leave the screen.
+    """
+    swarm.spawn(1, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0, special=True)
+    swarm.x[0] = 4 - 30
+    swarm.dx[0], swarm.dy[0] = -1, 0
+
+    assert swarm.step(SCREEN_WIDTH, SCREEN_HEIGHT) == 0  # Barely on-screen
+    assert swarm.step(SCREEN_WIDTH, SCREEN_HEIGHT) == 1  # Barely off-screen
+    assert len(swarm) == 0
+
+def test_collide_and_remove(swarm):
+    """
+    Test that flies overlapping a rectangle are found and can be removed.
+    """
+    swarm.spawn(3, SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    swarm.x[:3] = [250, 100, 270]
+    swarm.y[:3] = [250, 100, 270]
+
+    caught = swarm.collide(250.0, 250.0, 70.0, 60.0)
+    assert caught.tolist() == [True, False, True]
+
+    swarm.remove(caught)
+    assert len(swarm) == 1
+    assert swarm.x[0] == 100
+
+def test_add_fly(swarm):
+    """
+    Test that an existing Fly is copied into the swarm with its direction.
+    """
+    from fly import Fly
+    pygame.init()
+    fly = Fly(SCREEN_WIDTH, SCREEN_HEIGHT, 30.0, 30.0)
+    fly.movement = {"left": True, "right": False, "up": False, "down": True}
+    swarm.add_fly(fly)
+    assert (swarm.dx[0], swarm.dy[0]) == (-1, 1)
+    assert swarm.x[0] == fly.x
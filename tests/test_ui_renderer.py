@@ -0,0 +1,55 @@
+import pygame
+import pytest
+from game_state import GameState
+from screen_manager import ScreenManager
+from special_fly import SpecialFly
+from ui_renderer import draw_batch, draw_game_objects, fly_draw_lists
+
+@pytest.fixture
+def screen_manager():
+    """
+    Fixture to create a headless ScreenManager instance.
+    """
+    return ScreenManager(headless=True)
+
+@pytest.fixture
+def game_state(screen_manager):
+    """
+    Fixture to create a seeded GameState with a special fly.
+    """
+    game_state = GameState()
+    game_state.reset(screen_manager.width, screen_manager.height, seed=3)
+    game_state.add_fly(SpecialFly(screen_manager.width, screen_manager.height,
+                                  game_state.fly_width, game_state.fly_height))
+    return game_state
+
+def test_fly_draw_lists_group_by_type(game_state):
+    """
+    Test that flies are split into regular and special draw lists with their current positions.
+    """
+    draw_lists = fly_draw_lists(game_state)
+    assert len(draw_lists["flies"]) + len(draw_lists["special_flies"]) == len(game_state.flies)
+    assert len(draw_lists["special_flies"]) == 1
+    special = game_state.flies[-1]
+    assert draw_lists["special_flies"][0] == (special.img, (special.x, special.y))
+
+def test_draw_batch_follows_draw_order(screen_manager):
+    """
+    Test that later sprite types are drawn on top of earlier ones, whatever the dict order.
+    """
+    red = pygame.Surface((10, 10))
+    red.fill((255, 0, 0))
+    blue = pygame.Surface((10, 10))
+    blue.fill((0, 0, 255))
+    rects = draw_batch(screen_manager.screen, {"popups": [(blue, (0, 0))], "frog": [(red, (0, 0))]})
+    assert len(rects) == 2
+    assert screen_manager.screen.get_at((5, 5))[:3] == (0, 0, 255)
+
+def test_draw_game_objects_without_rects(game_state, screen_manager):
+    """
+    Test that the full-screen path can skip collecting the drawn areas.
+    """
+    start_time = pygame.time.get_ticks()
+    assert draw_game_objects(game_state, screen_manager, start_time, doreturn=False) is None
+    rects = draw_game_objects(game_state, screen_manager, start_time)
+    assert len(rects) == len(game_state.flies) + 3  # Frog, flies, score and time
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+from constants import GAME_DURATION, INITIAL_FLY_COUNT, SIMULATION_RATE
+from vector_env import ACTIONS, VectorEnv
+
+@pytest.fixture
+def env():
+    """
+    Fixture to create a seeded VectorEnv with three games.
+    """
+    env = VectorEnv(3, screen_width=800, screen_height=500, seed=0, nearest_flies=4)
+    env.reset()
+    return env
+
+def place_fly(env, index, game, x, y, special=False):
+    """
+    Moves an existing fly into a game at a given position.
+    """
+    env.swarm.env[index] = game
+    env.swarm.x[index], env.swarm.y[index] = x, y
+    env.swarm.special[index] = special
+
+def test_reset_spawns_flies_per_game(env):
+    """
+    Test that every game starts with its own initial flies and a centered frog.
+    """
+    assert len(env.swarm) == 3 * INITIAL_FLY_COUNT
+    assert np.bincount(env.swarm.env[:len(env.swarm)]).tolist() == [INITIAL_FLY_COUNT] * 3
+    assert env.frog_x.tolist() == [400.0] * 3
+    observations = env.observe()
+    assert observations["flies"].shape == (3, 4, 3)
+    assert observations["time_remaining"].tolist() == [GAME_DURATION] * 3
+
+def test_actions_move_frogs_independently(env):
+    """
+    Test that each game's frog follows its own action.
+    """
+    left, right, up = (ACTIONS.tolist().index(move) for move in ([-1, 0], [1, 0], [0, -1]))
+    env.step(np.array([left, right, up]))
+    assert env.frog_x.tolist() == [395.0, 405.0, 400.0]
+    assert env.frog_y.tolist() == [250.0, 250.0, 245.0]
+
+def test_catches_only_count_for_own_game(env):
+    """
+    Test that a fly is only caught by the frog of its own game and special flies extend the time.
+    """
+    env.swarm.remove(np.ones(len(env.swarm), dtype=np.bool_))
+    env.swarm.spawn_in(np.array([0, 1, 2]), 800, 500, 32.0, 32.0)
+    place_fly(env, 0, 0, 410, 260)
+    place_fly(env, 1, 1, 410, 260, special=True)
+    place_fly(env, 2, 2, 0, 0)
+
+    _, rewards, dones = env.step(np.zeros(3, dtype=np.int64))
+    assert rewards.tolist() == [1.0, 1.0, 0.0]
+    assert env.score.tolist() == [1, 0, 0]
+    assert env.countdown_time.tolist() == [GAME_DURATION, GAME_DURATION + 5, GAME_DURATION]
+    assert not dones.any()
+    assert env.swarm.env[:len(env.swarm)].tolist() == [2]
+
+def test_finished_games_restart(env):
+    """
+    Test that a game whose time ran out is reported as done and restarted on its own.
+    """
+    env.tick[1] = GAME_DURATION * SIMULATION_RATE - 1
+    env.score[1] = 7
+    env.frog_x[1] = 0.0
+    observations, _, dones = env.step(np.zeros(3, dtype=np.int64))
+    assert dones.tolist() == [False, True, False]
+    assert env.tick.tolist() == [1, 0, 1]
+    assert observations["score"][1] == 0
+    assert observations["frog"][1].tolist() == [400.0, 250.0]
+
+def test_seeded_runs_are_reproducible():
+    """
+    Test that two batches with the same seed and actions stay identical.
+    """
+    actions = np.random.default_rng(1).integers(0, len(ACTIONS), (200, 5))
+    runs = []
+    for _ in range(2):
+        env = VectorEnv(5, seed=3)
+        env.reset()
+        total = np.zeros(5)
+        for step_actions in actions:
+            observations, rewards, _ = env.step(step_actions)
+            total += rewards
+        runs.append((total.tolist(), observations["flies"].tolist()))
+    assert runs[0] == runs[1]
+
+def test_skipping_observations_does_not_change_the_games():
+    """
+    Test that steps without observations advance the games exactly like observed steps.
+    """
+    actions = np.random.default_rng(2).integers(0, len(ACTIONS), (100, 5))
+    observed, unobserved = VectorEnv(5, seed=4), VectorEnv(5, seed=4)
+    observed.reset()
+    unobserved.reset()
+    for step_actions in actions:
+        expected = observed.step(step_actions)
+        observations, rewards, dones = unobserved.step(step_actions, observe=False)
+        assert observations is None
+        assert rewards.tolist() == expected[1].tolist() and dones.tolist() == expected[2].tolist()
+    assert unobserved.observe()["flies"].tolist() == expected[0]["flies"].tolist()
+
+def test_obstacles_block_frogs_and_flies():
+    """
+    Test that an obstacle stops a frog on the blocked axis only and that flies bounce off it, as in GameState.
+    """
+    env = VectorEnv(2, screen_width=800, screen_height=500, seed=0, obstacle_layout=((0.5, 0.3, 0.1, 0.1),))
+    env.reset()
+    assert list(env.obstacles) == [(400.0, 150.0, 80.0, 50.0)]
+
+    # Game 0's frog moves right and up into the obstacle's left side, game 1's frog is far away
+    env.frog_x[:], env.frog_y[:] = (318.0, 0.0), (140.0, 400.0)
+    env.swarm.remove(np.ones(len(env.swarm), dtype=np.bool_))
+    env.swarm.spawn_in(np.array([1]), 800, 500, 32.0, 32.0)
+    place_fly(env, 0, 1, 367.5, 160.0)
+    env.swarm.dx[0], env.swarm.dy[0] = 1, 0
+
+    right_up = ACTIONS.tolist().index([1, -1])
+    env.step(np.array([right_up, right_up]), observe=False)
+    assert env.frog_x.tolist() == [318.0, 5.0]
+    assert env.frog_y.tolist() == [135.0, 395.0]
+    assert env.swarm.x[0] == 367.5
+
+    for _ in range(60):
+        env.step(np.zeros(2, dtype=np.int64), observe=False)
+        assert not env.obstacles.blocking(env.swarm.x[0], env.swarm.y[0], 32.0, 32.0)